@@ -0,0 +1,140 @@
+"""
+Load test for the HTTP/JSON API server.
+
+Starts the server on an ephemeral localhost port against a temporary store, then drives it
+with concurrent keep-alive connections. Each connection pipelines --depth requests before
+reading the responses. Reports requests per second and p50/p99 latency for a read-only
+phase and a mixed read/write phase.
+
+Usage:
+    python benchmarks/api_load.py [--tasks 1000] [--connections 16] [--requests 2000] [--depth 4]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+from api.server import TaskAPIServer  # noqa: E402
+from services.storage_engine import StorageSkill  # noqa: E402
+from services.task_service import TaskService  # noqa: E402
+from services.task_subagent import TaskSubagent  # noqa: E402
+
+
+def encode(method: str, path: str, payload=None) -> bytes:
+    """Build one HTTP/1.1 request."""
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    return (f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    """Read one response and return its status code."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def client(port: int, make_request, count: int, depth: int, latencies, errors) -> None:
+    """Send count requests on one connection, depth at a time."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent = 0
+    while sent < count:
+        batch = [make_request() for _ in range(min(depth, count - sent))]
+        start = time.perf_counter()
+        writer.write(b"".join(batch))
+        await writer.drain()
+        for _ in batch:
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors.append(status)
+        sent += len(batch)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_phase(name: str, port: int, make_request, args) -> None:
+    latencies, errors = [], []
+    per_client = args.requests // args.connections
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, make_request, per_client, args.depth, latencies, errors)
+                           for _ in range(args.connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{name:6s} {len(latencies):7d} req  {len(latencies) / elapsed:9.0f} req/s  "
+          f"p50 {statistics.median(latencies) * 1000:7.2f} ms  p99 {p99 * 1000:7.2f} ms  "
+          f"errors {len(errors)}")
+
+
+async def main_async(args) -> None:
+    data = os.path.join(tempfile.mkdtemp(), "tasks.json")
+    task_service = TaskService()
+    task_subagent = TaskSubagent(task_service, StorageSkill(data), notify_on_startup=False)
+    task_service.set_task_subagent(task_subagent)
+
+    api = TaskAPIServer(task_service, task_subagent)
+    server = await api.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    # Seed through the API so the store is saved the same way clients would save it
+    seed = [encode("POST", "/tasks", {"title": f"Task {i}", "tags": "work", "priority": "low"})
+            for i in range(args.tasks)]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for chunk in range(0, len(seed), 100):
+        part = seed[chunk:chunk + 100]
+        writer.write(b"".join(part))
+        await writer.drain()
+        for _ in part:
+            await read_response(reader)
+    writer.close()
+
+    rng = random.Random(42)
+
+    def read_request() -> bytes:
+        roll = rng.random()
+        if roll < 0.5:
+            return encode("GET", f"/tasks/{rng.randint(1, args.tasks)}")
+        if roll < 0.8:
+            return encode("GET", "/search?q=Task%201&fields=title")
+        return encode("GET", "/upcoming?within=60")
+
+    def mixed_request() -> bytes:
+        if rng.random() < 0.2:
+            return encode("POST", f"/tasks/{rng.randint(1, args.tasks)}/toggle")
+        return read_request()
+
+    await run_phase("read", port, read_request, args)
+    await run_phase("mixed", port, mixed_request, args)
+    await api.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks seeded before the run")
+    parser.add_argument("--connections", type=int, default=16, help="Concurrent keep-alive connections")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per phase across all connections")
+    parser.add_argument("--depth", type=int, default=4, help="Requests pipelined per round trip")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
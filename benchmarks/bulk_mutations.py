@@ -0,0 +1,86 @@
+"""
+Bulk mutation benchmark.
+
+Compares the per-item cost of the single-item TaskService API (create_task, update_task,
+toggle_task_status, delete_task) with create_many, update_many, toggle_many and delete_many
+on a store backed by a temporary file. The single-item API saves the whole store on every
+call, so it is measured on --single tasks only and its per-item cost grows with the store.
+
+Usage:
+    python benchmarks/bulk_mutations.py [--tasks 10000] [--single 1000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+from services.storage_engine import StorageSkill  # noqa: E402
+from services.task_service import TaskService  # noqa: E402
+from services.task_subagent import TaskSubagent  # noqa: E402
+
+
+def new_service() -> TaskService:
+    service = TaskService()
+    subagent = TaskSubagent(service, StorageSkill(os.path.join(tempfile.mkdtemp(), "tasks.json")),
+                            notify_on_startup=False)
+    service.set_task_subagent(subagent)
+    return service
+
+
+def items(count: int):
+    return [{'title': f"Task {index}", 'priority': ('high', 'medium', 'low')[index % 3], 'tags': ['work'],
+             'due_date': f"2030-01-{index % 28 + 1:02d} 09:00"} for index in range(count)]
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run_single(count: int) -> dict:
+    service = new_service()
+    data = items(count)
+    results = {'create': timed(lambda: [service.create_task(**item) for item in data])}
+    ids = [task.id for task in service.get_all_tasks()]
+    results['update'] = timed(lambda: [service.update_task(task_id, priority='high') for task_id in ids])
+    results['toggle'] = timed(lambda: [service.toggle_task_status(task_id) for task_id in ids])
+    results['delete'] = timed(lambda: [service.delete_task(task_id) for task_id in ids])
+    return results
+
+
+def run_bulk(count: int) -> dict:
+    service = new_service()
+    data = items(count)
+    results = {'create': timed(lambda: service.create_many(data))}
+    ids = [task.id for task in service.get_all_tasks()]
+    results['update'] = timed(lambda: service.update_many({task_id: {'priority': 'high'} for task_id in ids}))
+    results['toggle'] = timed(lambda: service.toggle_many(ids))
+    results['delete'] = timed(lambda: service.delete_many(ids))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=10000, help="Tasks for the bulk API")
+    parser.add_argument("--single", type=int, default=1000, help="Tasks for the single-item API")
+    args = parser.parse_args()
+
+    single = run_single(args.single)
+    bulk = run_bulk(args.tasks)
+    print(f"{'operation':10s} {'single us/item':>15s} {'bulk us/item':>13s} {'speedup':>8s}")
+    for operation in ('create', 'update', 'toggle', 'delete'):
+        single_us = single[operation] / args.single * 1e6
+        bulk_us = bulk[operation] / args.tasks * 1e6
+        print(f"{operation:10s} {single_us:15.1f} {bulk_us:13.1f} {single_us / bulk_us:7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
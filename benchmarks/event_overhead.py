@@ -0,0 +1,59 @@
+"""
+Event bus overhead benchmark.
+
+Measures the cost per TaskService mutation with zero, one and ten synchronous subscribers,
+and with ten queued subscribers, on an in-memory service (no storage) so the bus itself is
+what is measured. Each subscriber does the minimum work of reading the event's task ID.
+
+Usage:
+    python benchmarks/event_overhead.py [--tasks 2000] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.task_service import TaskService  # noqa: E402
+
+
+def measure(subscribers: int, queued: bool, tasks: int) -> float:
+    """Return the mean microseconds per update/toggle with the given subscribers."""
+    service = TaskService()
+    seen = []
+    for _ in range(subscribers):
+        service.events.subscribe(lambda event: seen.append(event.task_id), queued=queued)
+    ids = [task.id for task in service.create_many({'title': f"Task {i}"} for i in range(tasks))]
+
+    start = time.perf_counter()
+    for task_id in ids:
+        service.update_task(task_id, priority='high')
+        service.toggle_task_status(task_id)
+    elapsed = time.perf_counter() - start
+    service.events.drain()
+    expected = 2 * tasks * subscribers
+    if len(seen) < expected:
+        print(f"  note: {expected - len(seen)} events not delivered (queue full)")
+    return elapsed / (2 * tasks) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=2000, help="Tasks mutated per round")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per configuration; the median is reported")
+    args = parser.parse_args()
+
+    configurations = [("no subscribers", 0, False), ("1 sync", 1, False), ("10 sync", 10, False),
+                      ("10 queued", 10, True)]
+    baseline = None
+    for label, subscribers, queued in configurations:
+        median_us = statistics.median(measure(subscribers, queued, args.tasks) for _ in range(args.rounds))
+        baseline = baseline or median_us
+        print(f"{label:16s} {median_us:8.2f} us/mutation  (+{median_us - baseline:6.2f} us)")
+
+
+if __name__ == "__main__":
+    main()
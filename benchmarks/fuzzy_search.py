@@ -0,0 +1,117 @@
+"""
+Fuzzy search benchmark.
+
+Compares a plain SequenceMatcher scan with the pruned skills.search_logic.fuzzy_search on
+--items records, and with FuzzyIndex lookups over a vocabulary of --words distinct words, for a
+few misspelled queries and thresholds. Every pruned result is checked against the scan.
+
+Usage:
+    python benchmarks/fuzzy_search.py [--items 20000] [--words 50000] [--rounds 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+from difflib import SequenceMatcher
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from skills.search_logic import fuzzy_search  # noqa: E402
+from services.search_logic import FuzzyIndex  # noqa: E402
+
+THRESHOLDS = (0.6, 0.75, 0.9)
+
+
+def make_words(count: int, rng: random.Random):
+    """Return count distinct random lowercase words of 3 to 12 letters."""
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 12))))
+    return sorted(words)
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """Swap two neighbouring letters of a word, or drop one if it is too short."""
+    if len(word) < 4:
+        return word[1:]
+    position = rng.randrange(len(word) - 1)
+    return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+
+
+def scan(data_list, key, value, threshold):
+    """The fuzzy_search baseline: one SequenceMatcher ratio per item."""
+    value_lower = value.lower()
+    return [item for item in data_list
+            if SequenceMatcher(None, value_lower, str(item.get(key, "")).lower()).ratio() >= threshold]
+
+
+def scan_words(words, query, threshold):
+    matches = []
+    for word in words:
+        ratio = SequenceMatcher(None, query, word).ratio()
+        if ratio >= threshold:
+            matches.append((word, ratio))
+    return matches
+
+
+def median_ms(function, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=20000, help="Records searched by fuzzy_search")
+    parser.add_argument("--words", type=int, default=50000, help="Distinct words in the FuzzyIndex")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per measurement; the median is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = make_words(args.words, rng)
+    # Titles repeat, as real values do (statuses, tags, common titles)
+    titles = [" ".join(rng.sample(words[:2000], rng.randint(1, 2))) for _ in range(args.items // 4)]
+    items = [{'id': item_id, 'title': rng.choice(titles)} for item_id in range(args.items)]
+    queries = [misspell(rng.choice(titles), rng) for _ in range(3)]
+
+    print(f"fuzzy_search over {args.items} items")
+    print(f"{'threshold':>9s} {'scan ms':>10s} {'pruned ms':>10s} {'speedup':>8s}")
+    for threshold in THRESHOLDS:
+        for query in queries:
+            if fuzzy_search(items, 'title', query, threshold) != scan(items, 'title', query, threshold):
+                raise SystemExit(f"fuzzy_search results for {query!r} at {threshold} differ from the scan")
+        before = median_ms(lambda: [scan(items, 'title', query, threshold) for query in queries], args.rounds)
+        after = median_ms(lambda: [fuzzy_search(items, 'title', query, threshold) for query in queries], args.rounds)
+        print(f"{threshold:9.2f} {before:10.1f} {after:10.1f} {before / after:7.1f}x")
+
+    index = FuzzyIndex()
+    start = time.perf_counter()
+    for number, word in enumerate(words):
+        index.set_document(number, [word])
+    build = (time.perf_counter() - start) * 1000
+    lookups = [misspell(rng.choice(words), rng) for _ in range(3)]
+
+    print(f"\nFuzzyIndex over {args.words} words (built in {build:.0f} ms)")
+    print(f"{'threshold':>9s} {'scan ms':>10s} {'index ms':>10s} {'speedup':>8s}")
+    for threshold in THRESHOLDS:
+        for query in lookups:
+            expected = sorted(scan_words(words, query, threshold))
+            if sorted(index.lookup(query, threshold)) != expected:
+                raise SystemExit(f"FuzzyIndex results for {query!r} at {threshold} differ from the scan")
+        before = median_ms(lambda: [scan_words(words, query, threshold) for query in lookups], args.rounds)
+        after = median_ms(lambda: [index.lookup(query, threshold) for query in lookups], args.rounds)
+        print(f"{threshold:9.2f} {before:10.1f} {after:10.1f} {before / after:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Metrics overhead benchmark.
+
+Times instrumented operations with metrics off and on: a bare timed() block, create_task on
+an in-memory service (where only the validation timer fires), and find_tasks and
+get_ordered_tasks on a loaded store of --tasks tasks.
+
+Usage:
+    python benchmarks/metrics_overhead.py [--tasks 2000] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+from run_benchmarks import build_store  # noqa: E402
+from services import metrics  # noqa: E402
+from services.task_service import TaskService  # noqa: E402
+
+
+def per_call_us(function, calls: int, rounds: int) -> float:
+    """Return the median over rounds of the mean microseconds per call."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        samples.append((time.perf_counter() - start) / calls * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=2000, help="Tasks in the store searched and sorted")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per measurement; the median is reported")
+    args = parser.parse_args()
+
+    def bare_timer():
+        with metrics.timed('todo_search_seconds'):
+            pass
+
+    memory_service = TaskService()
+    with tempfile.TemporaryDirectory() as directory:
+        _, subagent, _ = build_store(args.tasks, directory)
+        operations = [
+            ("timed() block", bare_timer, 100000),
+            ("create_task", lambda: memory_service.create_task("Task", priority="high"), 5000),
+            ("find_tasks", lambda: subagent.find_tasks("report"), 20),
+            ("get_ordered_tasks", lambda: subagent.get_ordered_tasks("priority"), 20),
+        ]
+        print(f"{'operation':20s} {'off us':>10s} {'on us':>10s} {'overhead':>10s}")
+        for label, function, calls in operations:
+            metrics.enable(False)
+            off = per_call_us(function, calls, args.rounds)
+            metrics.enable(True)
+            on = per_call_us(function, calls, args.rounds)
+            print(f"{label:20s} {off:10.3f} {on:10.3f} {on - off:+10.3f}")
+        metrics.enable(False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Multi-process harness for the shared task store.
+
+Starts several worker processes, each with its own TaskService and StorageSkill on one file,
+as the interactive app, the reminder service and scripts do, and several threads in each
+process sharing that store, as the API server and the dashboard do. Each thread creates tasks,
+edits only tasks it created, toggles some and deletes some, with random pauses so saves
+interleave. Afterwards the file is checked for lost updates: every surviving task a thread
+created is present exactly once with that thread's last edit, deleted tasks are gone, IDs are
+unique and the stored next_id is above every ID. Threads also check that the ID returned by
+every create points at the task they created, even when a save renumbered it because another
+process created a task with the same ID, and that their tasks never vanish from memory.
+
+Two forced cases run first: two processes creating the same ID, and a thread creating a task
+while another thread's save is merging with another process's write. Exits non-zero on any
+violation.
+
+Usage:
+    python benchmarks/multiprocess_store.py [--processes 4] [--threads 3] [--operations 60]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+
+def create_after_other_process(path: str, ready, created, results) -> None:
+    """Load the empty store, let another process create task 1, then create a task here too."""
+    from services.storage_engine import StorageSkill
+    from services.task_service import TaskService
+    from services.task_subagent import TaskSubagent
+
+    service = TaskService()
+    subagent = TaskSubagent(service, StorageSkill(path), notify_on_startup=False)
+    service.set_task_subagent(subagent)
+    ready.set()
+    created.wait()
+    task = service.create_task("from A")
+    stored = service.get_task(task.id)
+    results.put((task.id, stored.title if stored else None))
+
+
+def check_renumbered_create() -> list:
+    """Both processes create ID 1; the one saving second must get its task's new ID back."""
+    from services.storage_engine import StorageSkill
+    from services.task_service import TaskService
+    from services.task_subagent import TaskSubagent
+
+    path = os.path.join(tempfile.mkdtemp(), "tasks.json")
+    ready, created, results = multiprocessing.Event(), multiprocessing.Event(), multiprocessing.Queue()
+    process = multiprocessing.Process(target=create_after_other_process, args=(path, ready, created, results))
+    process.start()
+    ready.wait()
+    service = TaskService()
+    subagent = TaskSubagent(service, StorageSkill(path), notify_on_startup=False)
+    service.set_task_subagent(subagent)
+    service.create_task("from B")
+    created.set()
+    task_id, title = results.get()
+    process.join()
+    if title != "from A":
+        return [f"create after another process's create returned ID {task_id}, which holds {title!r}"]
+    return []
+
+
+def create_in_other_process(path: str) -> None:
+    """Create one task from a separate process."""
+    from services.storage_engine import StorageSkill
+    from services.task_service import TaskService
+    from services.task_subagent import TaskSubagent
+
+    service = TaskService()
+    service.set_task_subagent(TaskSubagent(service, StorageSkill(path), notify_on_startup=False))
+    service.create_task("from other")
+
+
+def check_create_during_merge() -> list:
+    """A task another thread creates while a save merges must survive in memory and on disk."""
+    from services.storage_engine import StorageSkill
+    from services.task_service import TaskService
+    from services.task_subagent import TaskSubagent
+
+    class PausingStorage(StorageSkill):
+        """Storage that runs a callback in the middle of the next merge."""
+        during_merge = None
+
+        def _merge(self, mine, theirs, next_id):
+            result = super()._merge(mine, theirs, next_id)
+            callback, self.during_merge = self.during_merge, None
+            if callback:
+                callback()
+            return result
+
+    path = os.path.join(tempfile.mkdtemp(), "tasks.json")
+    service = TaskService()
+    storage = PausingStorage(path)
+    subagent = TaskSubagent(service, storage, notify_on_startup=False)
+    service.set_task_subagent(subagent)
+    process = multiprocessing.Process(target=create_in_other_process, args=(path,))
+    process.start()
+    process.join()
+
+    created, threads = [], []
+
+    def create_from_thread():
+        # The thread's own save waits for the merging save, so only wait for its task in memory
+        thread = threading.Thread(target=lambda: created.append(service.create_task("from thread")))
+        thread.start()
+        threads.append(thread)
+        while not any(task.title == "from thread" for task in service.get_all_tasks()):
+            time.sleep(0.001)
+
+    storage.during_merge = create_from_thread
+    service.create_task("from A")
+    for thread in threads:
+        thread.join()
+    service.create_task("after")  # One more save from memory
+
+    failures = []
+    titles = {"from other", "from A", "from thread", "after"}
+    in_memory = sorted(task.title for task in service.get_all_tasks())
+    with open(path, encoding='utf-8') as file:
+        on_disk = sorted(task['title'] for task in json.load(file)['tasks'])
+    if in_memory != sorted(titles):
+        failures.append(f"create during merge: memory holds {in_memory}")
+    if on_disk != sorted(titles):
+        failures.append(f"create during merge: file holds {on_disk}")
+    stored = service.get_task(created[0].id) if created else None
+    if stored is None or stored.title != "from thread":
+        failures.append(f"create during merge: thread's create returned an ID holding "
+                        f"{stored.title if stored else None!r}")
+    return failures
+
+
+def run_thread(label: str, service, subagent, operations: int, seed: int) -> tuple:
+    """Create, edit, toggle and delete this thread's own tasks; return the expected final state."""
+    rng = random.Random(seed)
+
+    # Expected final state of this thread's tasks, keyed by a unique title prefix
+    expected = {}
+    deleted = set()
+    problems = []
+    for step in range(operations):
+        # Pick up other workers' saves now and then, like the dashboard and daemon do
+        if rng.random() < 0.3:
+            subagent.reload_tasks_from_storage()
+
+        mine = [task for task in service.get_all_tasks() if task.title.startswith(f"{label}-")]
+        if len(mine) != len(expected):
+            problems.append(f"{label} step {step}: {len(mine)} of its {len(expected)} tasks in memory")
+        roll = rng.random()
+        if roll < 0.5 or not mine:
+            key = f"{label}-{step}"
+            task = service.create_task(key, description="v0")
+            stored = service.get_task(task.id)
+            if stored is None or stored.title != key:
+                problems.append(f"{key}: create returned ID {task.id}, which holds "
+                                f"{stored.title if stored else None!r}")
+            expected[key] = {'description': "v0", 'completed': False}
+        elif roll < 0.75:
+            task = rng.choice(mine)
+            if service.update_task(task.id, description=f"v{step}"):
+                expected[task.title]['description'] = f"v{step}"
+        elif roll < 0.9:
+            task = rng.choice(mine)
+            if service.toggle_task_status(task.id):
+                expected[task.title]['completed'] = not expected[task.title]['completed']
+        else:
+            task = rng.choice(mine)
+            if service.delete_task(task.id):
+                deleted.add(task.title)
+                expected.pop(task.title)
+        time.sleep(rng.random() * 0.005)
+    return label, expected, sorted(deleted), problems
+
+
+def worker(worker_id: int, path: str, threads: int, operations: int, results) -> None:
+    """Run several threads on one store in this process and report each thread's expected state."""
+    from services.storage_engine import StorageSkill
+    from services.task_service import TaskService
+    from services.task_subagent import TaskSubagent
+
+    service = TaskService()
+    subagent = TaskSubagent(service, StorageSkill(path), notify_on_startup=False)
+    service.set_task_subagent(subagent)
+
+    reports = []
+
+    def run(index):
+        reports.append(run_thread(f"w{worker_id}t{index}", service, subagent, operations,
+                                  worker_id * 1000 + index))
+
+    pool = [threading.Thread(target=run, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    results.put(reports)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=4, help="Worker processes sharing the file")
+    parser.add_argument("--threads", type=int, default=3, help="Threads sharing the store in each process")
+    parser.add_argument("--operations", type=int, default=60, help="Operations per thread")
+    args = parser.parse_args()
+
+    failures = check_renumbered_create() + check_create_during_merge()
+
+    path = os.path.join(tempfile.mkdtemp(), "tasks.json")
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=worker, args=(index, path, args.threads, args.operations, results))
+                 for index in range(args.processes)]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    reports = [report for _ in processes for report in results.get()]
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    with open(path, encoding='utf-8') as file:
+        stored = json.load(file)
+    tasks = stored['tasks']
+    by_title = {}
+    for task in tasks:
+        by_title.setdefault(task['title'], []).append(task)
+
+    ids = [task['id'] for task in tasks]
+    if len(ids) != len(set(ids)):
+        failures.append("duplicate IDs in the store")
+    if ids and stored['next_id'] <= max(ids):
+        failures.append(f"next_id {stored['next_id']} not above highest ID {max(ids)}")
+
+    expected_total = 0
+    for label, expected, deleted, problems in reports:
+        expected_total += len(expected)
+        failures.extend(problems)
+        for title, state in expected.items():
+            found = by_title.get(title, [])
+            if len(found) != 1:
+                failures.append(f"{title}: found {len(found)} copies, expected 1")
+                continue
+            task = found[0]
+            if task['description'] != state['description'] or task['completed'] != state['completed']:
+                failures.append(f"{title}: lost update, stored {task['description']}/{task['completed']}, "
+                                f"expected {state['description']}/{state['completed']}")
+        for title in deleted:
+            if title in by_title:
+                failures.append(f"{title}: deleted task came back")
+
+    operations = args.processes * args.threads * args.operations
+    print(f"{args.processes} processes x {args.threads} threads  {operations} operations  {operations / elapsed:.0f} ops/s  "
+          f"version {stored['version']}  {len(tasks)} tasks (expected {expected_total})")
+    for failure in failures[:20]:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
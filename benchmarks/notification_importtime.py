@@ -0,0 +1,78 @@
+"""
+Notification startup benchmark.
+
+Compares constructing NotificationSkill the way TaskSubagent and BackgroundReminderService do
+on every launch (lazy: no backend lookup) against resolving the desktop backend up front
+(eager: what NotificationSkill.__init__ used to do), using ``python -X importtime``.
+
+Usage:
+    python benchmarks/notification_importtime.py [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+LAZY = (
+    "from services.notification_engine import NotificationSkill\n"
+    "NotificationSkill()\n"
+    "NotificationSkill()\n"
+)
+EAGER = LAZY + (
+    "from services.notification_sinks import resolve_desktop_library\n"
+    "resolve_desktop_library()\n"
+)
+
+
+def parse_importtime(stderr: str):
+    """Return (total top-level cumulative microseconds, imported module names)."""
+    total = 0
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        modules.append(name.strip())
+        # Nested imports are indented by two extra spaces per level
+        if not name.startswith("  "):
+            total += int(cumulative_us)
+    return total, modules
+
+
+def run(snippet: str):
+    """Run the snippet in a fresh interpreter and return (wall seconds, import µs, modules)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", snippet],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True,
+    )
+    wall = time.perf_counter() - start
+    total, modules = parse_importtime(result.stderr)
+    return wall, total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Interpreter launches per variant")
+    args = parser.parse_args()
+
+    for label, snippet in (("lazy", LAZY), ("eager", EAGER)):
+        walls, imports = [], []
+        modules = []
+        for _ in range(args.runs):
+            wall, total, modules = run(snippet)
+            walls.append(wall * 1000)
+            imports.append(total / 1000)
+        backends = sorted({name.split(".")[0] for name in modules} & {"plyer", "win10toast"})
+        print(f"{label:>5}: wall {statistics.median(walls):7.1f} ms  "
+              f"imports {statistics.median(imports):7.1f} ms  "
+              f"modules {len(modules):4d}  probed {', '.join(backends) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
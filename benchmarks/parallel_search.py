@@ -0,0 +1,78 @@
+"""
+Parallel search scaling benchmark.
+
+Builds a store of --tasks tasks and times keyword searches serially (find_tasks without a pool)
+and with ParallelSearcher at 1, 2, 4 and 8 workers. For each worker count the first query,
+which writes the snapshot and loads the shards, is reported separately from the median of the
+following queries. Every parallel result is checked against the serial one.
+
+Usage:
+    python benchmarks/parallel_search.py [--tasks 200000] [--workers 1,2,4,8] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+from run_benchmarks import build_store, parse_sizes  # noqa: E402
+from services.parallel_search import ParallelSearcher  # noqa: E402
+
+QUERIES = ("report", "invoice 1", "zzz-no-match", "work")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=200000, help="Tasks in the store")
+    parser.add_argument("--workers", type=parse_sizes, default=[1, 2, 4, 8], help="Comma-separated worker counts")
+    parser.add_argument("--rounds", type=int, default=5, help="Queries timed after the first one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        service, subagent, _ = build_store(args.tasks, directory)
+        fields = ['title', 'description', 'tags', 'due_date']
+
+        def serial_ids(keyword):
+            return [task.id for task in subagent.find_tasks(keyword)]
+
+        expected = {keyword: serial_ids(keyword) for keyword in QUERIES}
+        samples = []
+        for round_number in range(args.rounds):
+            keyword = QUERIES[round_number % len(QUERIES)]
+            start = time.perf_counter()
+            serial_ids(keyword)
+            samples.append(time.perf_counter() - start)
+        serial = statistics.median(samples)
+        print(f"{args.tasks} tasks, {os.cpu_count()} CPUs")
+        print(f"{'mode':12s} {'first query ms':>15s} {'median ms':>10s} {'speedup':>8s}")
+        print(f"{'serial':12s} {'':>15s} {serial * 1000:10.1f} {1.0:7.2f}x")
+
+        for workers in args.workers:
+            searcher = ParallelSearcher(workers, min_tasks=0)
+            try:
+                start = time.perf_counter()
+                searcher.search(service, QUERIES[0], fields)
+                first = time.perf_counter() - start
+                samples = []
+                for round_number in range(args.rounds):
+                    keyword = QUERIES[round_number % len(QUERIES)]
+                    start = time.perf_counter()
+                    ids = searcher.search(service, keyword, fields)
+                    samples.append(time.perf_counter() - start)
+                    if ids != expected[keyword]:
+                        raise SystemExit(f"{workers} workers: results for {keyword!r} differ from the serial search")
+            finally:
+                searcher.close()
+            median = statistics.median(samples)
+            print(f"{f'{workers} workers':12s} {first * 1000:15.1f} {median * 1000:10.1f} {serial / median:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
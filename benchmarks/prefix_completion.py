@@ -0,0 +1,89 @@
+"""
+Prefix completion benchmark.
+
+Builds a store of --tasks tasks and times TaskSubagent.complete (sorted-array prefix index)
+against scanning every title and tag, for prefixes of increasing length, plus the cost of
+keeping the index up to date when titles change. Every completion is checked against the scan.
+
+Usage:
+    python benchmarks/prefix_completion.py [--tasks 100000] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import replace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+from run_benchmarks import build_store  # noqa: E402
+
+PREFIXES = ("r", "re", "rep", "report r", "zzz")
+LIMIT = 20
+
+
+def median_us(function, rounds: int, calls: int = 1) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        samples.append((time.perf_counter() - start) / calls)
+    return statistics.median(samples) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100000, help="Tasks in the store")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per measurement; the median is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        service, subagent, _ = build_store(args.tasks, directory)
+
+        def scan(prefix):
+            prefix = prefix.lower()
+            seen = {}
+            for task in service.get_all_tasks():
+                for entry in subagent.task_completions(task):
+                    if entry and entry.lower().startswith(prefix):
+                        seen.setdefault(entry.lower(), entry)
+            return [seen[key] for key in sorted(seen)][:LIMIT]
+
+        start = time.perf_counter()
+        subagent.complete("")
+        print(f"{args.tasks} tasks; index built in {(time.perf_counter() - start) * 1000:.0f} ms "
+              f"({len(subagent.prefix_index)} distinct titles and tags)")
+
+        print(f"{'prefix':10s} {'index us':>10s} {'scan us':>12s}")
+        for prefix in PREFIXES:
+            if subagent.complete(prefix, LIMIT) != scan(prefix):
+                raise SystemExit(f"Completions for {prefix!r} differ from the scan")
+            indexed = median_us(lambda: subagent.complete(prefix, LIMIT), args.rounds, 1000)
+            scanned = median_us(lambda: scan(prefix), args.rounds)
+            print(f"{prefix!r:10s} {indexed:10.1f} {scanned:12.0f}")
+
+        # Index upkeep when titles change, as done for every created or updated task; alternating
+        # between two titles makes every call a real change
+        tasks = service.get_all_tasks()[:1000]
+        renames = [replace(task, title=f"Renamed {task.id} {version}") for version in (1, 2) for task in tasks]
+
+        def rename_all():
+            for task in renames:
+                subagent.task_changed(task)
+
+        subagent.prefix_index, prefix_index = None, subagent.prefix_index
+        without = median_us(rename_all, args.rounds) / len(renames)
+        subagent.prefix_index = prefix_index
+        with_index = median_us(rename_all, args.rounds) / len(renames)
+        print(f"index upkeep per changed task: {without:.1f} us without the prefix index, {with_index:.1f} us with it")
+
+
+if __name__ == "__main__":
+    main()
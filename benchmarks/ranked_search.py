@@ -0,0 +1,66 @@
+"""
+Ranked search benchmark.
+
+Builds a store of --tasks tasks and times find_tasks_ranked (BM25 with a top-k heap) against
+scoring every match and sorting, and against the unranked find_tasks. The first ranked query,
+which builds the inverted index, is reported separately. Every top-k result is checked against
+the head of the fully sorted ranking.
+
+Usage:
+    python benchmarks/ranked_search.py [--tasks 100000] [--limit 20] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+from run_benchmarks import build_store  # noqa: E402
+
+QUERIES = ("report", "invoice budget", "meeting plan review", "zzz")
+
+
+def median_ms(function, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100000, help="Tasks in the store")
+    parser.add_argument("--limit", type=int, default=20, help="Results returned by the ranked search")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per measurement; the median is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        _, subagent, _ = build_store(args.tasks, directory)
+        start = time.perf_counter()
+        subagent.find_tasks_ranked(QUERIES[0], args.limit)
+        print(f"{args.tasks} tasks; first ranked query (builds the index): "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+        print(f"{'query':22s} {'matches':>8s} {'top-k ms':>9s} {'sort all ms':>12s} {'find_tasks ms':>14s}")
+        for query in QUERIES:
+            everything = subagent.find_tasks_ranked(query, None)
+            top = subagent.find_tasks_ranked(query, args.limit)
+            if [task.id for task, _ in top] != [task.id for task, _ in everything[:args.limit]]:
+                raise SystemExit(f"Top {args.limit} for {query!r} differ from the sorted ranking")
+            heap = median_ms(lambda: subagent.find_tasks_ranked(query, args.limit), args.rounds)
+            full = median_ms(lambda: subagent.find_tasks_ranked(query, None), args.rounds)
+            unranked = median_ms(lambda: subagent.find_tasks(query), args.rounds)
+            print(f"{query:22s} {len(everything):8d} {heap:9.1f} {full:12.1f} {unranked:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Benchmark regression gate.
+
+Runs the benchmark suite (or reads a report written by run_benchmarks.py) and compares every
+result with the committed baseline in benchmarks/baseline.json. A benchmark regresses when its
+median is slower than the baseline median by more than its tolerance plus a noise allowance of
+a few MADs (median absolute deviations) of the two runs. Suspected regressions are run again
+(twice by default) and the fastest run counts, so a noisy run does not fail the gate. Any regression
+that remains makes the command exit with status 1 after printing a table of baseline and
+current timings.
+
+Timings shift between processes (allocator, cache and disk state) far more than between the
+rounds of one run, so every run of the suite, reruns included, happens in a fresh process. The
+baseline is recorded from several runs (--runs, 7 by default): each result keeps the median of
+the per-run medians, its MAD is the larger of the typical in-run MAD and the MAD of the run
+medians, and its spread is how far the slowest run median lies above the combined median. Some
+benchmarks are bimodal between processes, so the noise allowance is never less than that spread.
+
+Tolerances are stored in the baseline file by benchmark name (without the size), with a default
+for the rest. Timings only compare on the same machine; refresh the baseline with --update when
+the hardware changes or a slowdown is intended.
+
+Usage:
+    python benchmarks/regression_gate.py [--only find,save] [--rounds 7]
+    python benchmarks/regression_gate.py --current results.json
+    python benchmarks/regression_gate.py --update [--runs 7]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from run_benchmarks import parse_sizes
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+
+DEFAULT_TOLERANCES = {
+    'default': 0.25,
+    # Single-item mutations and saves write a file and are at the mercy of the disk
+    'create_task': 0.3,
+    'update_task': 0.3,
+    'toggle_task_status': 0.3,
+    'delete_task': 0.3,
+    'save_tasks_to_storage': 0.3,
+}
+
+NOISE_MADS = 3.0  # MADs of slack on top of the tolerance
+MIN_DELTA_S = 0.0001  # Differences below this are never reported as regressions
+
+
+def benchmark_name(key: str) -> str:
+    """Return the benchmark name of a result key such as 'find_tasks[1000]'."""
+    return key.split("[", 1)[0]
+
+
+def run_in_process(sizes, rounds: int, only=None) -> dict:
+    """Run the suite once in a fresh Python process and return its report."""
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "results.json")
+        command = [sys.executable, os.path.join(BENCHMARKS_DIR, "run_benchmarks.py"),
+                   "--sizes", ",".join(str(size) for size in sizes), "--rounds", str(rounds), "--output", output]
+        if only:
+            command += ["--only", ",".join(only)]
+        subprocess.run(command, check=True)
+        with open(output, encoding="utf-8") as file:
+            return json.load(file)
+
+
+def combine(reports: list) -> dict:
+    """
+    Combine reports of independent runs into one.
+
+    Each result gets the median of the run medians, as its MAD the larger of the median in-run
+    MAD and the MAD of the run medians, and as its spread the slowest run median minus the median.
+    """
+    results = {}
+    for key in reports[0]['results']:
+        summaries = [report['results'][key] for report in reports if key in report['results']]
+        medians = [summary['median_s'] for summary in summaries]
+        median = statistics.median(medians)
+        results[key] = {
+            'median_s': median,
+            'mad_s': max(statistics.median(summary['mad_s'] for summary in summaries),
+                         statistics.median(abs(value - median) for value in medians)),
+            'spread_s': max(medians) - median,
+            'min_s': min(summary['min_s'] for summary in summaries),
+            'rounds': sum(summary['rounds'] for summary in summaries),
+            'runs': len(summaries),
+        }
+    return dict(reports[0], meta=dict(reports[0]['meta'], runs=len(reports)), results=results)
+
+
+def run_independent(sizes, rounds: int, only, runs: int) -> dict:
+    """Run the suite runs times, each in its own process, and combine the reports."""
+    reports = []
+    for run in range(runs):
+        if runs > 1:
+            print(f"Run {run + 1} of {runs}", file=sys.stderr, flush=True)
+        reports.append(run_in_process(sizes, rounds, only))
+    return reports[0] if runs == 1 else combine(reports)
+
+
+def compare(baseline: dict, current: dict) -> list:
+    """
+    Compare two reports.
+
+    Returns:
+        One row per result key: (key, baseline summary or None, current summary or None,
+        allowed median in seconds or None, status), status being 'ok', 'faster', 'REGRESSED',
+        'new' or 'missing'
+    """
+    tolerances = baseline.get('tolerances', DEFAULT_TOLERANCES)
+    rows = []
+    for key in sorted(baseline['results'].keys() | current['results'].keys()):
+        before, after = baseline['results'].get(key), current['results'].get(key)
+        if before is None or after is None:
+            rows.append((key, before, after, None, 'new' if before is None else 'missing'))
+            continue
+        tolerance = tolerances.get(benchmark_name(key), tolerances.get('default', DEFAULT_TOLERANCES['default']))
+        noise = max(NOISE_MADS * max(before['mad_s'], after['mad_s']), before.get('spread_s', 0.0))
+        allowed = before['median_s'] * (1 + tolerance) + max(noise, MIN_DELTA_S)
+        if after['median_s'] > allowed:
+            status = 'REGRESSED'
+        elif after['median_s'] < before['median_s'] * (1 - tolerance) - noise:
+            status = 'faster'
+        else:
+            status = 'ok'
+        rows.append((key, before, after, allowed, status))
+    return rows
+
+
+def confirm(rows, current: dict, rounds: int) -> dict:
+    """Rerun regressed benchmarks in a fresh process and keep the faster of the two results for each."""
+    results = dict(current['results'])
+    for key, _, _, _, status in rows:
+        if status != 'REGRESSED':
+            continue
+        size = int(key.split("[", 1)[1].rstrip("]"))
+        rerun = run_in_process([size], rounds, [benchmark_name(key)])['results'].get(key)
+        if rerun and rerun['median_s'] < results[key]['median_s']:
+            results[key] = rerun
+    return dict(current, results=results)
+
+
+def print_rows(rows) -> None:
+    def ms(summary):
+        return f"{summary['median_s'] * 1000:10.3f}" if summary else f"{'-':>10s}"
+
+    print(f"{'benchmark':40s} {'base ms':>10s} {'now ms':>10s} {'change':>8s} {'limit ms':>10s}  status")
+    for key, before, after, allowed, status in rows:
+        change = f"{(after['median_s'] / before['median_s'] - 1) * 100:+7.1f}%" if before and after else f"{'':8s}"
+        limit = f"{allowed * 1000:10.3f}" if allowed is not None else f"{'-':>10s}"
+        print(f"{key:40s} {ms(before)} {ms(after)} {change} {limit}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline report (default: benchmarks/baseline.json)")
+    parser.add_argument("--current", help="Compare this report instead of running the suite")
+    parser.add_argument("--sizes", type=parse_sizes, help="Store sizes (default: the baseline's sizes)")
+    parser.add_argument("--rounds", type=int, help="Timed rounds per benchmark (default: the baseline's rounds)")
+    parser.add_argument("--only", type=lambda value: value.split(","),
+                        help="Comma-separated substrings; run and compare only matching benchmarks")
+    parser.add_argument("--retries", type=int, default=2, help="Reruns of suspected regressions (default: 2)")
+    parser.add_argument("--runs", type=int,
+                        help="Independent runs of the suite to combine (default: 7 with --update, otherwise 1)")
+    parser.add_argument("--update", action="store_true", help="Run the suite and write the result as the new baseline")
+    args = parser.parse_args()
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    elif not args.update:
+        print(f"No baseline at {args.baseline}; create one with --update")
+        sys.exit(2)
+
+    meta = baseline['meta'] if baseline else {}
+    sizes = args.sizes or meta.get('sizes') or [1000, 10000]
+    rounds = args.rounds or meta.get('rounds') or 5
+
+    if args.current:
+        with open(args.current, encoding="utf-8") as file:
+            current = json.load(file)
+    else:
+        current = run_independent(sizes, rounds, args.only, args.runs or (7 if args.update else 1))
+
+    if args.update:
+        # Tolerances tuned in the baseline file are kept; benchmarks without one get the default
+        current['tolerances'] = dict(DEFAULT_TOLERANCES, **(baseline.get('tolerances', {}) if baseline else {}))
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            file.write(json.dumps(current, indent=2) + "\n")
+        print(f"Wrote baseline with {len(current['results'])} results to {args.baseline}")
+        return
+
+    if args.only:
+        baseline = dict(baseline, results={key: value for key, value in baseline['results'].items()
+                                           if any(part in key for part in args.only)})
+    if args.sizes:
+        baseline = dict(baseline, results={key: value for key, value in baseline['results'].items()
+                                           if any(key.endswith(f"[{size}]") for size in args.sizes)})
+
+    rows = compare(baseline, current)
+    for _ in range(0 if args.current else args.retries):
+        if not any(row[4] == 'REGRESSED' for row in rows):
+            break
+        print("Rerunning suspected regressions...", file=sys.stderr)
+        current = confirm(rows, current, rounds)
+        rows = compare(baseline, current)
+    print_rows(rows)
+    regressed = [key for key, _, _, _, status in rows if status == 'REGRESSED']
+    if regressed:
+        print(f"\n{len(regressed)} benchmark(s) regressed: {', '.join(regressed)}")
+        sys.exit(1)
+    print(f"\nNo regressions ({len(rows)} results compared with {os.path.basename(args.baseline)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Benchmark suite for the task store hot paths.
+
+Builds synthetic stores of 1k, 10k and 100k tasks (1M with --include-1m) and times:
+create/update/toggle/delete through the single-item TaskService API, find_tasks,
+get_ordered_tasks, get_upcoming_deadlines, load_tasks_from_storage, save_tasks_to_storage
+and DisplaySubagent.display_tasks to a null console.
+
+Each benchmark runs several rounds. The median, the median absolute deviation (MAD) and the
+minimum are reported in seconds and written as JSON, so two runs can be compared (see
+benchmarks/regression_gate.py).
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 1000,10000] [--rounds 5] [--only find] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+from services.storage_engine import StorageSkill  # noqa: E402
+from services.task_service import TaskService  # noqa: E402
+from services.task_subagent import TaskSubagent  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+LARGE_SIZE = 1000000
+
+WORDS = ("report", "review", "invoice", "groceries", "meeting", "plan", "call", "budget", "garden",
+         "laundry", "email", "draft", "deploy", "book", "dentist", "taxes", "clean", "fix", "order")
+
+
+def make_dataset(size: int, seed: int = 0):
+    """Return stored task dictionaries with a fixed mix of priorities, tags, due dates and recurrence."""
+    rng = random.Random(seed)
+    today = date.today()
+    created = datetime.now().isoformat()
+    tasks = []
+    for task_id in range(1, size + 1):
+        due_date, due_at = None, None
+        roll = rng.random()
+        if roll < 0.4:
+            due_date = (today + timedelta(days=rng.randint(-10, 60))).isoformat()
+        elif roll < 0.6:
+            moment = datetime.now() + timedelta(minutes=rng.randint(-600, 60 * 24 * 30))
+            due_at = int(moment.timestamp())
+            due_date = moment.date().isoformat()
+        recurring = rng.random() < 0.1
+        tasks.append({
+            'id': task_id,
+            'title': " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))) + f" {task_id}",
+            'description': " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 12))),
+            'completed': rng.random() < 0.3,
+            'created_at': created,
+            'priority': rng.choice(('high', 'medium', 'low')),
+            'tags': rng.sample(['work', 'home'], rng.randint(0, 2)),
+            'is_recurring': recurring,
+            'frequency': rng.choice(('daily', 'weekly', 'monthly')) if recurring else "",
+            'due_date': due_date,
+            'due_at': due_at,
+        })
+    return tasks
+
+
+def build_store(size: int, directory: str):
+    """Write a store of the given size and load it; returns (service, subagent, path)."""
+    path = os.path.join(directory, f"tasks-{size}.json")
+    if not os.path.exists(path):
+        StorageSkill(path).save_data(make_dataset(size), size + 1)
+    service = TaskService()
+    subagent = TaskSubagent(service, StorageSkill(path), notify_on_startup=False)
+    service.set_task_subagent(subagent)
+    return service, subagent, path
+
+
+def null_display():
+    """Return a DisplaySubagent whose console writes to the null device."""
+    from rich.console import Console
+    from ui.display_subagent import DisplaySubagent
+    display = DisplaySubagent()
+    display.console = Console(file=open(os.devnull, "w"), width=120, force_terminal=True)
+    return display
+
+
+def summarize(samples):
+    """Return median, MAD and min of a list of durations."""
+    median = statistics.median(samples)
+    return {
+        'median_s': median,
+        'mad_s': statistics.median(abs(sample - median) for sample in samples),
+        'min_s': min(samples),
+        'rounds': len(samples),
+    }
+
+
+def time_rounds(function, rounds: int, warmup: bool = True, setup=None):
+    """
+    Run function rounds times (plus one untimed warmup) and return the durations.
+
+    If setup is given, it runs untimed before each call and its result is passed to function.
+    """
+    if warmup:
+        function(setup()) if setup else function()
+    samples = []
+    for _ in range(rounds):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        function(argument) if setup else function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def benchmarks_for(size: int, rounds: int, directory: str, wanted=lambda name: True):
+    """Yield (name, samples) for every wanted benchmark at one store size."""
+    service, subagent, path = build_store(size, directory)
+    ids = [task.id for task in service.get_all_tasks()]
+    rng = random.Random(size)
+
+    def create():
+        return service.create_task("benchmark task", "created by the benchmark suite", "medium", ['work'],
+                                   due_date=date.today().isoformat()).id
+
+    def load():
+        fresh = TaskService()
+        TaskSubagent(fresh, StorageSkill(path), notify_on_startup=False)
+
+    def save():
+        service.generation += 1  # Force a write; unchanged stores are otherwise skipped
+        subagent.save_tasks_to_storage()
+
+    tasks = service.get_all_tasks()
+    display = null_display() if wanted("display_tasks") else None
+
+    # Single-item mutations save the whole store, so they are timed one call per round
+    suite = [
+        ("create_task", lambda: time_rounds(create, rounds, warmup=False)),
+        ("update_task", lambda: time_rounds(lambda: service.update_task(
+            rng.choice(ids), priority=rng.choice(('high', 'medium', 'low'))), rounds, warmup=False)),
+        ("toggle_task_status", lambda: time_rounds(lambda: service.toggle_task_status(rng.choice(ids)),
+                                                   rounds, warmup=False)),
+        ("delete_task", lambda: time_rounds(service.delete_task, rounds, warmup=False, setup=create)),
+        ("find_tasks", lambda: time_rounds(lambda: subagent.find_tasks("report"), rounds)),
+        ("get_ordered_tasks", lambda: time_rounds(lambda: subagent.get_ordered_tasks("priority"), rounds)),
+        ("get_upcoming_deadlines", lambda: time_rounds(subagent.get_upcoming_deadlines, rounds)),
+        ("load_tasks_from_storage", lambda: time_rounds(load, rounds)),
+        ("save_tasks_to_storage", lambda: time_rounds(save, rounds)),
+        ("display_tasks", lambda: time_rounds(lambda: display.display_tasks(tasks, ordered=True), rounds)),
+    ]
+    for name, run in suite:
+        if wanted(name):
+            yield name, run()
+
+
+def run_suite(sizes, rounds: int = 5, only=None, progress=None):
+    """
+    Run the suite and return the JSON-serializable report.
+
+    Args:
+        sizes: Store sizes to benchmark
+        rounds: Timed rounds per benchmark
+        only: If given, only benchmarks whose name contains one of these substrings are run
+        progress: Optional callable(name, summary) called after each benchmark
+    """
+    results = {}
+    wanted = (lambda name: any(part in name for part in only)) if only else (lambda name: True)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            for name, samples in benchmarks_for(size, rounds, directory, wanted):
+                key = f"{name}[{size}]"
+                results[key] = summarize(samples)
+                if progress:
+                    progress(key, results[key])
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'rounds': rounds,
+            'sizes': list(sizes),
+        },
+        'results': results,
+    }
+
+
+def print_progress(key, summary):
+    print(f"{key:40s} median {summary['median_s'] * 1000:10.3f} ms  "
+          f"mad {summary['mad_s'] * 1000:8.3f} ms  min {summary['min_s'] * 1000:10.3f} ms",
+          file=sys.stderr, flush=True)
+
+
+def parse_sizes(value: str):
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=parse_sizes, default=list(DEFAULT_SIZES),
+                        help="Comma-separated store sizes (default: 1000,10000,100000)")
+    parser.add_argument("--include-1m", action="store_true", help="Also run the 1,000,000 task store (slow)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark")
+    parser.add_argument("--only", type=lambda value: value.split(","),
+                        help="Comma-separated substrings; run only matching benchmarks")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    sizes = args.sizes + ([LARGE_SIZE] if args.include_1m else [])
+    report = run_suite(sizes, args.rounds, args.only, print_progress)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
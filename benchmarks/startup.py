@@ -0,0 +1,77 @@
+"""
+Startup benchmark for headless entry points.
+
+Imports each entry point in a fresh interpreter, reports the median import time and
+checks that headless paths (scripting CLI, reminder daemon, main module, service layer)
+never load Rich. Exits non-zero if Rich shows up on a headless path or a median exceeds
+its target, so it can run as a CI check.
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--target-ms 80]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Module -> whether it must stay free of Rich
+ENTRY_POINTS = {
+    "cli.scripting": True,
+    "services.background_reminder_service": True,
+    "services.task_subagent": True,
+    "main": True,
+    "todo_app": True,
+    "ui.display_subagent": False,
+}
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "rich = sorted(name for name in sys.modules if name == 'rich' or name.startswith('rich.'))\n"
+    "print(json.dumps({{'ms': elapsed * 1000, 'rich': rich, 'modules': len(sys.modules)}}))\n"
+)
+
+
+def measure(module: str):
+    """Import the module in a fresh interpreter and return the probe result."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import json\n" + PROBE.format(module=module)],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Interpreter launches per entry point")
+    parser.add_argument("--target-ms", type=float, default=80.0,
+                        help="Median import time allowed for headless entry points")
+    args = parser.parse_args()
+
+    failures = []
+    for module, headless in ENTRY_POINTS.items():
+        samples = [measure(module) for _ in range(args.runs)]
+        median_ms = statistics.median(sample["ms"] for sample in samples)
+        rich_loaded = bool(samples[-1]["rich"])
+        print(f"{module:40s} {median_ms:7.1f} ms  modules {samples[-1]['modules']:4d}  "
+              f"rich {'yes' if rich_loaded else 'no'}")
+
+        if headless and rich_loaded:
+            failures.append(f"{module} imports rich: {', '.join(samples[-1]['rich'][:5])}")
+        if headless and median_ms > args.target_ms:
+            failures.append(f"{module} takes {median_ms:.1f} ms to import (target {args.target_ms:.0f} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Thread stress test for TaskService.
+
+Runs reader threads (snapshots, searches, lookups, deadline queries) against writer threads
+(create, update, toggle, delete) on one TaskService backed by a temporary store. Readers
+check every snapshot they see; after the run the store, the due index and the saved file are
+checked against each other. Reports operations per second for each side and exits non-zero
+if any invariant was violated.
+
+Usage:
+    python benchmarks/stress_threads.py [--readers 8] [--writers 4] [--seconds 5] [--tasks 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+from services.storage_engine import StorageSkill  # noqa: E402
+from services.task_service import TaskService  # noqa: E402
+from services.task_subagent import TaskSubagent  # noqa: E402
+
+
+def check_snapshot(tasks, failures) -> None:
+    """A snapshot must be in strictly ascending ID order and every task must be valid."""
+    previous = 0
+    for task in tasks:
+        if task.id <= previous:
+            failures.append(f"snapshot out of order: {task.id} after {previous}")
+            return
+        previous = task.id
+        try:
+            task.validate()
+        except ValueError as e:
+            failures.append(f"invalid task {task.id} in snapshot: {e}")
+            return
+
+
+def reader(service, subagent, stop, counts, failures, seed) -> None:
+    rng = random.Random(seed)
+    done = 0
+    while not stop.is_set():
+        roll = rng.random()
+        if roll < 0.4:
+            check_snapshot(service.get_all_tasks(), failures)
+        elif roll < 0.7:
+            check_snapshot(subagent.find_tasks("stress", ['title']), failures)
+        elif roll < 0.9:
+            task = service.get_task(rng.randint(1, service.next_id))
+            if task is not None and not task.title:
+                failures.append(f"task {task.id} read with an empty title")
+        else:
+            subagent.get_tasks_due_within(24 * 60)
+        done += 1
+    counts.append(done)
+
+
+def writer(service, stop, counts, failures, created, deleted, seed) -> None:
+    rng = random.Random(seed)
+    done = 0
+    while not stop.is_set():
+        roll = rng.random()
+        try:
+            if roll < 0.35:
+                task = service.create_task(f"stress {seed}-{done}", tags=['work'], due_date="2030-01-01 09:30")
+                created.append(task.id)
+            elif roll < 0.65:
+                task_id = rng.randint(1, service.next_id)
+                service.update_task(task_id, priority=rng.choice(['high', 'medium', 'low']))
+            elif roll < 0.9:
+                service.toggle_task_status(rng.randint(1, service.next_id))
+            elif service.delete_task(rng.randint(1, service.next_id)):
+                deleted.append(1)
+        except Exception as e:
+            failures.append(f"writer error: {e!r}")
+        done += 1
+    counts.append(done)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readers", type=int, default=8, help="Reader threads")
+    parser.add_argument("--writers", type=int, default=4, help="Writer threads")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration of the run")
+    parser.add_argument("--tasks", type=int, default=200, help="Tasks created before the run")
+    args = parser.parse_args()
+
+    data = os.path.join(tempfile.mkdtemp(), "tasks.json")
+    service = TaskService()
+    subagent = TaskSubagent(service, StorageSkill(data), notify_on_startup=False)
+    service.set_task_subagent(subagent)
+    for index in range(args.tasks):
+        service.create_task(f"stress seed {index}", tags=['home'])
+
+    stop = threading.Event()
+    read_counts, write_counts, failures, created, deleted = [], [], [], [], []
+    threads = [threading.Thread(target=reader, args=(service, subagent, stop, read_counts, failures, seed))
+               for seed in range(args.readers)]
+    threads += [threading.Thread(target=writer, args=(service, stop, write_counts, failures, created, deleted, seed))
+                for seed in range(args.writers)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    # Final invariants: IDs unique and ordered, next_id ahead of every ID, counts add up,
+    # derived index and saved file agree with memory
+    tasks = service.get_all_tasks()
+    check_snapshot(tasks, failures)
+    if len(set(created)) != len(created):
+        failures.append("duplicate IDs handed out by create_task")
+    if tasks and service.next_id <= tasks[-1].id:
+        failures.append(f"next_id {service.next_id} not above highest ID {tasks[-1].id}")
+    # No recurring tasks are created, so toggles never add tasks
+    expected = args.tasks + len(created) - len(deleted)
+    if len(tasks) != expected:
+        failures.append(f"{len(tasks)} tasks in store, expected {expected}")
+
+    indexed = set(subagent.due_index.due_between(0, 2 ** 40))
+    open_timed = {task.id for task in tasks if task.due_at is not None and not task.completed}
+    if not open_timed <= indexed:
+        failures.append(f"{len(open_timed - indexed)} open tasks missing from the due index")
+
+    saved = StorageSkill(data).load_data() or []
+    if [entry['id'] for entry in saved] != [task.id for task in tasks]:
+        failures.append("saved file does not match the in-memory store")
+
+    reads, writes = sum(read_counts), sum(write_counts)
+    print(f"readers {args.readers:3d}  {reads:9d} ops  {reads / elapsed:10.0f} ops/s")
+    print(f"writers {args.writers:3d}  {writes:9d} ops  {writes / elapsed:10.0f} ops/s")
+    print(f"final   {len(tasks):9d} tasks  {len(created)} created  {len(deleted)} deleted")
+    for failure in failures[:20]:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Webhook sink check against a local stub server.
+
+Starts an http.server stub on a free port and drives WebhookSink through a SinkDispatcher:
+a burst of notifications must arrive exactly once, in order, in batches of at most the
+sink's batch size; a stub answering 503 a few times must see the batch retried until it is
+accepted; a 400, a stub that keeps failing and a closed port must each count the batch as
+failed after the expected number of attempts. Reports delivery throughput and exits non-zero
+on any violation.
+
+Usage:
+    python benchmarks/webhook_sink.py [--notifications 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.notification_sinks import SinkDispatcher, WebhookSink  # noqa: E402
+
+
+class StubWebhook:
+    """HTTP server that records every POSTed batch and answers with scripted statuses."""
+
+    def __init__(self):
+        self.batches = []  # Batches that were accepted with a 2xx
+        self.attempts = 0  # Every POST, accepted or not
+        self.statuses = []  # Statuses to answer with, in order; 200 once exhausted
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                with stub.lock:
+                    stub.attempts += 1
+                    status = stub.statuses.pop(0) if stub.statuses else 200
+                    if 200 <= status < 300:
+                        stub.batches.append(json.loads(body))
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/hook"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def reset(self, statuses=()):
+        with self.lock:
+            self.batches, self.attempts, self.statuses = [], 0, list(statuses)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def deliver(url: str, count: int, retries: int = 2):
+    """Send count notifications through a dispatcher with one webhook sink; return its stats."""
+    dispatcher = SinkDispatcher([WebhookSink(url, timeout=2.0, retries=retries, retry_delay=0.01)],
+                                max_queue=count + 1)
+    for index in range(count):
+        dispatcher.dispatch("Reminder", f"notification {index}")
+    flushed = dispatcher.flush(timeout=30.0)
+    stats = dispatcher.stats()['webhook']
+    dispatcher.close()
+    return flushed, stats
+
+
+def check_batching(stub: StubWebhook, count: int) -> list:
+    failures = []
+    stub.reset()
+    start = time.perf_counter()
+    flushed, stats = deliver(stub.url, count)
+    elapsed = time.perf_counter() - start
+
+    messages = [notification['message'] for batch in stub.batches for notification in batch]
+    if not flushed:
+        failures.append("batching: dispatcher did not flush")
+    if messages != [f"notification {index}" for index in range(count)]:
+        failures.append(f"batching: received {len(messages)} of {count} notifications, "
+                        f"{len(set(messages))} distinct, or out of order")
+    largest = max((len(batch) for batch in stub.batches), default=0)
+    if largest > WebhookSink.batch_size:
+        failures.append(f"batching: batch of {largest} exceeds batch_size {WebhookSink.batch_size}")
+    if len(stub.batches) >= count > 1:
+        failures.append(f"batching: {count} notifications took {len(stub.batches)} requests")
+    if stats['failed'] or stats['dropped']:
+        failures.append(f"batching: {stats['failed']} failed, {stats['dropped']} dropped")
+    print(f"batching: {count} notifications in {len(stub.batches)} requests "
+          f"(largest {largest}), {count / elapsed:.0f} notifications/s")
+    return failures
+
+
+def check_attempts(stub: StubWebhook, name: str, statuses, delivered: bool, attempts: int) -> list:
+    """Send one notification while the stub answers with statuses; check the outcome."""
+    stub.reset(statuses)
+    _, stats = deliver(stub.url, 1)
+    failures = []
+    if bool(stub.batches) != delivered or stats['failed'] != (0 if delivered else 1):
+        failures.append(f"{name}: delivered {len(stub.batches)} batches, {stats['failed']} failed")
+    if stub.attempts != attempts:
+        failures.append(f"{name}: {stub.attempts} attempts, expected {attempts}")
+    print(f"{name}: {stub.attempts} attempts, {'delivered' if stub.batches else 'failed'}")
+    return failures
+
+
+def check_unreachable() -> list:
+    """A closed port fails the batch after the retries instead of hanging the worker."""
+    stub = StubWebhook()
+    url = stub.url
+    stub.close()
+    start = time.perf_counter()
+    flushed, stats = deliver(url, 1)
+    elapsed = time.perf_counter() - start
+    print(f"unreachable: failed after {elapsed * 1000:.0f} ms")
+    if not flushed or stats['failed'] != 1:
+        return [f"unreachable: flushed={flushed}, {stats['failed']} failed"]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--notifications", type=int, default=2000, help="Notifications in the batching burst")
+    args = parser.parse_args()
+
+    stub = StubWebhook()
+    try:
+        failures = check_batching(stub, args.notifications)
+        failures += check_attempts(stub, "retry after 503", [503, 503], delivered=True, attempts=3)
+        failures += check_attempts(stub, "503 every time", [503] * 5, delivered=False, attempts=3)
+        failures += check_attempts(stub, "400 not retried", [400], delivered=False, attempts=1)
+    finally:
+        stub.close()
+    failures += check_unreachable()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
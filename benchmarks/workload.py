@@ -0,0 +1,290 @@
+"""
+Synthetic workload generator and replay harness.
+
+generate writes a reproducible trace: a task population drawn from realistic distributions
+(title and description lengths, tag mix, priorities, recurring ratio, due-date spread) and a
+sequence of operations following a traffic profile. replay loads the population into a fresh
+store and drives TaskService/TaskSubagent with the operations, then reports throughput and
+p50/p95/p99 latency per operation type. run does both in one go.
+
+The generator simulates the store while it writes the trace (ID assignment, deletions and the
+next instance created when a recurring task is completed), so every operation in a trace
+refers to a task that exists when it is replayed.
+
+Usage:
+    python benchmarks/workload.py generate --tasks 2000 --operations 5000 --profile read-heavy -o trace.json
+    python benchmarks/workload.py replay trace.json [--json]
+    python benchmarks/workload.py run --profile search-heavy --seed 7
+"""
+
+import argparse
+import bisect
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+os.environ.setdefault("TODO_NOTIFICATION_SINKS", "log")
+os.environ.setdefault("TODO_NOTIFICATION_LOG", os.path.join(tempfile.gettempdir(), "todo-benchmark-notifications.jsonl"))
+
+VOCABULARY = (
+    "report review invoice groceries meeting plan call budget garden laundry email draft deploy "
+    "book dentist taxes clean fix order pay renew schedule prepare update backup write read "
+    "pick up send check submit car insurance rent school project client slides notes team "
+    "birthday gift doctor gym trip flight hotel bank receipts kitchen repair printer server"
+).split()
+
+# Operation weights per traffic profile
+PROFILES = {
+    'read-heavy': {'get': 30, 'list': 25, 'search': 10, 'sorted': 10, 'upcoming': 10,
+                   'create': 5, 'update': 5, 'toggle': 4, 'delete': 1},
+    'write-heavy': {'create': 30, 'update': 30, 'toggle': 20, 'delete': 10, 'get': 5, 'list': 5},
+    'search-heavy': {'search': 60, 'sorted': 10, 'get': 10, 'list': 5, 'upcoming': 5,
+                     'create': 5, 'update': 5},
+}
+
+WRITE_OPERATIONS = ('create', 'update', 'toggle', 'delete')
+
+
+class PopulationModel:
+    """Draws task fields from fixed distributions with a seeded random generator."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        # Zipf-like word popularity, so a few words dominate as in real task lists
+        self._word_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+    def word(self) -> str:
+        return VOCABULARY[bisect.bisect(self._word_weights, self.rng.random() * self._word_weights[-1])]
+
+    def words(self, median: float, sigma: float, limit: int) -> str:
+        count = max(1, min(limit, int(round(self.rng.lognormvariate(math.log(median), sigma)))))
+        return " ".join(self.word() for _ in range(count))
+
+    def task(self) -> dict:
+        """Return create_task keyword arguments for one task."""
+        rng = self.rng
+        fields = {
+            'title': self.words(median=3, sigma=0.5, limit=12)[:100],
+            # Half of the tasks have no description; the rest have a long-tailed length
+            'description': self.words(median=10, sigma=0.9, limit=80)[:500] if rng.random() < 0.5 else "",
+            'priority': rng.choices(('high', 'medium', 'low'), weights=(20, 50, 30))[0],
+            'tags': rng.choices(([], ['work'], ['home'], ['work', 'home']), weights=(35, 35, 20, 10))[0],
+        }
+        if rng.random() < 0.08:
+            fields['is_recurring'] = True
+            fields['frequency'] = rng.choices(('daily', 'weekly', 'monthly'), weights=(30, 50, 20))[0]
+
+        # Due dates: none, overdue, today/tomorrow, within two weeks or far out; some with a time
+        spread = rng.choices(('none', 'overdue', 'soon', 'weeks', 'far'), weights=(40, 10, 15, 25, 10))[0]
+        if spread != 'none':
+            days = {'overdue': rng.randint(-30, -1), 'soon': rng.randint(0, 1),
+                    'weeks': rng.randint(2, 14), 'far': rng.randint(15, 365)}[spread]
+            day = (datetime.now() + timedelta(days=days)).date().isoformat()
+            if rng.random() < 0.3:
+                day += f" {rng.randint(7, 21):02d}:{rng.choice((0, 15, 30, 45)):02d}"
+            fields['due_date'] = day
+        return fields
+
+
+def generate(tasks: int, operations: int, profile: str, seed: int) -> dict:
+    """Build a trace: population plus operations that are valid when replayed in order."""
+    rng = random.Random(seed)
+    model = PopulationModel(rng)
+    population = [model.task() for _ in range(tasks)]
+    completed_share = 0.35
+
+    # Simulated store: live IDs plus (recurring, completed) per ID
+    state = {}
+    for task_id, fields in enumerate(population, 1):
+        state[task_id] = [fields.get('is_recurring', False), rng.random() < completed_share]
+    initially_completed = [task_id for task_id, (_, completed) in state.items() if completed]
+    live = list(state)
+    next_id = tasks + 1
+
+    def pick() -> int:
+        # Recently created tasks are touched more often than old ones
+        offset = min(len(live) - 1, int(rng.expovariate(1 / max(1.0, len(live) / 5))))
+        return live[len(live) - 1 - offset]
+
+    kinds, weights = zip(*PROFILES[profile].items())
+    trace = []
+    for _ in range(operations):
+        kind = rng.choices(kinds, weights=weights)[0]
+        if kind in ('get', 'update', 'toggle', 'delete') and not live:
+            kind = 'create'
+
+        if kind == 'create':
+            fields = model.task()
+            trace.append({'op': 'create', 'fields': fields})
+            state[next_id] = [fields.get('is_recurring', False), False]
+            live.append(next_id)
+            next_id += 1
+        elif kind == 'get':
+            trace.append({'op': 'get', 'id': pick()})
+        elif kind == 'update':
+            field = rng.choice(('title', 'priority', 'description', 'due_date'))
+            value = {'title': model.words(3, 0.5, 12)[:100],
+                     'priority': rng.choice(('high', 'medium', 'low')),
+                     'description': model.words(10, 0.9, 80)[:500],
+                     'due_date': (datetime.now() + timedelta(days=rng.randint(0, 30))).date().isoformat()}[field]
+            trace.append({'op': 'update', 'id': pick(), 'fields': {field: value}})
+        elif kind == 'toggle':
+            task_id = pick()
+            trace.append({'op': 'toggle', 'id': task_id})
+            recurring, completed = state[task_id]
+            if recurring and not completed:
+                # Completing a recurring task creates its next instance
+                state[next_id] = [True, False]
+                live.append(next_id)
+                next_id += 1
+            state[task_id][1] = not completed
+        elif kind == 'delete':
+            task_id = pick()
+            trace.append({'op': 'delete', 'id': task_id})
+            live.remove(task_id)
+            del state[task_id]
+        elif kind == 'search':
+            trace.append({'op': 'search', 'keyword': model.word(),
+                          'fields': rng.choice((None, ['title'], ['title', 'description']))})
+        elif kind == 'sorted':
+            trace.append({'op': 'sorted', 'by': rng.choice(('priority', 'date')), 'reverse': rng.random() < 0.5})
+        else:
+            trace.append({'op': kind})
+
+    return {'seed': seed, 'profile': profile, 'population': population,
+            'completed': initially_completed, 'operations': trace}
+
+
+def percentile(sorted_samples, fraction: float) -> float:
+    return sorted_samples[min(len(sorted_samples) - 1, int(len(sorted_samples) * fraction))]
+
+
+def replay(trace: dict, data_path: str = None) -> dict:
+    """Load the population into a fresh store, replay the operations and return per-operation stats."""
+    from services.storage_engine import StorageSkill
+    from services.task_service import TaskService
+    from services.task_subagent import TaskSubagent
+
+    data_path = data_path or os.path.join(tempfile.mkdtemp(), "tasks.json")
+    if os.path.exists(data_path):
+        raise ValueError(f"Replay needs a fresh store; {data_path} already exists")
+    # Seed the store through the bulk API, mark the completed share in the stored records and
+    # start the replayed service from that file, as the app would after a restart
+    seeder = TaskService()
+    seeder.set_task_subagent(TaskSubagent(seeder, StorageSkill(data_path), notify_on_startup=False))
+    seeder.create_many(trace['population'])
+    storage = StorageSkill(data_path)
+    completed = set(trace['completed'])
+    records = [dict(record, completed=record['id'] in completed) for record in storage.load_data()]
+    storage.save_data(records, storage.next_id)
+
+    service = TaskService()
+    subagent = TaskSubagent(service, StorageSkill(data_path), notify_on_startup=False)
+    service.set_task_subagent(subagent)
+
+    handlers = {
+        'create': lambda op: service.create_task(**op['fields']),
+        'get': lambda op: service.get_task(op['id']),
+        'update': lambda op: service.update_task(op['id'], **op['fields']),
+        'toggle': lambda op: service.toggle_task_status(op['id']),
+        'delete': lambda op: service.delete_task(op['id']),
+        'list': lambda op: service.get_all_tasks(),
+        'search': lambda op: subagent.find_tasks(op['keyword'], op['fields']),
+        'sorted': lambda op: subagent.get_ordered_tasks(op['by'], op['reverse']),
+        'upcoming': lambda op: subagent.get_upcoming_deadlines(),
+    }
+
+    latencies = defaultdict(list)
+    missed = defaultdict(int)
+    start = time.perf_counter()
+    for op in trace['operations']:
+        began = time.perf_counter()
+        result = handlers[op['op']](op)
+        latencies[op['op']].append(time.perf_counter() - began)
+        if result is None or result is False:
+            missed[op['op']] += 1  # The trace and the store disagree about which tasks exist
+    elapsed = time.perf_counter() - start
+
+    report = {'profile': trace['profile'], 'seed': trace['seed'], 'tasks': len(trace['population']),
+              'operations': len(trace['operations']), 'elapsed_s': elapsed,
+              'ops_per_s': len(trace['operations']) / elapsed if elapsed else 0.0, 'by_operation': {}}
+    for kind, samples in sorted(latencies.items()):
+        samples.sort()
+        report['by_operation'][kind] = {
+            'count': len(samples),
+            'ops_per_s': len(samples) / sum(samples) if sum(samples) else 0.0,
+            'p50_ms': percentile(samples, 0.50) * 1000,
+            'p95_ms': percentile(samples, 0.95) * 1000,
+            'p99_ms': percentile(samples, 0.99) * 1000,
+            'missed': missed[kind],
+        }
+    return report
+
+
+def print_report(report: dict) -> None:
+    print(f"profile {report['profile']}  seed {report['seed']}  {report['tasks']} tasks  "
+          f"{report['operations']} operations  {report['ops_per_s']:.0f} ops/s overall")
+    print(f"{'operation':10s} {'count':>7s} {'ops/s':>10s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s}")
+    for kind, stats in report['by_operation'].items():
+        print(f"{kind:10s} {stats['count']:7d} {stats['ops_per_s']:10.0f} {stats['p50_ms']:9.3f} "
+              f"{stats['p95_ms']:9.3f} {stats['p99_ms']:9.3f}")
+    missed = sum(stats['missed'] for stats in report['by_operation'].values())
+    if missed:
+        print(f"Warning: {missed} operations referred to tasks that did not exist")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_generation_options(sub):
+        sub.add_argument("--tasks", type=int, default=2000, help="Tasks in the initial population")
+        sub.add_argument("--operations", type=int, default=5000, help="Operations in the trace")
+        sub.add_argument("--profile", choices=sorted(PROFILES), default="read-heavy")
+        sub.add_argument("--seed", type=int, default=1)
+
+    generate_parser = subparsers.add_parser("generate", help="Write a trace file")
+    add_generation_options(generate_parser)
+    generate_parser.add_argument("-o", "--output", required=True, help="Trace file to write")
+
+    replay_parser = subparsers.add_parser("replay", help="Replay a trace file")
+    replay_parser.add_argument("trace", help="Trace file written by generate")
+    replay_parser.add_argument("--data", help="Fresh storage file to use (default: a temporary file)")
+    replay_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    run_parser = subparsers.add_parser("run", help="Generate and replay without writing a trace")
+    add_generation_options(run_parser)
+    run_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+    if args.command == "generate":
+        trace = generate(args.tasks, args.operations, args.profile, args.seed)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(trace, file)
+        print(f"Wrote {len(trace['population'])} tasks and {len(trace['operations'])} operations to {args.output}")
+        return
+
+    if args.command == "replay":
+        with open(args.trace, encoding="utf-8") as file:
+            trace = json.load(file)
+        report = replay(trace, args.data)
+    else:
+        report = replay(generate(args.tasks, args.operations, args.profile, args.seed))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
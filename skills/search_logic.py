@@ -77,16 +77,27 @@ def search_by_keyword(data_list, keyword, keys_to_search=None):
     return results
 
 
+def _letter_pairs(text):
+    """Return the letter pairs of a string padded with a space at both ends."""
+    padded = " " + text + " "
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
 def fuzzy_search(data_list, key, value, threshold=0.6):
     """
     Perform a fuzzy search on a specific key in the list of dictionaries.
-    
+
+    Items match when difflib's SequenceMatcher ratio between the value and the item's value is
+    at least the threshold. Each distinct item value is scored once, and cheap upper bounds on
+    the ratio (lengths, shared letter pairs, quick_ratio) rule out most values before the
+    exact ratio is computed, so the results are the same as scoring every item.
+
     Args:
         data_list (list): List of dictionaries to search
         key (str): The key to search in
         value (str): The value to match against
         threshold (float): Similarity threshold (0-1), default 0.6
-        
+
     Returns:
         list: List of dictionaries that match above the threshold
     """
@@ -95,15 +106,27 @@ def fuzzy_search(data_list, key, value, threshold=0.6):
     except ImportError:
         # If difflib is not available, fall back to exact match
         return search_by_key_value(data_list, key, value)
-    
-    results = []
+
     value_lower = value.lower()
-    
+    matcher = SequenceMatcher(None, value_lower)
+    value_length = len(value_lower)
+    # Without a common letter pair (padded at both ends) the ratio stays below 2/3
+    value_pairs = _letter_pairs(value_lower) if threshold >= 2 / 3 and value_lower else None
+
+    verdicts = {}  # Lowercased item value -> whether it matches
+    results = []
     for item in data_list:
-        item_value = str(item.get(key, ""))
-        similarity = SequenceMatcher(None, value_lower, item_value.lower()).ratio()
-        
-        if similarity >= threshold:
+        item_value = str(item.get(key, "")).lower()
+        matched = verdicts.get(item_value)
+        if matched is None:
+            matched = False
+            length = len(item_value)
+            if (2 * min(value_length, length) >= threshold * (value_length + length)
+                    and (value_pairs is None or not value_pairs.isdisjoint(_letter_pairs(item_value)))):
+                matcher.set_seq2(item_value)
+                matched = matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold
+            verdicts[item_value] = matched
+        if matched:
             results.append(item)
-    
-    return results
\ No newline at end of file
+
+    return results
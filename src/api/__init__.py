@@ -0,0 +1,3 @@
+"""
+Package initialization for the API module.
+"""
\ No newline at end of file
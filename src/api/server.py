@@ -0,0 +1,286 @@
+"""
+API Server
+Local HTTP/JSON API over TaskService and TaskSubagent, built on asyncio streams.
+
+Reads are answered directly on the event loop. Mutations run on a single writer thread, so
+they are applied one at a time in arrival order no matter how many clients are connected,
+and the save each one ends with does not hold up other connections. Connections are kept
+alive and pipelined requests are answered in order.
+
+Endpoints:
+    GET    /health
+    GET    /tasks?status=pending&sort=priority&reverse=1
+    GET    /tasks/{id}
+    POST   /tasks                  JSON body with title, description, priority, tags, recurring, due
+    PATCH  /tasks/{id}             JSON body with the fields to change
+    DELETE /tasks/{id}
+    POST   /tasks/{id}/toggle      Returns {"toggled": [task], "created": [next recurring instance]}
+    GET    /search?q=keyword&fields=title,tags[&suggest=1]
+    GET    /search?q=keyword&ranked=1&limit=20  Most relevant first, with scores
+    GET    /complete?prefix=rep    Titles and tags starting with the prefix (&limit=20)
+    GET    /upcoming?within=60
+    GET    /metrics                Prometheus text, or JSON with ?format=json (needs TODO_METRICS=1)
+
+Usage:
+    python -m api.server --port 8765 --data data/tasks.json
+"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from cli.scripting import (cmd_add, cmd_complete, cmd_delete, cmd_list, cmd_search, cmd_toggle, cmd_update,
+                           cmd_upcoming)
+from services import metrics
+from services.storage_engine import StorageSkill
+from services.task_service import TaskService
+from services.task_subagent import TaskSubagent
+
+
+MAX_BODY_BYTES = 1024 * 1024
+
+REASONS = {
+    200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """An error that is reported to the client with a status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TaskAPIServer:
+    """HTTP/JSON front end for a TaskService."""
+
+    def __init__(self, task_service: TaskService, task_subagent: TaskSubagent):
+        """
+        Initialize the server.
+
+        Args:
+            task_service: Service holding the tasks
+            task_subagent: Subagent used for persistence, search and deadlines
+        """
+        self.task_service = task_service
+        self.task_subagent = task_subagent
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """Start the writer thread and listen; returns the asyncio server."""
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-writer")
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def stop(self) -> None:
+        """Stop accepting connections and finish the queued mutations."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._writer:
+            await asyncio.get_running_loop().run_in_executor(None, self._writer.shutdown)
+
+    def _apply(self, handler, params: Dict[str, Any], task_id: Optional[int]):
+        """Run a mutation on the writer thread, checking the task still exists when its turn comes."""
+        if task_id is not None and not self.task_service.task_exists(task_id):
+            raise HTTPError(404, f"Task {task_id} not found")
+        return handler(self.task_service, self.task_subagent, params)
+
+    async def _mutate(self, handler, params: Dict[str, Any], task_id: Optional[int] = None):
+        """
+        Queue a mutation for the writer thread and wait for its result.
+
+        The single writer thread applies mutations in arrival order. A task_id is checked when
+        the mutation runs, so an earlier queued delete of the task turns it into a 404.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._writer, self._apply, handler, params, task_id)
+
+    @staticmethod
+    def _task_id(task_id: str) -> int:
+        """Parse a task ID from the path."""
+        try:
+            return int(task_id)
+        except ValueError:
+            raise HTTPError(400, f"Invalid task ID: {task_id!r}")
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Any]:
+        """
+        Route one request.
+
+        Returns:
+            (status code, JSON-serializable payload)
+        """
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+
+        payload: Dict[str, Any] = {}
+        if body:
+            try:
+                payload = json.loads(body)
+            except json.JSONDecodeError as e:
+                raise HTTPError(400, f"Invalid JSON body: {e}")
+            if not isinstance(payload, dict):
+                raise HTTPError(400, "JSON body must be an object")
+
+        if parts == ['health']:
+            return 200, {'status': 'ok', 'tasks': len(self.task_service.tasks)}
+
+        if parts == ['tasks']:
+            if method == 'GET':
+                query['reverse'] = query.get('reverse') in ('1', 'true', 'yes')
+                return 200, cmd_list(self.task_service, self.task_subagent, query)
+            if method == 'POST':
+                if not payload.get('title'):
+                    raise HTTPError(400, "Field 'title' is required")
+                return 201, await self._mutate(cmd_add, payload)
+            raise HTTPError(405, f"{method} not allowed on /tasks")
+
+        if len(parts) == 2 and parts[0] == 'tasks':
+            task_id = self._task_id(parts[1])
+            if method == 'GET':
+                task = self.task_service.get_task(task_id)
+                if task is None:
+                    raise HTTPError(404, f"Task {task_id} not found")
+                return 200, self.task_subagent.task_to_dict(task)
+            if method == 'PATCH':
+                return 200, await self._mutate(cmd_update, dict(payload, id=task_id), task_id)
+            if method == 'DELETE':
+                return 200, await self._mutate(cmd_delete, {'ids': [task_id]}, task_id)
+            raise HTTPError(405, f"{method} not allowed on /tasks/{task_id}")
+
+        if len(parts) == 3 and parts[0] == 'tasks' and parts[2] == 'toggle':
+            task_id = self._task_id(parts[1])
+            if method != 'POST':
+                raise HTTPError(405, f"{method} not allowed on /tasks/{task_id}/toggle")
+            return 200, await self._mutate(cmd_toggle, {'ids': [task_id]}, task_id)
+
+        if parts == ['search'] and method == 'GET':
+            return 200, cmd_search(self.task_service, self.task_subagent,
+                                   {'keyword': query.get('q', ''), 'fields': query.get('fields'),
+                                    'suggest': query.get('suggest') not in (None, '', '0', 'false'),
+                                    'ranked': query.get('ranked') not in (None, '', '0', 'false'),
+                                    'limit': query.get('limit')})
+
+        if parts == ['complete'] and method == 'GET':
+            return 200, cmd_complete(self.task_service, self.task_subagent, query)
+
+        if parts == ['upcoming'] and method == 'GET':
+            return 200, cmd_upcoming(self.task_service, self.task_subagent, query)
+
+        if parts == ['metrics'] and method == 'GET':
+            if query.get('format') == 'json':
+                return 200, metrics.snapshot()
+            return 200, metrics.prometheus_text()
+
+        raise HTTPError(404, f"No route for {method} {url.path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one keep-alive connection until the client closes it."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                request_line, *header_lines = head.decode('latin-1').split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "Malformed request line"}, False)
+                    return
+
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.upper() != 'HTTP/1.0')
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': "Invalid Content-Length"}, False)
+                    return
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {'error': "Request body too large"}, False)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, result = await self.dispatch(method.upper(), target, body)
+                except HTTPError as e:
+                    status, result = e.status, {'error': str(e)}
+                except (ValueError, KeyError, TypeError) as e:
+                    status, result = 400, {'error': str(e)}
+                except Exception as e:
+                    status, result = 500, {'error': f"Internal error: {e}"}
+
+                await self._respond(writer, status, result, keep_alive)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        # Plain strings are sent as text, e.g. the Prometheus exposition format
+        if isinstance(payload, str):
+            body, content_type = payload.encode('utf-8'), "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body, content_type = json.dumps(payload, ensure_ascii=False).encode('utf-8'), "application/json"
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode('latin-1')
+        writer.write(head + body)
+        await writer.drain()
+
+
+async def serve(host: str, port: int, data: str) -> None:
+    """Load the store and serve until cancelled."""
+    task_service = TaskService()
+    task_subagent = TaskSubagent(task_service, StorageSkill(data), notify_on_startup=False)
+    task_service.set_task_subagent(task_subagent)
+
+    api = TaskAPIServer(task_service, task_subagent)
+    server = await api.start(host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Task API listening on {addresses}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await api.stop()
+
+
+def main(argv=None) -> None:
+    """Command-line entry point for the API server."""
+    parser = argparse.ArgumentParser(description="Serve the task store over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--data", default="data/tasks.json", help="Task storage file (default: data/tasks.json)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.data))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
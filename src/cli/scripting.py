@@ -0,0 +1,305 @@
+"""
+Scripting CLI
+Non-interactive subcommands with JSON or NDJSON output for automation.
+
+This path never imports Rich or the interactive UI, so scripted use is bounded by the
+task store rather than terminal rendering.
+
+Examples:
+    todo-app add "Write report" --priority high --tags work --due "2024-05-01 17:00"
+    todo-app list --status pending --format ndjson
+    todo-app toggle 3 4
+    todo-app diagnostics
+    echo '{"command": "add", "title": "Buy milk"}' | todo-app batch
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+from services import profiling
+from services.storage_engine import StorageSkill
+from services.task_service import TaskService
+from services.task_subagent import TaskSubagent
+
+
+def _parse_tags(tags) -> Optional[List[str]]:
+    """Accept tags as a list or a comma-separated string."""
+    if tags is None:
+        return None
+    if isinstance(tags, str):
+        return [tag.strip() for tag in tags.split(',') if tag.strip()]
+    return list(tags)
+
+
+def _ids(params: Dict[str, Any]) -> List[int]:
+    """Read one or more task IDs from 'ids' or 'id'."""
+    ids = params.get('ids')
+    if ids is None:
+        ids = [params['id']] if 'id' in params else []
+    if isinstance(ids, (int, str)):
+        ids = [ids]
+    return [int(task_id) for task_id in ids]
+
+
+def cmd_add(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """Create a task and return it."""
+    frequency = params.get('recurring') or ""
+    task = service.create_task(
+        params['title'],
+        params.get('description') or "",
+        params.get('priority') or "medium",
+        _parse_tags(params.get('tags')) or [],
+        bool(frequency),
+        frequency,
+        params.get('due'),
+    )
+    return subagent.task_to_dict(task)
+
+
+def cmd_list(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """Return all tasks, optionally filtered by status and sorted."""
+    if params.get('sort'):
+        tasks = subagent.get_ordered_tasks(params['sort'], bool(params.get('reverse')))
+    else:
+        tasks = service.get_all_tasks()
+
+    status = params.get('status') or 'all'
+    if status == 'pending':
+        tasks = [task for task in tasks if not task.completed]
+    elif status == 'completed':
+        tasks = [task for task in tasks if task.completed]
+    return [subagent.task_to_dict(task) for task in tasks]
+
+
+def cmd_update(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """Update the given fields of a task and return it."""
+    task_id = int(params['id'])
+    recurring = params.get('recurring')
+    is_recurring = None
+    if recurring is not None:
+        # An empty frequency turns recurrence off
+        is_recurring = bool(recurring)
+
+    updated = service.update_task(
+        task_id,
+        title=params.get('title'),
+        description=params.get('description'),
+        priority=params.get('priority'),
+        tags=_parse_tags(params.get('tags')),
+        is_recurring=is_recurring,
+        frequency=recurring,
+        due_date=params.get('due'),
+    )
+    if not updated:
+        raise ValueError(f"Task {task_id} not found")
+    return subagent.task_to_dict(service.get_task(task_id))
+
+
+def cmd_delete(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """Delete tasks by ID and return the deleted IDs."""
+    return {'deleted': service.delete_many(_ids(params))}
+
+
+def cmd_toggle(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """Toggle tasks by ID; return the toggled tasks and the next instances of completed recurring ones."""
+    ids = list(dict.fromkeys(_ids(params)))
+    tasks = service.toggle_many(ids)
+    return {'toggled': [subagent.task_to_dict(task) for task in tasks[:len(ids)]],
+            'created': [subagent.task_to_dict(task) for task in tasks[len(ids):]]}
+
+
+def cmd_search(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """
+    Return tasks matching a keyword, with spelling suggestions if --suggest is given and nothing matched.
+
+    With --ranked, return the --limit most relevant tasks (default 20), best first, each with its score.
+    """
+    fields = params.get('fields')
+    if isinstance(fields, str):
+        fields = [field.strip() for field in fields.split(',') if field.strip()]
+    if params.get('ranked'):
+        if fields:
+            raise ValueError("--fields cannot be combined with --ranked, which searches title, description and tags")
+        limit = int(params['limit']) if params.get('limit') is not None else 20
+        found = [dict(subagent.task_to_dict(task), score=round(score, 4))
+                 for task, score in subagent.find_tasks_ranked(params.get('keyword', ''), limit)]
+    else:
+        tasks = subagent.find_tasks(params.get('keyword', ''), fields or None)
+        found = [subagent.task_to_dict(task) for task in tasks]
+    if not params.get('suggest'):
+        return found
+    suggestions = subagent.did_you_mean(params.get('keyword', '')) if not found else []
+    return {'tasks': found, 'did_you_mean': suggestions}
+
+
+def cmd_complete(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """Return task titles and tags starting with a prefix, for search-as-you-type and shell completion."""
+    limit = int(params['limit']) if params.get('limit') is not None else 20
+    return subagent.complete(params.get('prefix', ''), limit)
+
+
+def cmd_upcoming(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """Return open tasks due within the next 24 hours, or within --within minutes."""
+    if params.get('within') is not None:
+        tasks = subagent.get_tasks_due_within(int(params['within']))
+    else:
+        tasks = subagent.get_upcoming_deadlines()
+    return [subagent.task_to_dict(task) for task in tasks]
+
+
+def cmd_diagnostics(service: TaskService, subagent: TaskSubagent, params: Dict[str, Any]):
+    """Return the memory footprint of the task store and its indexes."""
+    from services.diagnostics import memory_report
+    return memory_report(service, subagent)
+
+
+COMMANDS: Dict[str, Callable] = {
+    'add': cmd_add,
+    'list': cmd_list,
+    'update': cmd_update,
+    'delete': cmd_delete,
+    'toggle': cmd_toggle,
+    'search': cmd_search,
+    'complete': cmd_complete,
+    'upcoming': cmd_upcoming,
+    'diagnostics': cmd_diagnostics,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for all subcommands."""
+    # Global options are accepted before or after the subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--data", default=argparse.SUPPRESS, help="Task storage file (default: data/tasks.json)")
+    common.add_argument("--format", choices=["json", "ndjson"], default=argparse.SUPPRESS,
+                        help="Output format; ndjson prints one task per line (default: json)")
+    common.add_argument("--profile", metavar="DIR", default=argparse.SUPPRESS,
+                        help="Write a cProfile profile per task operation to DIR (like TODO_PROFILE)")
+    common.add_argument("--slow-ms", type=float, metavar="MS", default=argparse.SUPPRESS,
+                        help="Log operations slower than MS milliseconds (like TODO_SLOW_MS)")
+
+    parser = argparse.ArgumentParser(prog="todo-app", description="Manage todo tasks from scripts.",
+                                     parents=[common])
+    parser.set_defaults(data="data/tasks.json", format="json", profile=None, slow_ms=None)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add = subparsers.add_parser("add", help="Add a task", parents=[common])
+    add.add_argument("title")
+    add.add_argument("--description", default="")
+    add.add_argument("--priority", default="medium", choices=["high", "medium", "low"])
+    add.add_argument("--tags", help="Comma-separated tags, e.g. work,home")
+    add.add_argument("--recurring", choices=["daily", "weekly", "monthly"], help="Make the task recurring")
+    add.add_argument("--due", help="Due date, YYYY-MM-DD or YYYY-MM-DD HH:MM")
+
+    list_parser = subparsers.add_parser("list", parents=[common], help="List tasks")
+    list_parser.add_argument("--status", choices=["all", "pending", "completed"], default="all")
+    list_parser.add_argument("--sort", choices=["priority", "date"])
+    list_parser.add_argument("--reverse", action="store_true")
+
+    update = subparsers.add_parser("update", parents=[common], help="Update a task")
+    update.add_argument("id", type=int)
+    update.add_argument("--title")
+    update.add_argument("--description")
+    update.add_argument("--priority", choices=["high", "medium", "low"])
+    update.add_argument("--tags", help="Comma-separated tags; an empty string clears them")
+    update.add_argument("--recurring", choices=["daily", "weekly", "monthly", ""],
+                        help="New frequency; an empty string makes the task non-recurring")
+    update.add_argument("--due", help="Due date, YYYY-MM-DD or YYYY-MM-DD HH:MM")
+
+    delete = subparsers.add_parser("delete", parents=[common], help="Delete tasks")
+    delete.add_argument("ids", type=int, nargs="+")
+
+    toggle = subparsers.add_parser("toggle", parents=[common], help="Toggle task completion")
+    toggle.add_argument("ids", type=int, nargs="+")
+
+    search = subparsers.add_parser("search", parents=[common], help="Search tasks by keyword")
+    search.add_argument("keyword")
+    search.add_argument("--fields", help="Comma-separated fields (default: title,description,tags,due_date)")
+    search.add_argument("--suggest", action="store_true",
+                        help="Return {tasks, did_you_mean}, suggesting similar words when nothing matches")
+    search.add_argument("--ranked", action="store_true", help="Return the most relevant tasks first (BM25)")
+    search.add_argument("--limit", type=int, help="Number of tasks returned by --ranked (default: 20)")
+
+    complete = subparsers.add_parser("complete", parents=[common], help="Complete a prefix to task titles and tags")
+    complete.add_argument("prefix")
+    complete.add_argument("--limit", type=int, help="Maximum number of completions (default: 20)")
+
+    upcoming = subparsers.add_parser("upcoming", parents=[common], help="List tasks with upcoming deadlines")
+    upcoming.add_argument("--within", type=int, metavar="MINUTES",
+                          help="Only tasks due within this many minutes (default: next 24 hours)")
+
+    subparsers.add_parser("diagnostics", parents=[common],
+                          help="Report memory used per task and by the indexes")
+
+    subparsers.add_parser("batch", parents=[common], help="Run NDJSON commands from stdin, one JSON object per line, "
+                                        "e.g. {\"command\": \"add\", \"title\": \"Buy milk\"}")
+    return parser
+
+
+def _write(result: Any, output_format: str, out) -> None:
+    """Write a result as one JSON document or as NDJSON lines."""
+    if output_format == "ndjson" and isinstance(result, list):
+        for item in result:
+            out.write(json.dumps(item, ensure_ascii=False) + "\n")
+    else:
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+def run_batch(service: TaskService, subagent: TaskSubagent, lines, out) -> int:
+    """
+    Execute NDJSON commands and write one NDJSON result envelope per input line.
+
+    Returns:
+        0 if every command succeeded, 1 otherwise
+    """
+    exit_code = 0
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            params = json.loads(line)
+            handler = COMMANDS.get(params.get('command'))
+            if handler is None:
+                raise ValueError(f"Unknown command: {params.get('command')!r}")
+            envelope = {'line': line_number, 'ok': True, 'result': handler(service, subagent, params)}
+        except (ValueError, KeyError, TypeError) as e:
+            exit_code = 1
+            envelope = {'line': line_number, 'ok': False, 'error': str(e)}
+        out.write(json.dumps(envelope, ensure_ascii=False) + "\n")
+    return exit_code
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run one scripting command.
+
+    Returns:
+        Process exit code: 0 on success, 1 if the command failed
+    """
+    args = build_parser().parse_args(argv)
+    if args.profile or args.slow_ms is not None:
+        # Command-line switches replace the TODO_PROFILE/TODO_SLOW_MS settings
+        profiling.configure(args.profile, args.slow_ms)
+
+    task_service = TaskService()
+    task_subagent = TaskSubagent(task_service, StorageSkill(args.data), notify_on_startup=False)
+    task_service.set_task_subagent(task_subagent)
+
+    if args.command == "batch":
+        return run_batch(task_service, task_subagent, sys.stdin, sys.stdout)
+
+    params = {key: value for key, value in vars(args).items() if value is not None}
+    try:
+        result = COMMANDS[args.command](task_service, task_subagent, params)
+    except (ValueError, KeyError) as e:
+        _write({'error': str(e)}, "json", sys.stderr)
+        return 1
+    _write(result, args.format, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
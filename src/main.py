@@ -4,14 +4,19 @@ This file initializes the new subagents and starts the application.
 """
 from services.task_service import TaskService
 from services.task_subagent import TaskSubagent
-from ui.display_subagent import DisplaySubagent
-from ui.console_ui import ConsoleUI
+from services.time_engine import TimeSkill
+
+RANKED_RESULTS = 20  # Tasks shown by Search by Relevance, one page
 
 
 def main():
     """
     Main function to run the Todo Console App.
     """
+    # Rich-based UI modules are imported here so importing this module stays headless
+    from ui.display_subagent import DisplaySubagent
+    from ui.console_ui import ConsoleUI
+
     print("Initializing Todo Console App...")
 
     # Initialize services and subagents
@@ -19,8 +24,8 @@ def main():
     task_subagent = TaskSubagent(task_service)
     # Set the task_subagent reference in task_service for saving tasks
     task_service.set_task_subagent(task_subagent)
-    display_subagent = DisplaySubagent()
-    console_ui = ConsoleUI()
+    display_subagent = DisplaySubagent(complete=task_subagent.complete)
+    console_ui = ConsoleUI(complete=task_subagent.complete)
 
     print("Todo Console App initialized successfully!")
     print("Note: To run the background reminder service, run 'python -m services.background_reminder_service' in a separate terminal.")
@@ -42,7 +47,7 @@ def main():
         elif choice == "2":
             # View all tasks
             tasks = task_service.get_all_tasks()
-            display_subagent.display_tasks(tasks)
+            display_subagent.browse_tasks(tasks, ordered=True)
 
         elif choice == "3":
             # Update a task
@@ -50,7 +55,7 @@ def main():
                 console_ui.show_message("No tasks available to update.", "warning")
                 continue
 
-            display_subagent.display_tasks(task_service.get_all_tasks())
+            display_subagent.browse_tasks(task_service.get_all_tasks(), ordered=True)
             task_id = console_ui.get_task_id("update")
 
             if task_service.get_task(task_id) is not None:
@@ -62,7 +67,7 @@ def main():
                     current_task.tags,
                     current_task.is_recurring,
                     current_task.frequency,
-                    current_task.due_date
+                    TimeSkill.format_due(current_task)
                 )
 
                 success = task_service.update_task(task_id, title, description, priority, tags, is_recurring, frequency, due_date)
@@ -79,7 +84,7 @@ def main():
                 console_ui.show_message("No tasks available to delete.", "warning")
                 continue
 
-            display_subagent.display_tasks(task_service.get_all_tasks())
+            display_subagent.browse_tasks(task_service.get_all_tasks(), ordered=True)
             task_id = console_ui.get_task_id("delete")
 
             success = task_service.delete_task(task_id)
@@ -94,7 +99,7 @@ def main():
                 console_ui.show_message("No tasks available.", "warning")
                 continue
 
-            display_subagent.display_tasks(task_service.get_all_tasks())
+            display_subagent.browse_tasks(task_service.get_all_tasks(), ordered=True)
             task_id = console_ui.get_task_id("toggle completion status")
 
             success = task_service.toggle_task_status(task_id)
@@ -117,21 +122,31 @@ def main():
                     # Search tasks
                     keyword = display_subagent.get_search_keyword()
                     found_tasks = task_subagent.find_tasks(keyword)
-                    display_subagent.display_tasks(found_tasks)
+                    display_subagent.browse_tasks(found_tasks, ordered=True)
+                    if not found_tasks:
+                        suggestions = task_subagent.did_you_mean(keyword)
+                        if suggestions:
+                            console_ui.show_message(f"Did you mean: {', '.join(suggestions)}?", "warning")
 
                 elif search_choice == "2":
                     # Sort by priority
                     reverse = display_subagent.get_sort_order()
                     sorted_tasks = task_subagent.get_ordered_tasks('priority', reverse)
-                    display_subagent.display_tasks(sorted_tasks)
+                    display_subagent.browse_tasks(sorted_tasks)
 
                 elif search_choice == "3":
                     # Sort by date
                     reverse = display_subagent.get_sort_order()
                     sorted_tasks = task_subagent.get_ordered_tasks('date', reverse)
-                    display_subagent.display_tasks(sorted_tasks)
+                    display_subagent.browse_tasks(sorted_tasks)
 
                 elif search_choice == "4":
+                    # Search by relevance: one page of the best matches, picked with a top-k heap
+                    keyword = display_subagent.get_search_keyword()
+                    ranked = task_subagent.find_tasks_ranked(keyword, limit=RANKED_RESULTS)
+                    display_subagent.browse_tasks([task for task, _ in ranked], preserve_order=True)
+
+                elif search_choice == "5":
                     # Back to main menu
                     break
 
@@ -144,6 +159,11 @@ def main():
             display_subagent.display_upcoming_deadlines(upcoming_tasks)
 
         elif choice == "9":
+            # Live Dashboard
+            from ui.dashboard import TaskDashboard
+            TaskDashboard(task_service, task_subagent, display_subagent).run()
+
+        elif choice == "10":
             # Exit
             if console_ui.confirm_exit():
                 console_ui.show_message("Thank you for using Todo Console App!", "success")
@@ -3,11 +3,16 @@ Task Model
 Defines the Task data structure for the todo application.
 """
 
-from dataclasses import dataclass
+import itertools
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 
 
+# Process-wide source of task versions, so a reloaded or rebuilt task never reuses a version
+_version_counter = itertools.count(1)
+
+
 @dataclass
 class Task:
     """Represents a single todo task."""
@@ -21,6 +26,9 @@ class Task:
     is_recurring: bool = False  # Whether the task repeats
     frequency: str = ""  # How often the task repeats (daily, weekly, monthly)
     due_date: Optional[str] = None  # When the task is due
+    due_at: Optional[int] = None  # Exact due time as epoch seconds, for tasks due at a time of day
+    series_anchor: Optional[str] = None  # First due date of the recurring series this instance belongs to
+    version: int = field(default=0, compare=False, repr=False)  # Changes on every mutation; not persisted
 
     def __post_init__(self):
         """Set the creation timestamp if not provided."""
@@ -30,6 +38,9 @@ class Task:
         if self.tags is None:
             self.tags = []
 
+        if not self.version:
+            self.version = next(_version_counter)
+
     @property
     def status_text(self) -> str:
         """Return a text representation of the task's completion status."""
@@ -62,6 +73,9 @@ class Task:
         if invalid_tags:
             raise ValueError(f"Tags must be one of: {', '.join(allowed_tags)}. Invalid tags: {', '.join(invalid_tags)}")
 
+        if self.due_at is not None and (not isinstance(self.due_at, int) or self.due_at < 0):
+            raise ValueError("Due timestamp must be a non-negative number of seconds since the epoch")
+
         # Validate frequency if task is recurring
         if self.is_recurring:
             allowed_frequencies = ['daily', 'weekly', 'monthly']
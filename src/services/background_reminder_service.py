@@ -3,8 +3,11 @@ Background Reminder Service
 A module that can run in the background to continuously check for upcoming tasks and send notifications.
 """
 
+import os
 import time
 from datetime import datetime
+from services import metrics, profiling
+from services.diagnostics import LeakDetector
 from services.task_service import TaskService
 from services.task_subagent import TaskSubagent
 from services.storage_engine import StorageSkill
@@ -24,7 +27,8 @@ class BackgroundReminderService:
         """
         self.check_interval = check_interval
         self.storage_skill = StorageSkill()
-        self.notification_skill = NotificationSkill()
+        self.notification_skill = NotificationSkill(
+            log_path=os.path.join(os.path.dirname(self.storage_skill.filepath), "notifications.jsonl"))
         self.time_skill = TimeSkill()
         self.running = False
         
@@ -33,27 +37,35 @@ class BackgroundReminderService:
         self.task_subagent = TaskSubagent(self.task_service)
         # Set the task_subagent reference in task_service for saving tasks
         self.task_service.set_task_subagent(self.task_subagent)
+
+        # Task ID -> (due_date, due_at) we already sent a reminder for; only tasks still in the window are kept
+        self._notified = {}
+        self._loaded_mtime = self.task_subagent.storage_skill.last_modified()
+        self.leak_detector = LeakDetector.from_environment()
     
     def check_upcoming_tasks(self):
         """Check for tasks due within the next hour and send notifications."""
-        all_tasks = self.task_service.get_all_tasks()
-        
-        for task in all_tasks:
-            if task.due_date and not task.completed:
-                # Check if the task is due within the next hour using TimeSkill
-                if self.time_skill.is_due_within_hours(task.due_date, 1):
-                    # Check if we've already notified about this task recently
-                    # to avoid spamming notifications
-                    notification_sent = getattr(task, 'notification_sent', False)
-                    if not notification_sent:
-                        self.notification_skill.send_alert(
-                            title="Upcoming Task Reminder",
-                            message=f"Task '{task.title}' is due within the next hour!"
-                        )
-                        # Mark that notification was sent for this task
-                        # In a real implementation, you might want to track this differently
-                        task.notification_sent = True
-    
+        # The due index turns the one-hour window into a range lookup instead of a scan
+        notified = {}
+        for task in self.task_subagent.get_tasks_due_within(60):
+            due = (task.due_date, task.due_at)
+            # Remind once per due time; a task moved to a new due time is reminded again
+            if self._notified.get(task.id) != due:
+                self.notification_skill.send_alert(
+                    title="Upcoming Task Reminder",
+                    message=f"Task '{task.title}' is due within the next hour!"
+                )
+            notified[task.id] = due
+        self._notified = notified
+
+    def refresh_tasks(self):
+        """Pick up changes saved by other processes, reading the file only when it changed."""
+        modified = self.task_subagent.storage_skill.last_modified()
+        if modified != self._loaded_mtime:
+            # Unchanged tasks keep their objects, so a reload does not rebuild the whole store
+            self.task_subagent.reload_tasks_from_storage()
+            self._loaded_mtime = modified
+
     def start(self):
         """Start the background reminder service."""
         print("Starting background reminder service...")
@@ -62,10 +74,16 @@ class BackgroundReminderService:
         while self.running:
             try:
                 # Reload tasks from storage to get any updates from other processes
-                self.task_subagent.load_tasks_from_storage()
+                self.refresh_tasks()
                 
                 # Check for upcoming tasks
                 self.check_upcoming_tasks()
+
+                # Keep the metrics file and profiles current (no-ops unless they are enabled)
+                metrics.dump()
+                profiling.write_profiles()
+                if self.leak_detector:
+                    self.leak_detector.check()
                 
                 # Wait for the specified interval before checking again
                 time.sleep(self.check_interval)
@@ -0,0 +1,203 @@
+"""
+Diagnostics
+Memory footprint report for the task store and a tracemalloc-based leak detector.
+
+memory_report() estimates the bytes held by the tasks, each derived index and any caches
+passed in; the scripting CLI prints it with 'todo-app diagnostics'. LeakDetector is used by
+the reminder service: when TODO_MEMORY_BUDGET_MB is set it traces allocations and, every
+TODO_LEAK_CHECK_SECONDS (default 600), compares a snapshot with the previous one and prints
+the allocation sites that grew the most if the resident set size exceeds the budget.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Objects that are shared process-wide or not owned by the structure being measured
+_OPAQUE_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def deep_size(obj: Any, seen: Optional[set] = None) -> int:
+    """
+    Estimate the bytes reachable from an object that were not already counted.
+
+    Follows containers, instance dictionaries and slots. Pass the same seen set to several calls
+    to count shared objects (e.g. tasks referenced by an index) only once.
+
+    Args:
+        obj: Object to measure
+        seen: IDs of objects already counted; updated in place
+
+    Returns:
+        Size in bytes
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    pending = deque([obj])
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, _OPAQUE_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            pending.extend(current)
+        elif not isinstance(current, (str, bytes, int, float, bool)):
+            if hasattr(current, '__dict__'):
+                pending.append(vars(current))
+            for name in getattr(type(current), '__slots__', ()):
+                if hasattr(current, name):
+                    pending.append(getattr(current, name))
+    return total
+
+
+def current_rss() -> Optional[int]:
+    """Return the resident set size of this process in bytes, or None if it cannot be read."""
+    try:
+        with open('/proc/self/status', encoding='ascii') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    if resource is not None:
+        # Peak rather than current size; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    return None
+
+
+def memory_report(task_service, task_subagent=None, caches: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Report the memory held by the task store, its derived indexes and caches.
+
+    Each entry only counts objects not already counted by an earlier one, so index sizes
+    exclude the tasks they point to.
+
+    Args:
+        task_service: Service holding the tasks
+        task_subagent: Subagent owning the indexes and storage, if any
+        caches: Additional caches by name, e.g. {'row_cache': display_subagent.row_cache}
+
+    Returns:
+        Dictionary with task count, bytes per task, index and cache sizes and process memory
+    """
+    seen: set = set()
+    with task_service.lock.read():
+        count = len(task_service.tasks)
+        task_bytes = deep_size(task_service.tasks, seen)
+        indexes = {}
+        if task_subagent is not None:
+            indexes['due_index'] = deep_size(task_subagent.due_index, seen)
+            indexes['recurrence_horizon'] = deep_size(task_subagent.recurrence_horizon, seen)
+            # Text indexes are built on first use
+            for name in ('word_index', 'ranked_index', 'prefix_index'):
+                index = getattr(task_subagent, name)
+                if index is not None:
+                    indexes[name] = deep_size(index, seen)
+            # Copy of the stored records kept for three-way merges on save
+            indexes['storage_merge_base'] = deep_size(task_subagent.storage_skill._base, seen)
+
+    cache_sizes = {}
+    for name, cache in (caches or {}).items():
+        cache_sizes[name] = {'entries': len(cache), 'bytes': deep_size(cache, seen)}
+
+    report = {
+        'tasks': count,
+        'task_bytes': task_bytes,
+        'bytes_per_task': round(task_bytes / count) if count else 0,
+        'indexes': indexes,
+        'caches': cache_sizes,
+        'rss_bytes': current_rss(),
+    }
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        report['traced_bytes'] = {'current': current, 'peak': peak}
+    return report
+
+
+class LeakDetector:
+    """Periodically diffs tracemalloc snapshots and reports growing allocation sites over an RSS budget."""
+
+    def __init__(self, budget_bytes: int, interval: float = 600.0, top: int = 10, frames: int = 1):
+        """
+        Start tracing allocations.
+
+        Args:
+            budget_bytes: Resident set size above which growth is reported
+            interval: Minimum seconds between snapshots
+            top: Number of allocation sites to report
+            frames: Stack frames stored per allocation (more frames, more overhead)
+        """
+        self.budget_bytes = budget_bytes
+        self.interval = interval
+        self.top = top
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._next_check = 0.0
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    @classmethod
+    def from_environment(cls) -> Optional["LeakDetector"]:
+        """Create a detector from TODO_MEMORY_BUDGET_MB and TODO_LEAK_CHECK_SECONDS, or None if unset."""
+        budget = os.environ.get('TODO_MEMORY_BUDGET_MB')
+        if not budget:
+            return None
+        try:
+            return cls(int(float(budget) * 1024 * 1024), float(os.environ.get('TODO_LEAK_CHECK_SECONDS', 600)))
+        except ValueError:
+            print("Warning: TODO_MEMORY_BUDGET_MB and TODO_LEAK_CHECK_SECONDS must be numbers; leak detection is off.")
+            return None
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+
+    def check(self) -> Optional[List[str]]:
+        """
+        Take a snapshot if the interval has passed and report growth if over budget.
+
+        Returns:
+            The reported allocation sites, or None if nothing was reported
+        """
+        now = time.monotonic()
+        if now < self._next_check:
+            return None
+        self._next_check = now + self.interval
+
+        snapshot = self._snapshot()
+        previous, self._previous = self._previous, snapshot
+        rss = current_rss()
+        if previous is None or rss is None or rss <= self.budget_bytes:
+            return None
+
+        growing = [stat for stat in snapshot.compare_to(previous, 'lineno') if stat.size_diff > 0][:self.top]
+        lines = []
+        for stat in growing:
+            frame = stat.traceback[-1]
+            lines.append(f"{frame.filename}:{frame.lineno} +{stat.size_diff / 1024:.1f} KiB "
+                         f"({stat.count_diff:+d} blocks, {stat.size / 1024:.1f} KiB total)")
+        print(f"Warning: memory use {rss / 1024 / 1024:.1f} MiB exceeds the budget of "
+              f"{self.budget_bytes / 1024 / 1024:.1f} MiB. Largest growth since the last check:")
+        for line in lines:
+            print(f"  {line}")
+        return lines
@@ -0,0 +1,125 @@
+"""
+Due Index
+Keeps tasks ordered by due time so reminder windows are range lookups instead of scans.
+"""
+
+import bisect
+import math
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+
+class DueIndex:
+    """
+    Sorted index of open tasks by due time.
+
+    Tasks with an exact due time are kept in a list of (epoch seconds, task ID) pairs sorted
+    with bisect. Date-only tasks are bucketed by their due date, since they count as due for
+    the whole day.
+    """
+
+    def __init__(self):
+        self._entries: List[Tuple[int, int]] = []
+        self._due_at: Dict[int, int] = {}
+        self._by_day: Dict[str, set] = {}
+        self._day: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._due_at) + len(self._day)
+
+    def rebuild(self, tasks) -> None:
+        """Index all tasks from scratch."""
+        self._entries = []
+        self._due_at = {}
+        self._by_day = {}
+        self._day = {}
+        for task in tasks:
+            if task.completed:
+                continue
+            if task.due_at is not None:
+                self._due_at[task.id] = task.due_at
+                self._entries.append((task.due_at, task.id))
+            elif task.due_date:
+                self._day[task.id] = task.due_date
+                self._by_day.setdefault(task.due_date, set()).add(task.id)
+        self._entries.sort()
+
+    def update_task(self, task) -> None:
+        """Re-index a task after it was created or changed; completed tasks are dropped."""
+        self.remove_task(task.id)
+        if task.completed:
+            return
+        if task.due_at is not None:
+            self._due_at[task.id] = task.due_at
+            bisect.insort(self._entries, (task.due_at, task.id))
+        elif task.due_date:
+            self._day[task.id] = task.due_date
+            self._by_day.setdefault(task.due_date, set()).add(task.id)
+
+    def update_tasks(self, tasks) -> None:
+        """Re-index many tasks at once, with one sort instead of an insertion per task."""
+        tasks = list(tasks)
+        self.remove_tasks([task.id for task in tasks])
+        for task in tasks:
+            if task.completed:
+                continue
+            if task.due_at is not None:
+                self._due_at[task.id] = task.due_at
+                self._entries.append((task.due_at, task.id))
+            elif task.due_date:
+                self._day[task.id] = task.due_date
+                self._by_day.setdefault(task.due_date, set()).add(task.id)
+        # The existing entries are one sorted run, so this sort is close to a merge
+        self._entries.sort()
+
+    def remove_tasks(self, task_ids) -> None:
+        """Remove many tasks with a single pass over the sorted entries."""
+        timed = set()
+        for task_id in task_ids:
+            if self._due_at.pop(task_id, None) is not None:
+                timed.add(task_id)
+            day = self._day.pop(task_id, None)
+            if day is not None:
+                bucket = self._by_day[day]
+                bucket.discard(task_id)
+                if not bucket:
+                    del self._by_day[day]
+        if timed:
+            self._entries = [entry for entry in self._entries if entry[1] not in timed]
+
+    def remove_task(self, task_id: int) -> None:
+        """Remove a task from the index if present."""
+        due_at = self._due_at.pop(task_id, None)
+        if due_at is not None:
+            position = bisect.bisect_left(self._entries, (due_at, task_id))
+            del self._entries[position]
+        day = self._day.pop(task_id, None)
+        if day is not None:
+            bucket = self._by_day[day]
+            bucket.discard(task_id)
+            if not bucket:
+                del self._by_day[day]
+
+    def due_between(self, start: int, end: int) -> List[int]:
+        """Return IDs of tasks with an exact due time in [start, end], ordered by due time."""
+        low = bisect.bisect_left(self._entries, (start, -1))
+        high = bisect.bisect_right(self._entries, (end, float('inf')))
+        return [task_id for _, task_id in self._entries[low:high]]
+
+    def due_on(self, day: str) -> List[int]:
+        """Return IDs of date-only tasks due on the given date (YYYY-MM-DD)."""
+        return sorted(self._by_day.get(day, ()))
+
+    def due_within(self, minutes: int, now: Optional[float] = None) -> List[int]:
+        """
+        Return IDs of tasks due within the next number of minutes.
+
+        Matches TimeSkill.is_task_due_within: exact due times must fall in [now, now + minutes],
+        date-only tasks match when now + minutes falls on their due date.
+        """
+        if now is None:
+            now = datetime.now().timestamp()
+        end = now + minutes * 60
+        task_ids = self.due_between(math.ceil(now), math.floor(end))
+        task_ids.extend(self.due_on(date.fromtimestamp(end).isoformat()))
+        return task_ids
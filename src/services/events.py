@@ -0,0 +1,193 @@
+"""
+Events
+Publish/subscribe for task changes, so indexes, caches and views can update incrementally.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from models.task import Task
+
+
+EVENT_KINDS = ('created', 'updated', 'deleted', 'toggled')
+
+# Fields compared by TaskEvent.changes
+_EVENT_FIELDS = ('title', 'description', 'completed', 'priority', 'tags', 'is_recurring',
+                 'frequency', 'due_date', 'due_at')
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    """
+    One change to the task store.
+
+    Stored tasks are replaced rather than modified, so old and new are the task as it was
+    before and after the change. old is None for 'created' and new is None for 'deleted'.
+    """
+    kind: str
+    task_id: int
+    old: Optional[Task]
+    new: Optional[Task]
+
+    @property
+    def changes(self) -> Dict[str, Tuple[Any, Any]]:
+        """Return field -> (old value, new value) for every field that differs."""
+        result = {}
+        for name in _EVENT_FIELDS:
+            before = getattr(self.old, name) if self.old is not None else None
+            after = getattr(self.new, name) if self.new is not None else None
+            if before != after:
+                result[name] = (before, after)
+        return result
+
+
+class Subscription:
+    """Handle returned by EventBus.subscribe; pass it to unsubscribe."""
+
+    def __init__(self, callback: Callable[[TaskEvent], None], kinds: Optional[Iterable[str]]):
+        self.callback = callback
+        self.kinds = frozenset(kinds) if kinds is not None else None
+        self.failed = 0
+
+    def wants(self, event: TaskEvent) -> bool:
+        return self.kinds is None or event.kind in self.kinds
+
+    def deliver(self, event: TaskEvent) -> None:
+        """Call the subscriber; a failing subscriber never breaks the change that was published."""
+        try:
+            self.callback(event)
+        except Exception as e:
+            self.failed += 1
+            print(f"Warning: event subscriber {getattr(self.callback, '__qualname__', self.callback)} failed: {e}")
+
+    def offer(self, event: TaskEvent) -> None:
+        self.deliver(event)
+
+    def drain(self, timeout: float) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class QueuedSubscription(Subscription):
+    """Subscription whose events are delivered in order on its own background thread."""
+
+    def __init__(self, callback: Callable[[TaskEvent], None], kinds: Optional[Iterable[str]], max_queue: int):
+        super().__init__(callback, kinds)
+        self.max_queue = max_queue
+        self.dropped = 0
+        # deque.append is atomic, so publishing is one append; the worker is only woken when idle
+        self._queue: deque = deque()
+        self._wakeup = threading.Event()
+        self._idle = False
+        self._offered = 0
+        self._delivered = 0
+        self._closed = False
+        self.thread = threading.Thread(target=self._run, name="task-events", daemon=True)
+        self.thread.start()
+
+    def offer(self, event: TaskEvent) -> None:
+        """Queue an event without blocking the publisher; a full queue drops it."""
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        self._offered += 1
+        self._queue.append(event)
+        if self._idle:
+            self._wakeup.set()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                event = self._queue.popleft()
+            except IndexError:
+                if self._closed:
+                    return
+                self._idle = True
+                if not self._queue and not self._closed:  # Re-check after announcing we are idle
+                    self._wakeup.wait()
+                self._wakeup.clear()
+                self._idle = False
+                continue
+            self.deliver(event)
+            self._delivered += 1
+
+    def drain(self, timeout: float) -> bool:
+        """Wait until every queued event was delivered; returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._delivered < self._offered:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def close(self) -> None:
+        """Deliver what is queued, then stop the thread."""
+        self._closed = True
+        self._wakeup.set()
+        self.thread.join(timeout=5.0)
+
+
+class EventBus:
+    """
+    Fans TaskEvents out to subscribers.
+
+    Synchronous subscribers run in the publishing thread right after the change; queued
+    subscribers get their own thread and queue, so slow consumers never delay mutations.
+    Publishers check has_subscribers first, so an unobserved store pays almost nothing.
+    """
+
+    def __init__(self):
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Return True if anyone is listening."""
+        return bool(self._subscriptions)
+
+    def subscribe(self, callback: Callable[[TaskEvent], None], kinds: Optional[Iterable[str]] = None,
+                  queued: bool = False, max_queue: int = 10000) -> Subscription:
+        """
+        Register a callback for task events.
+
+        Args:
+            callback: Called with each TaskEvent
+            kinds: Only deliver these kinds (default: all of EVENT_KINDS)
+            queued: Deliver on a background thread instead of in the publishing thread
+            max_queue: For queued subscribers, events buffered before new ones are dropped
+
+        Returns:
+            Subscription handle for unsubscribe
+        """
+        if kinds is not None:
+            unknown = set(kinds) - set(EVENT_KINDS)
+            if unknown:
+                raise ValueError(f"Event kinds must be among: {', '.join(EVENT_KINDS)}")
+        subscription = QueuedSubscription(callback, kinds, max_queue) if queued else Subscription(callback, kinds)
+        with self._lock:
+            # Replace the tuple instead of mutating it, so publish never needs the lock
+            self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription; queued ones deliver what is already queued first."""
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+        subscription.close()
+
+    def publish(self, event: TaskEvent) -> None:
+        """Deliver an event to every interested subscriber."""
+        for subscription in self._subscriptions:
+            if subscription.wants(event):
+                subscription.offer(event)
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """Wait for queued subscribers to catch up; returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        return all(subscription.drain(max(0.0, deadline - time.monotonic()))
+                   for subscription in self._subscriptions)
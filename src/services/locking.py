@@ -0,0 +1,100 @@
+"""
+Locking
+Reader-writer lock used to share the task store between threads.
+"""
+
+import threading
+from contextlib import contextmanager
+
+from services import metrics
+
+
+class ReadWriteLock:
+    """
+    Reader-writer lock that lets many readers in at once and one writer at a time.
+
+    Writers are preferred: once a writer is waiting, new readers wait behind it, so a steady
+    stream of searches cannot starve saves. The writing thread may take the read or write lock
+    again while it holds the write lock, and a thread already reading may read again.
+    """
+
+    def __init__(self):
+        """Initialize an unlocked lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers_waiting = 0
+        self._writer = None  # Ident of the thread holding the write lock
+        self._write_depth = 0
+        self._local = threading.local()  # Per-thread read depth
+
+    def acquire_read(self) -> None:
+        """Take the lock for reading."""
+        me = threading.get_ident()
+        depth = getattr(self._local, 'depth', 0)
+        with self._cond:
+            if self._writer == me or depth:
+                # Reentrant read: waiting for a writer here would deadlock against ourselves
+                self._readers += 1
+            else:
+                if self._writer is not None or self._writers_waiting:
+                    with metrics.timed('todo_lock_wait_seconds'):  # Only contended acquisitions are timed
+                        while self._writer is not None or self._writers_waiting:
+                            self._cond.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+
+    def release_read(self) -> None:
+        """Release a read lock."""
+        self._local.depth -= 1
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Take the lock for writing."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if getattr(self._local, 'depth', 0):
+                raise RuntimeError("Cannot upgrade a read lock to a write lock")
+            self._writers_waiting += 1
+            try:
+                if self._writer is not None or self._readers:
+                    with metrics.timed('todo_lock_wait_seconds'):
+                        while self._writer is not None or self._readers:
+                            self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        """Release a write lock."""
+        with self._cond:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("Write lock released by a thread that does not hold it")
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read(self):
+        """Context manager holding the read lock."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """Context manager holding the write lock."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,315 @@
+"""
+Metrics
+Counters, gauges and latency histograms for the hot paths, dumped as JSON or Prometheus text.
+
+Metrics are off unless TODO_METRICS is set to a non-empty value other than '0'. While they are
+off, every recording function returns after one flag check and timed() hands out a shared
+no-op context manager, so instrumented code pays next to nothing.
+
+When TODO_METRICS_FILE is also set, a snapshot is written there when the process exits (the
+reminder service also writes it after every check). Files ending in '.prom' or '.txt' get the
+Prometheus text format, anything else JSON. The API server serves the same data at /metrics.
+"""
+
+import atexit
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Optional, Tuple
+
+
+# Latency buckets in seconds, from 100 microseconds to 10 seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                                      0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Help text for every metric the application records
+DESCRIPTIONS = {
+    'todo_storage_load_seconds': "Time to read the task file",
+    'todo_storage_save_seconds': "Time to write the task file, including merges",
+    'todo_storage_merges_total': "Saves merged with changes from another process",
+    'todo_storage_errors_total': "Failed loads and saves",
+    'todo_tasks': "Tasks in the store as of the last load or save",
+    'todo_lock_wait_seconds': "Time spent waiting for the task store lock when it was contended",
+    'todo_index_update_seconds': "Time to update the due index and recurrence horizon after changes",
+    'todo_index_rebuild_seconds': "Time to rebuild the due index and recurrence horizon after a load",
+    'todo_search_seconds': "Time to run find_tasks",
+    'todo_sort_seconds': "Time to run get_ordered_tasks",
+    'todo_validation_seconds': "Time to validate a task",
+    'todo_validation_errors_total': "Tasks rejected by validation",
+    'todo_notifications_total': "Notifications queued for delivery",
+    'todo_notifications_dropped_total': "Notifications dropped because a sink queue was full",
+    'todo_notifications_failed_total': "Notifications a sink failed to deliver",
+    'todo_notification_batch_seconds': "Time for a sink to deliver one batch",
+}
+
+
+class Counter:
+    """A value that only goes up."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> float:
+        return self.value
+
+
+class Gauge(Counter):
+    """A value that can go up and down."""
+
+    kind = 'gauge'
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Histogram:
+    """Counts observations in cumulative buckets, plus their sum."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, description: str, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot counts observations above every bucket
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative, seen = {}, 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            cumulative[str(bound)] = seen
+        cumulative['+Inf'] = self.count
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'p50': self.quantile(0.50),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': cumulative,
+        }
+
+
+class MetricsRegistry:
+    """Holds metrics by name; metrics are created on first use."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, factory):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = factory(name, DESCRIPTIONS.get(name, ""))
+                    self._metrics[name] = metric
+        return metric
+
+    def counter(self, name: str) -> Counter:
+        return self._get(name, Counter)
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get(name, Gauge)
+
+    def histogram(self, name: str) -> Histogram:
+        return self._get(name, Histogram)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return every metric as a JSON-serializable dictionary grouped by kind."""
+        result: Dict[str, Any] = {'timestamp': time.time(), 'counters': {}, 'gauges': {}, 'histograms': {}}
+        for name, metric in sorted(self._metrics.items()):
+            result[metric.kind + 's'][name] = metric.snapshot()
+        return result
+
+    def prometheus(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            if metric.description:
+                lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            if metric.kind != 'histogram':
+                lines.append(f"{name} {metric.value}")
+                continue
+            for bound, count in metric.snapshot()['buckets'].items():
+                lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f"{name}_sum {metric.sum}")
+            lines.append(f"{name}_count {metric.count}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+_enabled = os.environ.get('TODO_METRICS', '') not in ('', '0')
+_NO_TIMER = nullcontext()
+_phase_hook = None  # Set by services.profiling while it records the phases of slow operations
+
+
+def enabled() -> bool:
+    """Return True if metrics are being recorded."""
+    return _enabled
+
+
+def enable(on: bool = True) -> None:
+    """Turn recording on or off at runtime, e.g. for benchmarks."""
+    global _enabled
+    _enabled = on
+
+
+def set_phase_hook(hook) -> None:
+    """
+    Route timed blocks through hook(name, histogram or None), which returns the context manager to use.
+
+    services.profiling uses this to record every timed block as a phase of the running operation.
+    """
+    global _phase_hook
+    _phase_hook = hook
+
+
+def increment(name: str, amount: float = 1) -> None:
+    """Add to a counter."""
+    if _enabled:
+        REGISTRY.counter(name).inc(amount)
+
+
+def set_gauge(name: str, value: float) -> None:
+    """Set a gauge."""
+    if _enabled:
+        REGISTRY.gauge(name).set(value)
+
+
+def observe(name: str, value: float) -> None:
+    """Record one observation, in seconds for latency histograms."""
+    if _enabled:
+        REGISTRY.histogram(name).observe(value)
+
+
+class _Timer:
+    """Context manager that records its duration in a histogram."""
+
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+def timed(name: str):
+    """
+    Time a block into a latency histogram.
+
+    Usage:
+        with metrics.timed('todo_search_seconds'):
+            ...
+    """
+    if _phase_hook is not None:
+        return _phase_hook(name, REGISTRY.histogram(name) if _enabled else None)
+    if not _enabled:
+        return _NO_TIMER
+    return _Timer(REGISTRY.histogram(name))
+
+
+def timed_call(name: str):
+    """Decorator that times every call of a function into a latency histogram."""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled and _phase_hook is None:
+                return function(*args, **kwargs)
+            with timed(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def snapshot() -> Dict[str, Any]:
+    """Return all metrics as a dictionary."""
+    return REGISTRY.snapshot()
+
+
+def prometheus_text() -> str:
+    """Return all metrics in the Prometheus text format."""
+    return REGISTRY.prometheus()
+
+
+def dump(path: Optional[str] = None) -> Optional[str]:
+    """
+    Write a snapshot to a file, as Prometheus text for '.prom' and '.txt' files and JSON otherwise.
+
+    Args:
+        path: File to write (default: TODO_METRICS_FILE)
+
+    Returns:
+        The path written, or None if there was nothing to write or writing failed
+    """
+    path = path or os.environ.get('TODO_METRICS_FILE')
+    if not path or not _enabled:
+        return None
+    try:
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        if path.endswith(('.prom', '.txt')):
+            content = prometheus_text()
+        else:
+            content = json.dumps(snapshot(), indent=2) + "\n"
+        # Write and rename, so a scraper never reads half a file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        os.replace(temp_path, path)
+        return path
+    except OSError as e:
+        print(f"Warning: could not write metrics to {path}: {e}")
+        return None
+
+
+if _enabled and os.environ.get('TODO_METRICS_FILE'):
+    atexit.register(dump)
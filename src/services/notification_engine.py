@@ -1,85 +1,97 @@
 """
 Notification Engine
-Handles sending desktop notifications using the best available library for Python.
+Handles sending notifications through pluggable sinks (desktop, log file, webhook).
 """
 
-import sys
-import os
-from typing import Optional
+import atexit
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+# services.notification_sinks (and the http.client machinery behind the webhook sink) is
+# imported on the first alert, keeping it off the startup path of every entry point.
+if TYPE_CHECKING:
+    from services.notification_sinks import NotificationSink, SinkDispatcher
 
-class NotificationSkill:
-    """Generic notification handling class for sending desktop alerts."""
-    
-    def __init__(self):
-        """Initialize the notification skill with the best available library."""
-        self.notification_lib = self._find_best_notification_library()
-    
-    def _find_best_notification_library(self):
-        """Find and return the best available notification library."""
-        # Try different notification libraries in order of preference
-        libraries_to_try = [
-            ('plyer', self._init_plyer),
-            ('win10toast', self._init_win10toast),
-            ('plyer_fork', self._init_plyer),
-        ]
-        
-        for lib_name, init_func in libraries_to_try:
-            try:
-                return init_func()
-            except ImportError:
-                continue
-        
-        # If no library is available, return None
-        print(f"Warning: No notification library found. Install 'plyer' or 'win10toast' for notifications.")
+
+# Environment-configured dispatchers by notification log path
+_default_dispatchers: Dict[str, Optional["SinkDispatcher"]] = {}
+_default_dispatcher_lock = threading.Lock()
+
+
+def _get_default_dispatcher(log_path: Optional[str] = None) -> Optional["SinkDispatcher"]:
+    """Build the environment-configured dispatcher once per log file and share it across the process."""
+    from services.notification_sinks import notification_log_path, sinks_from_environment
+    log_path = notification_log_path(log_path)
+    with _default_dispatcher_lock:
+        if log_path not in _default_dispatchers:
+            _default_dispatchers[log_path] = _build_dispatcher(sinks_from_environment(log_path))
+        return _default_dispatchers[log_path]
+
+
+def _build_dispatcher(sinks: List["NotificationSink"]) -> Optional["SinkDispatcher"]:
+    """Create a dispatcher for the sinks, or warn and return None when there are none."""
+    from services.notification_sinks import SinkDispatcher
+    if not sinks:
+        print("Warning: No notification sink available. Install 'plyer' or 'win10toast', "
+              "or set TODO_NOTIFICATION_SINKS=log.")
         return None
-    
-    def _init_plyer(self):
-        """Initialize plyer notification library."""
-        from plyer import notification
-        return notification
-    
-    def _init_win10toast(self):
-        """Initialize win10toast notification library."""
-        from win10toast import ToastNotifier
-        return ToastNotifier()
-    
+    dispatcher = SinkDispatcher(sinks)
+    # Deliver queued notifications before a short-lived process exits
+    atexit.register(dispatcher.close)
+    return dispatcher
+
+
+class NotificationSkill:
+    """Generic notification handling class that fans alerts out to notification sinks."""
+
+    def __init__(self, sinks: Optional[List["NotificationSink"]] = None, log_path: Optional[str] = None):
+        """
+        Initialize the notification skill.
+
+        Nothing is imported or started here: sinks and their worker threads are set up on the
+        first send_alert, so constructing the skill costs nothing on launches that never alert.
+
+        Args:
+            sinks: Sinks to deliver to (default: configured from the environment and shared process-wide)
+            log_path: File for the log sink when TODO_NOTIFICATION_LOG is unset, e.g. next to the
+                task store (default: data/notifications.jsonl)
+        """
+        self._sinks = sinks
+        self._log_path = log_path
+        self._dispatcher: Optional["SinkDispatcher"] = None
+        self._resolved = False
+
+    @property
+    def dispatcher(self) -> Optional["SinkDispatcher"]:
+        """Return the dispatcher, creating it on first use."""
+        if not self._resolved:
+            if self._sinks is None:
+                self._dispatcher = _get_default_dispatcher(self._log_path)
+            else:
+                self._dispatcher = _build_dispatcher(self._sinks)
+            self._resolved = True
+        return self._dispatcher
+
     def send_alert(self, title: str, message: str) -> bool:
         """
-        Send a desktop notification with the given title and message.
-        
+        Send a notification with the given title and message to every sink.
+
+        Delivery happens on per-sink background threads, so a slow sink never blocks the caller.
+
         Args:
             title: Title of the notification
             message: Content of the notification
-            
+
         Returns:
-            True if notification was sent successfully, False otherwise
+            True if at least one sink accepted the notification, False otherwise
         """
-        if not self.notification_lib:
+        dispatcher = self.dispatcher
+        if not dispatcher:
             return False
-        
-        try:
-            # Try to send notification using plyer
-            if hasattr(self.notification_lib, 'notify'):
-                # This is plyer
-                self.notification_lib.notify(
-                    title=title,
-                    message=message,
-                    timeout=5  # Notification timeout in seconds
-                )
-                return True
-            elif hasattr(self.notification_lib, 'show_toast'):
-                # This is win10toast
-                self.notification_lib.show_toast(
-                    title=title,
-                    msg=message,
-                    duration=5,  # Duration in seconds
-                    threaded=True  # Run in background thread
-                )
-                return True
-            else:
-                # Unknown library type
-                return False
-        except Exception as e:
-            print(f"Error sending notification: {e}")
-            return False
\ No newline at end of file
+        return dispatcher.dispatch(title, message)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for queued notifications to be delivered."""
+        if not self._resolved or not self._dispatcher:
+            return True
+        return self._dispatcher.flush(timeout)
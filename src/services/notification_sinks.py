@@ -0,0 +1,441 @@
+"""
+Notification Sinks
+Pluggable destinations for reminders: desktop libraries, a rotating JSON-lines log file
+and a local webhook, plus a fan-out dispatcher that batches per sink.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from services import metrics
+
+
+class NotificationSink:
+    """Base class for a notification destination."""
+
+    name = "sink"
+    batch_size = 50  # Maximum notifications handed to send_batch at once
+    flush_interval = 0.5  # Seconds to wait for more notifications before flushing a batch
+
+    def send_batch(self, notifications: List[Dict[str, Any]]) -> bool:
+        """
+        Deliver a batch of notifications.
+
+        Args:
+            notifications: List of dictionaries with 'title', 'message' and 'timestamp'
+
+        Returns:
+            True if the batch was delivered, False otherwise
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the sink."""
+
+
+_UNRESOLVED = object()
+_desktop_library = _UNRESOLVED
+_desktop_library_lock = threading.Lock()
+
+
+def _init_plyer():
+    """Initialize plyer notification library."""
+    from plyer import notification
+    return notification
+
+
+def _init_win10toast():
+    """Initialize win10toast notification library."""
+    from win10toast import ToastNotifier
+    return ToastNotifier()
+
+
+def resolve_desktop_library():
+    """
+    Find the best available desktop notification library.
+
+    Importing plyer is expensive, so the lookup only happens the first time a desktop
+    notification is actually needed and its result is cached for the whole process.
+
+    Returns:
+        The plyer notification facade, a win10toast ToastNotifier, or None
+    """
+    global _desktop_library
+    if _desktop_library is not _UNRESOLVED:
+        return _desktop_library
+
+    with _desktop_library_lock:
+        if _desktop_library is _UNRESOLVED:
+            library = None
+            # Try different notification libraries in order of preference
+            for init_func in (_init_plyer, _init_win10toast):
+                try:
+                    library = init_func()
+                    break
+                except ImportError:
+                    continue
+            _desktop_library = library
+    return _desktop_library
+
+
+class DesktopSink(NotificationSink):
+    """Sink that shows desktop notifications using plyer or win10toast."""
+
+    name = "desktop"
+    batch_size = 1  # Desktop popups are shown one by one
+
+    @property
+    def notification_lib(self):
+        """Return the desktop library, resolving it on first use."""
+        return resolve_desktop_library()
+
+    @property
+    def available(self) -> bool:
+        """Return True if a desktop notification library was found."""
+        return self.notification_lib is not None
+
+    def send_batch(self, notifications: List[Dict[str, Any]]) -> bool:
+        """Show each notification as a desktop popup."""
+        notification_lib = self.notification_lib
+        if not notification_lib:
+            return False
+
+        for notification in notifications:
+            if hasattr(notification_lib, 'notify'):
+                # This is plyer
+                notification_lib.notify(
+                    title=notification['title'],
+                    message=notification['message'],
+                    timeout=5  # Notification timeout in seconds
+                )
+            elif hasattr(notification_lib, 'show_toast'):
+                # This is win10toast
+                notification_lib.show_toast(
+                    title=notification['title'],
+                    msg=notification['message'],
+                    duration=5,  # Duration in seconds
+                    threaded=True  # Run in background thread
+                )
+            else:
+                # Unknown library type
+                return False
+        return True
+
+
+class JsonLinesFileSink(NotificationSink):
+    """Sink that appends notifications to a size-rotated JSON-lines file."""
+
+    name = "log"
+
+    def __init__(self, filepath: str = "data/notifications.jsonl", max_bytes: int = 1024 * 1024,
+                 backup_count: int = 3):
+        """
+        Initialize the log sink.
+
+        Args:
+            filepath: Path of the JSON-lines file (default: data/notifications.jsonl)
+            max_bytes: Size after which the file is rotated (default: 1 MiB)
+            backup_count: Number of rotated files to keep (default: 3)
+        """
+        self.filepath = filepath
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        directory = os.path.dirname(filepath)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def _rotate(self) -> None:
+        """Shift notifications.jsonl -> .1 -> .2 ... dropping the oldest backup."""
+        if self.backup_count <= 0:
+            os.remove(self.filepath)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.filepath}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.filepath}.{index + 1}")
+        os.replace(self.filepath, f"{self.filepath}.1")
+
+    def send_batch(self, notifications: List[Dict[str, Any]]) -> bool:
+        """Append the batch to the log file in a single write."""
+        lines = "".join(json.dumps(notification, ensure_ascii=False) + "\n" for notification in notifications)
+        if os.path.exists(self.filepath) and os.path.getsize(self.filepath) + len(lines) > self.max_bytes:
+            self._rotate()
+        with open(self.filepath, 'a', encoding='utf-8') as file:
+            file.write(lines)
+        return True
+
+
+def _unix_http_connection(socket_path: str, timeout: float):
+    """Create an HTTP connection that talks over a Unix domain socket instead of TCP."""
+    import http.client
+    import socket
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        def connect(self):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(self.timeout)
+            self.sock.connect(socket_path)
+
+    return UnixHTTPConnection("localhost", timeout=timeout)
+
+
+class WebhookSink(NotificationSink):
+    """
+    Sink that POSTs batches as a JSON array to a local HTTP or Unix-socket webhook.
+
+    A batch that fails with a connection error or a 5xx answer is sent again after a short,
+    doubling delay; 4xx answers are not retried since resending the same batch cannot help.
+    """
+
+    name = "webhook"
+
+    def __init__(self, url: str, timeout: float = 5.0, retries: int = 2, retry_delay: float = 0.2):
+        """
+        Initialize the webhook sink.
+
+        Args:
+            url: Either http://host:port/path or unix:///path/to.sock (optionally unix:///path/to.sock:/path)
+            timeout: Socket timeout in seconds (default: 5)
+            retries: Extra attempts for a batch that failed with a connection error or 5xx (default: 2)
+            retry_delay: Seconds before the first retry, doubled for each further one (default: 0.2)
+        """
+        from urllib.parse import urlparse, unquote
+
+        self.url = url
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        parsed = urlparse(url)
+        if parsed.scheme == 'unix':
+            socket_path, _, request_path = unquote(parsed.path).partition(':')
+            self.socket_path = socket_path
+            self.request_path = request_path or "/"
+            self.host = None
+            self.port = None
+        elif parsed.scheme == 'http':
+            self.socket_path = None
+            self.host = parsed.hostname
+            self.port = parsed.port or 80
+            self.request_path = parsed.path or "/"
+        else:
+            raise ValueError(f"Unsupported webhook URL scheme: {parsed.scheme!r}")
+
+    def _connect(self):
+        if self.socket_path:
+            return _unix_http_connection(self.socket_path, self.timeout)
+        import http.client
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _post(self, body: bytes) -> int:
+        """POST the body once and return the response status."""
+        connection = self._connect()
+        try:
+            connection.request("POST", self.request_path, body=body,
+                               headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+    def send_batch(self, notifications: List[Dict[str, Any]]) -> bool:
+        """POST the batch, retrying transient failures, and report whether a 2xx answer came back."""
+        body = json.dumps(notifications, ensure_ascii=False).encode('utf-8')
+        delay = self.retry_delay
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                status = self._post(body)
+            except OSError:
+                if last_attempt:
+                    raise
+            else:
+                if status < 500 or last_attempt:
+                    return 200 <= status < 300
+            time.sleep(delay)
+            delay *= 2
+        return False
+
+
+class _SinkWorker:
+    """Background thread that owns one sink and delivers its batches."""
+
+    def __init__(self, sink: NotificationSink, max_queue: int):
+        self.sink = sink
+        self.queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.failed = 0
+        self.thread = threading.Thread(target=self._run, name=f"notify-{sink.name}", daemon=True)
+        self.thread.start()
+
+    def offer(self, notification: Dict[str, Any]) -> bool:
+        """Queue a notification without blocking; a full queue drops it."""
+        try:
+            self.queue.put_nowait(notification)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            metrics.increment('todo_notifications_dropped_total')
+            return False
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.sink.flush_interval
+            while len(batch) < self.sink.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                with metrics.timed('todo_notification_batch_seconds'):
+                    delivered = self.sink.send_batch(batch)
+                if not delivered:
+                    self.failed += len(batch)
+                    metrics.increment('todo_notifications_failed_total', len(batch))
+            except Exception as e:
+                self.failed += len(batch)
+                metrics.increment('todo_notifications_failed_total', len(batch))
+                print(f"Error sending notification via {self.sink.name}: {e}")
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self.queue.task_done()
+
+            if stop:
+                return
+
+
+class SinkDispatcher:
+    """Fans notifications out to several sinks, each with its own queue and thread."""
+
+    def __init__(self, sinks: List[NotificationSink], max_queue: int = 1000):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            sinks: Sinks to deliver to
+            max_queue: Maximum notifications buffered per sink before new ones are dropped
+        """
+        self.workers = [_SinkWorker(sink, max_queue) for sink in sinks]
+
+    def dispatch(self, title: str, message: str) -> bool:
+        """
+        Queue a notification for every sink.
+
+        A slow sink only fills its own queue, so it never delays the others.
+
+        Returns:
+            True if at least one sink accepted the notification
+        """
+        notification = {
+            'title': title,
+            'message': message,
+            'timestamp': datetime.now().isoformat(),
+        }
+        metrics.increment('todo_notifications_total')
+        accepted = False
+        for worker in self.workers:
+            accepted = worker.offer(notification) or accepted
+        return accepted
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued notification was handed to its sink."""
+        deadline = time.monotonic() + timeout
+        for worker in self.workers:
+            while worker.queue.unfinished_tasks:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending notifications and stop all worker threads."""
+        deadline = time.monotonic() + timeout
+        for worker in self.workers:
+            try:
+                worker.queue.put(None, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                continue
+        for worker in self.workers:
+            worker.thread.join(max(0.0, deadline - time.monotonic()))
+            worker.sink.close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return queued, dropped and failed counts per sink."""
+        stats = {}
+        for index, worker in enumerate(self.workers):
+            key = worker.sink.name if worker.sink.name not in stats else f"{worker.sink.name}-{index}"
+            stats[key] = {
+                'queued': worker.queue.qsize(),
+                'dropped': worker.dropped,
+                'failed': worker.failed,
+            }
+        return stats
+
+
+def notification_log_path(default: Optional[str] = None) -> str:
+    """
+    Return the file the log sink writes to.
+
+    Args:
+        default: Path used when TODO_NOTIFICATION_LOG is unset, e.g. next to the task store
+            (default: data/notifications.jsonl)
+    """
+    return os.environ.get('TODO_NOTIFICATION_LOG') or default or "data/notifications.jsonl"
+
+
+def sinks_from_environment(log_path: Optional[str] = None) -> List[NotificationSink]:
+    """
+    Build the sink list from TODO_NOTIFICATION_SINKS.
+
+    The variable is a comma-separated list of 'desktop', 'log' and 'webhook'. The log sink
+    writes to TODO_NOTIFICATION_LOG (default: log_path) and the webhook sink posts to
+    TODO_WEBHOOK_URL. When the variable is unset, desktop notifications are used if a library
+    is installed, otherwise the log file, so headless machines still keep reminders.
+
+    Args:
+        log_path: Log file to use when TODO_NOTIFICATION_LOG is unset (default: data/notifications.jsonl)
+    """
+    configured = os.environ.get('TODO_NOTIFICATION_SINKS', '')
+    names = [name.strip().lower() for name in configured.split(',') if name.strip()]
+
+    if not names:
+        desktop = DesktopSink()
+        if desktop.available:
+            return [desktop]
+        return [JsonLinesFileSink(notification_log_path(log_path))]
+
+    sinks: List[NotificationSink] = []
+    for name in names:
+        if name == 'desktop':
+            sinks.append(DesktopSink())
+        elif name == 'log':
+            sinks.append(JsonLinesFileSink(notification_log_path(log_path)))
+        elif name == 'webhook':
+            url = os.environ.get('TODO_WEBHOOK_URL')
+            if not url:
+                print("Warning: TODO_WEBHOOK_URL is not set, skipping webhook notifications.")
+                continue
+            sinks.append(WebhookSink(url))
+        else:
+            print(f"Warning: Unknown notification sink '{name}'.")
+    return sinks
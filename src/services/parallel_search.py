@@ -0,0 +1,139 @@
+"""
+Parallel Search
+Shards keyword search over a process pool for very large stores.
+
+The tasks are written once per store generation to a snapshot file, one pickled shard after
+another, and each worker process loads only its own shard (by file offset) and keeps it until
+the store changes. A query then sends just the keyword to every worker; the workers run the
+same search_data matching as find_tasks and return matching IDs. Shards are consecutive ID
+ranges, so concatenating their results in shard order keeps ascending ID order.
+
+Rewriting the snapshot costs about as much as a save, so this pays off for large stores that
+are searched more often than they change. TaskSubagent uses it when TODO_SEARCH_WORKERS is set
+and the store has at least TODO_SEARCH_PARALLEL_MIN tasks (default 50000).
+"""
+
+import atexit
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.search_logic import search_data
+
+
+# Worker-side cache: the shard this process loaded, keyed by (snapshot path, offset)
+_shard_key: Optional[Tuple[str, int]] = None
+_shard: List[Dict[str, Any]] = []
+
+
+def _search_shard(path: str, offset: int, keyword: str, fields: List[str]) -> List[int]:
+    """Worker entry point: load the shard at offset if needed and return matching IDs."""
+    global _shard_key, _shard
+    if _shard_key != (path, offset):
+        with open(path, 'rb') as file:
+            file.seek(offset)
+            _shard = pickle.load(file)
+        _shard_key = (path, offset)
+    return [record['id'] for record in search_data(_shard, keyword, fields)]
+
+
+class ParallelSearcher:
+    """Runs find_tasks-compatible searches on a fixed set of worker processes, one shard each."""
+
+    def __init__(self, workers: int = None, min_tasks: int = 50000):
+        """
+        Initialize the searcher; worker processes start on the first search.
+
+        Args:
+            workers: Number of worker processes and shards (default: CPU count)
+            min_tasks: Stores smaller than this are not worth sharding (see should_use)
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.min_tasks = min_tasks
+        # One single-process executor per shard, so a shard always goes to the process that loaded it
+        self._executors: List[ProcessPoolExecutor] = []
+        self._directory: Optional[str] = None
+        self._snapshot: Optional[Tuple[str, List[int]]] = None  # (path, shard offsets)
+        self._generation = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> Optional["ParallelSearcher"]:
+        """Create a searcher from TODO_SEARCH_WORKERS and TODO_SEARCH_PARALLEL_MIN, or None if unset."""
+        workers = os.environ.get('TODO_SEARCH_WORKERS')
+        if not workers:
+            return None
+        try:
+            searcher = cls(int(workers), int(os.environ.get('TODO_SEARCH_PARALLEL_MIN', 50000)))
+        except ValueError:
+            print("Warning: TODO_SEARCH_WORKERS and TODO_SEARCH_PARALLEL_MIN must be integers; "
+                  "parallel search is off.")
+            return None
+        atexit.register(searcher.close)
+        return searcher
+
+    def should_use(self, task_count: int) -> bool:
+        """Return True if a store of this size should be searched in parallel."""
+        return task_count >= self.min_tasks
+
+    def _write_snapshot(self, records: List[Dict[str, Any]], generation: int) -> None:
+        """Write the records as consecutive pickled shards and remember their offsets."""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="todo-search-")
+        path = os.path.join(self._directory, f"snapshot-{generation}.pickle")
+        size = -(-len(records) // self.workers)  # Ceiling division
+        offsets = []
+        with open(path, 'wb') as file:
+            for start in range(0, max(len(records), 1), max(size, 1)):
+                offsets.append(file.tell())
+                pickle.dump(records[start:start + size], file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        previous = self._snapshot
+        self._snapshot = (path, offsets)
+        self._generation = generation
+        if previous:
+            os.remove(previous[0])
+
+    def search(self, task_service, keyword: str, fields: List[str]) -> List[int]:
+        """
+        Search the service's tasks.
+
+        Args:
+            task_service: Service holding the tasks
+            keyword: String to search for, as for find_tasks
+            fields: Fields to search in
+
+        Returns:
+            IDs of matching tasks in ascending order
+        """
+        from services.task_subagent import TaskSubagent
+        with self._lock:
+            with task_service.lock.read():
+                generation = task_service.generation
+                tasks = list(task_service.tasks.values()) if generation != self._generation else None
+            if tasks is not None:
+                self._write_snapshot([TaskSubagent.task_to_dict(task) for task in tasks], generation)
+
+            path, offsets = self._snapshot
+            while len(self._executors) < len(offsets):
+                self._executors.append(ProcessPoolExecutor(max_workers=1))
+            futures = [executor.submit(_search_shard, path, offset, keyword, fields)
+                       for executor, offset in zip(self._executors, offsets)]
+            ids: List[int] = []
+            for future in futures:
+                ids.extend(future.result())
+            return ids
+
+    def close(self) -> None:
+        """Stop the worker processes and delete the snapshot."""
+        with self._lock:
+            for executor in self._executors:
+                executor.shutdown(wait=True, cancel_futures=True)
+            self._executors = []
+            if self._directory:
+                shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory, self._snapshot, self._generation = None, None, None
@@ -0,0 +1,250 @@
+"""
+Profiling
+Opt-in per-operation cProfile profiles and a log of slow operations with their timed phases.
+
+TaskService and TaskSubagent operations are wrapped with operation(). Both features are off by
+default, and the wrapper then costs one flag check per call:
+
+    TODO_PROFILE=<directory>   Profile every operation with cProfile and write one pstats file
+                               per operation (<operation>.<pid>.prof) on exit. '1' means
+                               data/profiles.
+    TODO_SLOW_MS=<ms>          Log operations taking longer than this to TODO_SLOW_LOG
+                               (default data/slow_operations.jsonl), one JSON object per line
+                               with an argument summary, the store size and the timed phases.
+
+The same settings can be made with configure(), which the scripting CLI does for --profile and
+--slow-ms. Phases are the blocks already timed by services.metrics (storage, index maintenance,
+search, sorting, validation) plus operations called from inside another operation; they are
+recorded whether or not metrics are enabled.
+
+Inspect a profile with: python -m pstats data/profiles/TaskService.create_task.<pid>.prof
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from services import metrics
+
+
+_profile_dir: Optional[str] = None
+_slow_seconds: Optional[float] = None
+_slow_log = 'data/slow_operations.jsonl'
+_active = False  # True if either feature is on
+
+_local = threading.local()  # Per thread: depth, phases of the current operation, open phase starts
+_profiles: Dict[str, List[Any]] = {}  # Operation name -> cProfile.Profile objects, one per thread
+_profiles_lock = threading.Lock()
+_log_lock = threading.Lock()
+_exit_hook_registered = False
+
+
+def configure(profile_dir: Optional[str] = None, slow_ms: Optional[float] = None,
+              slow_log: Optional[str] = None) -> None:
+    """
+    Turn profiling and the slow-operation log on or off.
+
+    Args:
+        profile_dir: Directory for per-operation profiles, or None to stop profiling
+        slow_ms: Threshold in milliseconds for the slow-operation log, or None to turn it off
+        slow_log: Slow-operation log file (default: unchanged)
+    """
+    global _profile_dir, _slow_seconds, _slow_log, _active, _exit_hook_registered
+    _profile_dir = profile_dir
+    _slow_seconds = slow_ms / 1000 if slow_ms is not None else None
+    if slow_log:
+        _slow_log = slow_log
+    _active = _profile_dir is not None or _slow_seconds is not None
+    metrics.set_phase_hook(_phase if _active else None)
+    if _profile_dir is not None and not _exit_hook_registered:
+        atexit.register(write_profiles)
+        _exit_hook_registered = True
+
+
+def configure_from_environment() -> None:
+    """Apply TODO_PROFILE, TODO_SLOW_MS and TODO_SLOW_LOG."""
+    profile_dir = os.environ.get('TODO_PROFILE') or None
+    if profile_dir == '1':
+        profile_dir = 'data/profiles'
+    slow_ms = os.environ.get('TODO_SLOW_MS')
+    try:
+        slow = float(slow_ms) if slow_ms else None
+    except ValueError:
+        print(f"Warning: TODO_SLOW_MS must be a number of milliseconds, not {slow_ms!r}")
+        slow = None
+    configure(profile_dir, slow, os.environ.get('TODO_SLOW_LOG'))
+
+
+class _Phase:
+    """Records a timed block as a phase of the current operation, and in its histogram if any."""
+
+    __slots__ = ('name', 'histogram', 'entry', 'start')
+
+    def __init__(self, name: str, histogram):
+        self.name = name
+        self.histogram = histogram
+
+    def __enter__(self):
+        phases = getattr(_local, 'phases', None)
+        self.entry = None
+        if phases is not None:
+            self.entry = {'phase': self.name, 'depth': _local.depth, 'ms': None}
+            phases.append(self.entry)
+            _local.depth += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        if self.histogram is not None:
+            self.histogram.observe(elapsed)
+        if self.entry is not None:
+            self.entry['ms'] = round(elapsed * 1000, 3)
+            _local.depth -= 1
+        return False
+
+
+def _phase(metric_name: str, histogram):
+    """Phase hook for services.metrics: 'todo_storage_save_seconds' becomes phase 'storage_save'."""
+    name = metric_name
+    if name.startswith('todo_'):
+        name = name[len('todo_'):]
+    if name.endswith('_seconds'):
+        name = name[:-len('_seconds')]
+    return _Phase(name, histogram)
+
+
+def _summarize(value: Any) -> Any:
+    """Return a short, JSON-friendly description of an argument."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= 40 else value[:37] + "..."
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return f"{type(value).__name__}[{len(value)}]"
+    if isinstance(value, dict):
+        return f"dict[{len(value)}]"
+    return type(value).__name__
+
+
+def _store_size(owner: Any) -> Optional[int]:
+    """Return the number of tasks held by a TaskService or a TaskSubagent's service."""
+    service = getattr(owner, 'task_service', owner)
+    tasks = getattr(service, 'tasks', None)
+    return len(tasks) if tasks is not None else None
+
+
+def _start_profile(name: str):
+    """Start a cProfile profile for this thread's run of an operation; None if one cannot run."""
+    import cProfile
+    profiles = getattr(_local, 'profiles', None)
+    if profiles is None:
+        profiles = _local.profiles = {}
+    profile = profiles.get(name)
+    if profile is None:
+        profile = profiles[name] = cProfile.Profile()
+        with _profiles_lock:
+            _profiles.setdefault(name, []).append(profile)
+    try:
+        profile.enable()
+    except ValueError:  # Another profiler is active (Python 3.12+ allows one per process)
+        return None
+    return profile
+
+
+def _log_slow(name: str, elapsed: float, args, kwargs, phases: List[Dict[str, Any]]) -> None:
+    entry = {
+        'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+        'operation': name,
+        'ms': round(elapsed * 1000, 3),
+        'args': [_summarize(value) for value in args[1:]],
+        'kwargs': {key: _summarize(value) for key, value in kwargs.items()},
+        'tasks': _store_size(args[0]) if args else None,
+        'thread': threading.current_thread().name,
+        'phases': phases,
+    }
+    try:
+        directory = os.path.dirname(_slow_log)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with _log_lock, open(_slow_log, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"Warning: could not write slow-operation log {_slow_log}: {e}")
+
+
+def operation(function):
+    """
+    Decorator for TaskService and TaskSubagent methods.
+
+    The outermost operation on a thread is profiled and checked against the slow threshold;
+    operations it calls become phases of it.
+    """
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _active:
+            return function(*args, **kwargs)
+        if getattr(_local, 'phases', None) is not None:
+            with _Phase(name, None):  # Nested operation
+                return function(*args, **kwargs)
+
+        _local.phases, _local.depth = [], 0
+        profile = _start_profile(name) if _profile_dir is not None else None
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if profile is not None:
+                profile.disable()
+            phases, _local.phases = _local.phases, None
+            if _slow_seconds is not None and elapsed >= _slow_seconds:
+                _log_slow(name, elapsed, args, kwargs, phases)
+
+    return wrapper
+
+
+def write_profiles(directory: Optional[str] = None) -> List[str]:
+    """
+    Write the profiles collected so far, one pstats file per operation.
+
+    Args:
+        directory: Where to write (default: the configured profile directory)
+
+    Returns:
+        Paths written
+    """
+    import pstats
+    directory = directory or _profile_dir
+    if not directory:
+        return []
+    with _profiles_lock:
+        collected = {name: list(profiles) for name, profiles in _profiles.items()}
+    written = []
+    try:
+        os.makedirs(directory, exist_ok=True)
+        for name, profiles in collected.items():
+            stats = None
+            for profile in profiles:
+                try:
+                    stats = pstats.Stats(profile) if stats is None else stats.add(profile)
+                except TypeError:  # Profile that never ran
+                    continue
+            if stats is None:
+                continue
+            path = os.path.join(directory, f"{name}.{os.getpid()}.prof")
+            stats.dump_stats(path)
+            written.append(path)
+    except OSError as e:
+        print(f"Warning: could not write profiles to {directory}: {e}")
+    return written
+
+
+configure_from_environment()
@@ -1,3 +1,16 @@
+"""
+Search Logic
+Keyword search over task dictionaries, a word index for fuzzy "did you mean" lookups, an
+inverted index for relevance-ranked (BM25) search and a prefix index for completion.
+"""
+
+import bisect
+import heapq
+import math
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+
 def search_data(data_list, keyword, fields_to_search):
     """
     Search through data_list for items that match the keyword in specified fields.
@@ -29,4 +42,314 @@ def search_data(data_list, keyword, fields_to_search):
                     results.append(item)
                     break
     
-    return results
\ No newline at end of file
+    return results
+
+
+# Any two strings without a common letter pair (padded with a space at both ends) have a
+# SequenceMatcher ratio below 2/3: each matching block is then a single character separated by
+# unmatched characters in one of the strings. From this threshold on, a lookup only needs to
+# check words that share a letter pair with the query.
+_PAIR_BOUND = 2 / 3
+
+
+def _letter_pairs(term: str) -> Set[str]:
+    """Return the letter pairs of a term padded with a space at both ends."""
+    padded = f" {term} "
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+class FuzzyIndex:
+    """
+    Index of words for fuzzy lookups, scored with difflib's SequenceMatcher ratio.
+
+    Words are indexed by their letter pairs, so a lookup compares the query with words sharing
+    a pair instead of every word; word length and quick_ratio bounds skip most of those before
+    the exact ratio is computed. Results are the same as comparing against every word.
+
+    Documents (e.g. tasks) are registered with the words they contain, so words are forgotten
+    once no document uses them.
+    """
+
+    def __init__(self):
+        self._pairs: Dict[str, Set[str]] = {}  # Letter pair -> words containing it
+        self._counts: Dict[str, int] = {}  # Word -> number of documents containing it
+        self._documents: Dict[Any, frozenset] = {}  # Document key -> its words
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._counts
+
+    def _add_word(self, word: str) -> None:
+        count = self._counts.get(word, 0)
+        self._counts[word] = count + 1
+        if not count:
+            for pair in _letter_pairs(word):
+                self._pairs.setdefault(pair, set()).add(word)
+
+    def _remove_word(self, word: str) -> None:
+        count = self._counts[word] - 1
+        if count:
+            self._counts[word] = count
+            return
+        del self._counts[word]
+        for pair in _letter_pairs(word):
+            words = self._pairs[pair]
+            words.discard(word)
+            if not words:
+                del self._pairs[pair]
+
+    def set_document(self, key: Any, words: Iterable[str]) -> None:
+        """Register the words of a document, replacing any words it had before."""
+        words = frozenset(word.lower() for word in words if word)
+        previous = self._documents.get(key, frozenset())
+        for word in previous - words:
+            self._remove_word(word)
+        for word in words - previous:
+            self._add_word(word)
+        if words:
+            self._documents[key] = words
+        else:
+            self._documents.pop(key, None)
+
+    def remove_document(self, key: Any) -> None:
+        """Forget a document and any words only it contained."""
+        for word in self._documents.pop(key, frozenset()):
+            self._remove_word(word)
+
+    def lookup(self, query: str, threshold: float = 0.75, limit: int = None) -> List[Tuple[str, float]]:
+        """
+        Find indexed words similar to the query.
+
+        Args:
+            query: Word to look up
+            threshold: Minimum SequenceMatcher ratio (0-1)
+            limit: Maximum number of words to return (default: all)
+
+        Returns:
+            (word, ratio) pairs, most similar first; ties go to words used by more documents
+        """
+        from difflib import SequenceMatcher
+        query = query.lower()
+        if not query:
+            return []
+        if threshold >= _PAIR_BOUND:
+            candidates: Set[str] = set()
+            for pair in _letter_pairs(query):
+                candidates.update(self._pairs.get(pair, ()))
+        else:
+            candidates = set(self._counts)
+
+        matcher = SequenceMatcher(None, query)
+        query_length = len(query)
+        matches = []
+        for word in candidates:
+            length = len(word)
+            # Cheapest bound first: the ratio cannot exceed what the shorter length allows
+            if 2 * min(query_length, length) < threshold * (query_length + length):
+                continue
+            matcher.set_seq2(word)
+            if matcher.quick_ratio() < threshold:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= threshold:
+                matches.append((word, ratio))
+
+        matches.sort(key=lambda match: (-match[1], -self._counts[match[0]], match[0]))
+        return matches[:limit] if limit is not None else matches
+
+
+def _by_score(item: Tuple[Any, float]) -> Tuple[float, Any]:
+    """Sort key for (key, score) pairs: highest score first, then key order."""
+    return -item[1], item[0]
+
+
+class RankedIndex:
+    """
+    Inverted index over weighted text fields, ranked with BM25F.
+
+    Each field keeps term -> {document key: term frequency} postings and its total length, so
+    the collection statistics BM25 needs (document frequency, average field length) are kept
+    up to date as documents are set and removed rather than recomputed per query. A term's
+    frequency in each field is normalized by that field's length against its average, weighted,
+    and summed before BM25 saturation, so a word in a short title outranks the same word in a
+    long description.
+    """
+
+    def __init__(self, weights: Dict[str, float], k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            weights: Field name -> weight; only these fields are indexed
+            k1: Term frequency saturation
+            b: Strength of field length normalization (0-1)
+        """
+        self.weights = dict(weights)
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, Dict[Any, int]]] = {field: {} for field in self.weights}
+        self._field_lengths: Dict[str, int] = {field: 0 for field in self.weights}  # Total terms per field
+        self._df: Dict[str, int] = {}  # Term -> number of documents containing it in any field
+        self._documents: Dict[Any, Dict[str, Counter]] = {}  # Document key -> field -> term counts
+        self._lengths: Dict[Any, Dict[str, int]] = {}  # Document key -> field -> number of terms
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def set_document(self, key: Any, fields: Dict[str, Iterable[str]]) -> None:
+        """Index a document's terms by field, replacing whatever was indexed for it before."""
+        self.remove_document(key)
+        counts = {field: Counter(fields.get(field, ())) for field in self.weights}
+        lengths = {field: sum(field_counts.values()) for field, field_counts in counts.items()}
+        terms = set()
+        for field, field_counts in counts.items():
+            postings = self._postings[field]
+            for term, count in field_counts.items():
+                postings.setdefault(term, {})[key] = count
+            self._field_lengths[field] += lengths[field]
+            terms.update(field_counts)
+        for term in terms:
+            self._df[term] = self._df.get(term, 0) + 1
+        self._documents[key] = counts
+        self._lengths[key] = lengths
+
+    def remove_document(self, key: Any) -> None:
+        """Remove a document from the index, if present."""
+        counts = self._documents.pop(key, None)
+        if counts is None:
+            return
+        lengths = self._lengths.pop(key)
+        terms = set()
+        for field, field_counts in counts.items():
+            postings = self._postings[field]
+            for term in field_counts:
+                documents = postings[term]
+                del documents[key]
+                if not documents:
+                    del postings[term]
+            self._field_lengths[field] -= lengths[field]
+            terms.update(field_counts)
+        for term in terms:
+            count = self._df[term] - 1
+            if count:
+                self._df[term] = count
+            else:
+                del self._df[term]
+
+    def search(self, terms: Iterable[str], limit: int = None) -> List[Tuple[Any, float]]:
+        """
+        Score the documents containing any of the terms and return the best.
+
+        Args:
+            terms: Query terms, already normalized like the indexed ones
+            limit: Maximum number of results (default: all matches)
+
+        Returns:
+            (document key, score) pairs, highest score first; ties in key order
+        """
+        total = len(self._documents)
+        if not total:
+            return []
+        average = {field: (length / total) or 1.0 for field, length in self._field_lengths.items()}
+        k1, b = self.k1, self.b
+        scores: Dict[Any, float] = {}
+        for term in dict.fromkeys(terms):  # Each distinct term once, in query order
+            df = self._df.get(term)
+            if not df:
+                continue
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            # Weighted, length-normalized frequency of the term summed over fields, per document
+            weighted: Dict[Any, float] = {}
+            for field, weight in self.weights.items():
+                documents = self._postings[field].get(term)
+                if not documents:
+                    continue
+                field_average = average[field]
+                for key, count in documents.items():
+                    norm = 1 - b + b * self._lengths[key][field] / field_average
+                    weighted[key] = weighted.get(key, 0.0) + weight * count / norm
+            for key, frequency in weighted.items():
+                scores[key] = scores.get(key, 0.0) + idf * frequency / (k1 + frequency)
+
+        if limit is None:
+            return sorted(scores.items(), key=_by_score)
+        # Partial selection: O(n log k) instead of sorting every match
+        return heapq.nsmallest(limit, scores.items(), key=_by_score)
+
+
+class PrefixIndex:
+    """
+    Sorted array of completion entries (e.g. task titles and tags) for prefix lookups.
+
+    Entries are kept sorted by their lowercased text, so the entries starting with a prefix form
+    one contiguous run located with bisect: a lookup costs O(log n) comparisons of at most the
+    prefix length, plus the results returned. Adding or removing an entry inserts into or
+    deletes from the array, and only happens when the first document gains or the last one
+    loses the entry.
+    """
+
+    def __init__(self):
+        self._keys: List[str] = []  # Lowercased entries, sorted
+        self._entries: Dict[str, List[Any]] = {}  # Lowercased entry -> [text as first seen, document count]
+        self._documents: Dict[Any, Dict[str, str]] = {}  # Document key -> lowercased entry -> text
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _add(self, key: str, text: str) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[1] += 1
+            return
+        self._entries[key] = [text, 1]
+        bisect.insort(self._keys, key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries[key]
+        entry[1] -= 1
+        if entry[1]:
+            return
+        del self._entries[key]
+        del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def set_document(self, key: Any, entries: Iterable[str]) -> None:
+        """Register the entries of a document, replacing any it had before."""
+        current = {text.lower(): text for text in entries if text and text.strip()}
+        previous = self._documents.get(key, {})
+        for entry in previous.keys() - current.keys():
+            self._remove(entry)
+        for entry in current.keys() - previous.keys():
+            self._add(entry, current[entry])
+        if current:
+            self._documents[key] = current
+        else:
+            self._documents.pop(key, None)
+
+    def remove_document(self, key: Any) -> None:
+        """Forget a document and any entries only it had."""
+        for entry in self._documents.pop(key, {}):
+            self._remove(entry)
+
+    def complete(self, prefix: str, limit: int = None) -> List[str]:
+        """
+        Return the entries starting with a prefix, ignoring case.
+
+        Args:
+            prefix: Text typed so far
+            limit: Maximum number of entries to return (default: all)
+
+        Returns:
+            Entries in alphabetical order, as first registered
+        """
+        prefix = prefix.lower()
+        keys = self._keys
+        position = bisect.bisect_left(keys, prefix)
+        results = []
+        while position < len(keys) and keys[position].startswith(prefix):
+            if limit is not None and len(results) >= limit:
+                break
+            results.append(self._entries[keys[position]][0])
+            position += 1
+        return results
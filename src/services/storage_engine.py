@@ -1,51 +1,186 @@
 """
 Storage Engine
 Handles data persistence operations including saving and loading data from JSON files.
+
+Several processes (the interactive app, the reminder service, scripts, the API server) may
+share one file. Access is coordinated with an advisory lock on a sidecar '.lock' file, writes
+go to a temporary file that is renamed into place, and every save bumps a version stored in
+the file. A save based on an older version is merged with the newer contents record by record
+instead of overwriting them.
 """
 
 import json
 import os
+import tempfile
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
+from services import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, saves are still atomic and version-checked
+    fcntl = None
+
 
 class StorageSkill:
     """Generic storage handling class for saving and loading data."""
-    
+
     def __init__(self, filepath: str = "data/tasks.json"):
         """
         Initialize the storage skill with a file path.
-        
+
         Args:
             filepath: Path to the JSON file for storage (default: data/tasks.json)
         """
         self.filepath = filepath
+        self.lock_path = filepath + ".lock"
         # Ensure the directory exists
         directory = os.path.dirname(filepath)
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
-    
-    def save_data(self, data: List[Dict[str, Any]]) -> bool:
+
+        self.version = 0  # Version of the file as of our last load or save
+        self.next_id: Optional[int] = None  # next_id stored in the file, if any
+        self.last_merge: Optional[Dict[str, Any]] = None  # Details of the merge done by the last save
+        self._base: Dict[Any, Dict[str, Any]] = {}  # Records as of our last load or save, by ID
+
+    @property
+    def base(self) -> Dict[Any, Dict[str, Any]]:
+        """Records as of our last load or save, by ID; the base the next save merges against."""
+        return self._base
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Hold the advisory lock on the sidecar lock file, shared or exclusive."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, Any]:
+        """
+        Read the file as an envelope {'version', 'next_id', 'data'}.
+
+        A plain JSON list, as written by earlier releases, is read as version 0.
+        """
+        if not os.path.exists(self.filepath):
+            return {'version': 0, 'next_id': None, 'data': []}
+        with open(self.filepath, 'r', encoding='utf-8') as file:
+            content = json.load(file)
+        if isinstance(content, list):
+            return {'version': 0, 'next_id': None, 'data': content}
+        return {'version': content.get('version', 0), 'next_id': content.get('next_id'),
+                'data': content.get('tasks', [])}
+
+    def _write(self, version: int, next_id: Optional[int], data: List[Dict[str, Any]]) -> None:
+        """Write the envelope to a temporary file and rename it over the storage file."""
+        directory = os.path.dirname(self.filepath) or "."
+        fd, temp_path = tempfile.mkstemp(prefix=".tasks-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump({'version': version, 'next_id': next_id, 'tasks': data}, file,
+                          indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.filepath)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _remember(self, envelope: Dict[str, Any]) -> None:
+        """Record the version and records we are now based on."""
+        self.version = envelope['version']
+        self.next_id = envelope['next_id']
+        self._base = {record.get('id'): record for record in envelope['data'] if isinstance(record, dict)}
+
+    def _merge(self, mine: List[Dict[str, Any]], theirs: List[Dict[str, Any]],
+               next_id: Optional[int]) -> tuple:
+        """
+        Three-way merge of our records with newer stored records, using the last loaded state as base.
+
+        A record changed on only one side keeps that change; a record changed on both sides keeps
+        ours. A record both sides created under the same ID keeps theirs and ours is renumbered.
+
+        Returns:
+            (merged records in ID order, details dictionary)
+        """
+        base = self._base
+        mine_by_id = {record['id']: record for record in mine}
+        theirs_by_id = {record['id']: record for record in theirs}
+        merged: Dict[Any, Dict[str, Any]] = {}
+        conflicts, renumber = [], []
+
+        for record_id in mine_by_id.keys() | theirs_by_id.keys() | base.keys():
+            ours, stored, original = mine_by_id.get(record_id), theirs_by_id.get(record_id), base.get(record_id)
+            if ours == original:
+                result = stored  # Only they changed it (or nobody did)
+            elif stored == original or ours == stored:
+                result = ours  # Only we changed it
+            elif original is None and ours is not None and stored is not None:
+                renumber.append(ours)  # Both created a record with this ID
+                result = stored
+            else:
+                conflicts.append(record_id)
+                result = ours
+            if result is not None:
+                merged[record_id] = result
+
+        highest = max([key for key in merged if isinstance(key, int)], default=0)
+        next_free = max(highest + 1, next_id or 0, self.next_id or 0)
+        renumbered = {}
+        for record in sorted(renumber, key=lambda r: r['id']):
+            renumbered[record['id']] = next_free
+            merged[next_free] = dict(record, id=next_free)
+            next_free += 1
+
+        records = [merged[key] for key in sorted(merged)]
+        return records, {'conflicts': sorted(conflicts), 'renumbered': renumbered, 'next_id': next_free}
+
+    def save_data(self, data: List[Dict[str, Any]], next_id: Optional[int] = None) -> bool:
         """
         Save data to a JSON file.
-        
+
+        If another process saved since our last load or save, records that carry an 'id' are
+        merged with its changes (see last_merge for what happened) instead of overwriting them.
+
         Args:
             data: List of dictionaries to save
-            
+            next_id: Next ID to hand out, stored so other processes never reuse IDs
+
         Returns:
             True if save was successful, False otherwise
         """
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            with metrics.timed('todo_storage_save_seconds'), self._locked(exclusive=True):
+                current = self._read()
+                self.last_merge = None
+                if current['version'] != self.version and all(isinstance(r, dict) and 'id' in r for r in data):
+                    data, self.last_merge = self._merge(data, current['data'], next_id)
+                    next_id = self.last_merge['next_id']
+                elif current['next_id']:
+                    next_id = max(next_id or 0, current['next_id'])
+
+                envelope = {'version': current['version'] + 1, 'next_id': next_id, 'data': data}
+                self._write(envelope['version'], next_id, data)
+                self._remember(envelope)
+            if self.last_merge:
+                metrics.increment('todo_storage_merges_total')
+            metrics.set_gauge('todo_tasks', len(data))
             return True
         except Exception as e:
+            metrics.increment('todo_storage_errors_total')
             print(f"Error saving data: {e}")
             return False
-    
+
     def load_data(self) -> Optional[List[Dict[str, Any]]]:
         """
         Load data from a JSON file.
-        
+
         Returns:
             List of dictionaries if load was successful, None otherwise
         """
@@ -53,10 +188,25 @@ class StorageSkill:
             if not os.path.exists(self.filepath):
                 # Return empty list if file doesn't exist
                 return []
-            
-            with open(self.filepath, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            return data
+
+            with metrics.timed('todo_storage_load_seconds'), self._locked(exclusive=False):
+                envelope = self._read()
+            self._remember(envelope)
+            metrics.set_gauge('todo_tasks', len(envelope['data']))
+            return envelope['data']
         except Exception as e:
+            metrics.increment('todo_storage_errors_total')
             print(f"Error loading data: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def last_modified(self) -> Optional[float]:
+        """
+        Get the modification time of the storage file.
+
+        Returns:
+            Modification time in seconds since the epoch, or None if the file doesn't exist
+        """
+        try:
+            return os.path.getmtime(self.filepath)
+        except OSError:
+            return None
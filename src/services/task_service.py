@@ -3,28 +3,365 @@ Task Service
 Handles the business logic for task management in the todo application.
 """
 
-from typing import Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from models.task import Task
+from services import metrics, profiling
+from services.events import EventBus, TaskEvent
+from services.locking import ReadWriteLock
+
+
+# Fields that create_many and update_many accept for each task
+TASK_FIELDS = ('title', 'description', 'priority', 'tags', 'is_recurring', 'frequency', 'due_date', 'due_at')
 
 
 class TaskService:
-    """Service class for managing tasks."""
+    """
+    Service class for managing tasks.
+
+    The service is safe to share between threads. Mutations hold the write lock only while they
+    change the store and derived data; saving happens after the lock is released. Stored Task
+    objects are never modified in place: a change swaps in a new Task, so a task or list returned
+    to a reader stays consistent and readers only hold the read lock long enough to take a
+    reference or copy the list.
+
+    Mutations can be grouped with transaction(): they are saved together and rolled back
+    together if the block fails or the save does.
+    """
 
     def __init__(self) -> None:
         """Initialize the task service with an empty task dictionary and starting ID."""
+        # IDs only grow, so insertion order of this dictionary is ascending ID order
         self.tasks: Dict[int, Task] = {}
         self.next_id = 1
         self.task_subagent = None  # Will be set after initialization
+        self.events = EventBus()  # Publishes a TaskEvent after every change
+        # Also guards the subagent's derived indexes, which are updated under the write lock
+        self.lock = ReadWriteLock()
+        self.generation = 0  # Bumped by every mutation, so saves can tell if they are stale
+        # Old ID -> current ID of tasks created here that a save had to renumber (see renumber_tasks)
+        self._renumbered: Dict[int, int] = {}
+
+        # Transaction state; only touched by the thread holding the write lock
+        self._transaction_owner = None
+        self._undo_log: Optional[List[Tuple[int, Optional[Task]]]] = None  # (task ID, previous task)
+        self._pending_events: List[TaskEvent] = []
+        self._pending_alerts: List[Tuple[str, str]] = []
 
     def set_task_subagent(self, task_subagent):
         """Set the task_subagent reference for saving tasks and notifications."""
         self.task_subagent = task_subagent
 
+    def replace_tasks(self, tasks: Dict[int, Task], next_id: Optional[int] = None) -> None:
+        """
+        Swap in a whole new set of tasks, e.g. after loading from storage.
+
+        Args:
+            tasks: Tasks keyed by ID, in ascending ID order
+            next_id: ID for the next created task (default: one past the highest ID, never lower than now)
+        """
+        with self.lock.write():
+            self.tasks = tasks
+            self.generation += 1
+            if next_id is None:
+                next_id = max(self.next_id, max(tasks, default=0) + 1)
+            self.next_id = next_id
+
+    def _in_transaction(self) -> bool:
+        """Return True if the calling thread has a transaction open."""
+        return self._transaction_owner == threading.get_ident()
+
+    def _put(self, task: Task) -> None:
+        """Store a task under its ID (caller holds the write lock), recording it for rollback."""
+        if self._undo_log is not None:
+            self._undo_log.append((task.id, self.tasks.get(task.id)))
+        self.tasks[task.id] = task
+
+    def _drop(self, task_id: int) -> None:
+        """Remove a task (caller holds the write lock), recording it for rollback."""
+        if self._undo_log is not None:
+            self._undo_log.append((task_id, self.tasks[task_id]))
+        del self.tasks[task_id]
+
+    def _save(self) -> bool:
+        """Save the store, or leave it to the commit of the open transaction."""
+        if self._in_transaction() or not self.task_subagent:
+            return True
+        return self.task_subagent.save_tasks_to_storage()
+
+    def _alert(self, title: str, message: str) -> None:
+        """Send a due-soon alert, or hold it until the open transaction commits."""
+        if self._in_transaction():
+            self._pending_alerts.append((title, message))
+        elif self.task_subagent:
+            self.task_subagent.notification_skill.send_alert(title=title, message=message)
+
+    def _notify(self, kind: str, old: Optional[Task], new: Optional[Task]) -> None:
+        """Publish a change event, or hold it until the open transaction commits."""
+        if not self.events.has_subscribers:
+            return
+        event = TaskEvent(kind, (new or old).id, old, new)
+        if self._in_transaction():
+            self._pending_events.append(event)
+        else:
+            self.events.publish(event)
+
+    def renumber_tasks(self, renumbered: Dict[int, int]) -> None:
+        """
+        Move tasks to new IDs after a save found another process had created tasks with the same IDs.
+
+        Storage keeps the other process's tasks under those IDs and stores ours under new ones;
+        this applies the same move in memory, so applying the stored records afterwards only
+        brings in the other process's tasks. Creating methods return tasks with their new IDs
+        (see current_id).
+
+        Args:
+            renumbered: Old ID -> new ID, as reported by the storage merge
+        """
+        with self.lock.write():
+            for old_id, new_id in renumbered.items():
+                task = self.tasks.pop(old_id, None)
+                if task is not None:
+                    moved = replace(task, id=new_id)
+                    self.tasks[new_id] = moved
+                    if self.task_subagent:
+                        self.task_subagent.task_removed(old_id)
+                        self.task_subagent.task_changed(moved)
+                # A task renumbered before may have been renumbered again
+                for earlier, later in self._renumbered.items():
+                    if later == old_id:
+                        self._renumbered[earlier] = new_id
+                self._renumbered[old_id] = new_id
+            self.tasks = dict(sorted(self.tasks.items()))
+            self.next_id = max([self.next_id] + [new_id + 1 for new_id in renumbered.values()])
+            self.generation += 1
+
+    def current_id(self, task_id: int) -> int:
+        """
+        Return the current ID of a task created by this service.
+
+        It differs from the ID the task was created with only if a save renumbered it. Tasks
+        created inside a transaction get their final IDs when the transaction commits.
+        """
+        with self.lock.read():
+            return self._renumbered.get(task_id, task_id)
+
+    def _created(self, tasks: List[Task]) -> List[Task]:
+        """Return tasks just created here as stored after saving, with any new IDs from a merge."""
+        if not self._renumbered:
+            return tasks
+        with self.lock.read():
+            return [self.tasks.get(self._renumbered[task.id], replace(task, id=self._renumbered[task.id]))
+                    if task.id in self._renumbered else task for task in tasks]
+
+    def _renumbered_event(self, event: TaskEvent, first_new_id: int) -> TaskEvent:
+        """Give an event about a task created in the committing transaction the task's final ID."""
+        new_id = self._renumbered.get(event.task_id)
+        if new_id is None or event.task_id < first_new_id:
+            return event  # Older IDs that were renumbered now belong to another process's tasks
+        old = replace(event.old, id=new_id) if event.old is not None else None
+        new = replace(event.new, id=new_id) if event.new is not None else None
+        return TaskEvent(event.kind, new_id, old, new)
+
+    def _savepoint(self) -> tuple:
+        """Capture the position in the undo log and pending queues to roll back to."""
+        return len(self._undo_log), self.next_id, len(self._pending_events), len(self._pending_alerts)
+
+    def _rollback_to(self, savepoint: tuple) -> None:
+        """Undo every change recorded after the savepoint, newest first, and re-index what changed."""
+        log_length, next_id, event_count, alert_count = savepoint
+        touched = set()
+        reinserted = False
+        while len(self._undo_log) > log_length:
+            task_id, previous = self._undo_log.pop()
+            touched.add(task_id)
+            if previous is None:
+                self.tasks.pop(task_id, None)
+            else:
+                reinserted = reinserted or task_id not in self.tasks
+                self.tasks[task_id] = previous
+        if reinserted:
+            # Restored deletions were appended at the end; keep the dictionary in ID order
+            self.tasks = dict(sorted(self.tasks.items()))
+
+        self.next_id = next_id
+        self.generation += 1
+        del self._pending_events[event_count:]
+        del self._pending_alerts[alert_count:]
+        if self.task_subagent and touched:
+            present = [self.tasks[task_id] for task_id in sorted(touched) if task_id in self.tasks]
+            self.task_subagent.tasks_removed([task_id for task_id in touched if task_id not in self.tasks])
+            self.task_subagent.tasks_changed(present)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group mutations so they are applied and saved as one unit.
+
+        Inside the block the calling thread holds the write lock; saving, event publishing and
+        due-soon alerts are deferred. On normal exit the store is saved once and the deferred
+        alerts and events are sent, in order. If the block raises, every change made in it is undone (by restoring
+        the previous Task objects from an undo log, not by copying the store) and the exception
+        propagates. Nested transactions act as savepoints: a failing inner block only undoes
+        its own changes.
+
+        Example:
+            with task_service.transaction():
+                task = task_service.create_task("Plan trip")
+                task_service.update_task(other_id, priority="high")
+
+        Raises:
+            RuntimeError: If the save at commit fails; the changes are rolled back first
+        """
+        with self.lock.write():
+            if self._in_transaction():
+                savepoint = self._savepoint()
+                try:
+                    yield self
+                except BaseException:
+                    self._rollback_to(savepoint)
+                    raise
+                return
+
+            self._transaction_owner = threading.get_ident()
+            self._undo_log = []
+            self._pending_events, self._pending_alerts = [], []
+            savepoint = self._savepoint()
+            try:
+                try:
+                    yield self
+                except BaseException:
+                    self._rollback_to(savepoint)
+                    raise
+
+                # Stop recording: a save that merges with another process may reload the store
+                undo_log, self._undo_log = self._undo_log, None
+                self._transaction_owner = None
+                if undo_log and self.task_subagent and not self.task_subagent.save_tasks_to_storage():
+                    self._undo_log = undo_log
+                    self._rollback_to(savepoint)
+                    raise RuntimeError("Could not save the transaction; its changes were rolled back")
+                first_new_id = savepoint[1]
+                events = [self._renumbered_event(event, first_new_id) for event in self._pending_events]
+                alerts = self._pending_alerts
+            finally:
+                self._transaction_owner = None
+                self._undo_log = None
+                self._pending_events, self._pending_alerts = [], []
+
+        for title, message in alerts:
+            self.task_subagent.notification_skill.send_alert(title=title, message=message)
+        for event in events:
+            self.events.publish(event)
+
+    @staticmethod
+    def _validate(task: Task) -> None:
+        """Validate a task, recording how long it took and whether it was rejected."""
+        with metrics.timed('todo_validation_seconds'):
+            try:
+                task.validate()
+            except ValueError:
+                metrics.increment('todo_validation_errors_total')
+                raise
+
+    @staticmethod
+    def _normalize_due(due_date: Optional[str], due_at: Optional[int]) -> tuple:
+        """
+        Split a due value into the (due_date, due_at) pair stored on a task.
+
+        An explicit due_at wins and due_date becomes its local date. A due_date with a time of
+        day ('2024-05-01 14:30', optionally with an offset) is converted to due_at as well.
+        """
+        from services.time_engine import TimeSkill
+        if due_at is not None:
+            return TimeSkill.due_date_from_timestamp(due_at), int(due_at)
+        if due_date and len(due_date) > 10:
+            parsed = TimeSkill.parse_due_timestamp(due_date)
+            if parsed is None:
+                raise ValueError("Due date must be YYYY-MM-DD or YYYY-MM-DD HH:MM")
+            return TimeSkill.due_date_from_timestamp(parsed), parsed
+        return due_date, None
+
+    def _updated_task(self, task: Task, changes: Dict[str, Any]) -> Task:
+        """
+        Build and validate the replacement for a task with some fields changed.
+
+        Fields whose value is None keep their current value.
+        """
+        unknown = set(changes) - set(TASK_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown task field(s): {', '.join(sorted(unknown))}")
+
+        due_date, due_at = changes.get('due_date'), changes.get('due_at')
+        if due_date is not None or due_at is not None:
+            due_date, due_at = self._normalize_due(due_date, due_at)
+        else:
+            due_date, due_at = task.due_date, task.due_at
+
+        values = {name: changes[name] if changes.get(name) is not None else getattr(task, name)
+                  for name in ('title', 'description', 'priority', 'tags', 'is_recurring', 'frequency')}
+        # Moving the due date or changing the frequency starts a new series from this instance
+        series_anchor = task.series_anchor
+        if due_date != task.due_date or values['frequency'] != task.frequency:
+            series_anchor = None
+        updated_task = Task(id=task.id, completed=task.completed, created_at=task.created_at,
+                            due_date=due_date, due_at=due_at, series_anchor=series_anchor, **values)
+        self._validate(updated_task)
+        return updated_task
+
+    @staticmethod
+    def _toggled_task(task: Task) -> Tuple[Task, Optional[Task]]:
+        """
+        Build the toggled replacement for a task.
+
+        Returns:
+            (toggled task, next instance of a recurring task being completed or None); the next
+            instance has ID 0 until it is stored
+        """
+        # Replace rather than modify, so readers holding the old task see a consistent value
+        toggled = replace(task, completed=not task.completed, version=0)
+        if not task.is_recurring or task.completed:
+            return toggled, None
+
+        # Create a new instance of the task with the next occurrence of its series; it is computed
+        # from the series anchor, as the recurrence horizon does, so month-end dates do not drift
+        from services.time_engine import TimeSkill
+        anchor = TimeSkill.series_anchor(task)
+        next_date = TimeSkill.next_in_series(anchor, task.due_date[:10] if task.due_date else anchor, task.frequency)
+        if not next_date:
+            return toggled, None
+
+        # Keep the time of day for tasks that have an exact due time
+        next_due_at = None
+        if task.due_at is not None:
+            time_of_day = TimeSkill.format_due_timestamp(task.due_at).split(' ')[1]
+            next_due_at = TimeSkill.parse_due_timestamp(f"{next_date} {time_of_day}")
+
+        new_task = Task(
+            id=0,
+            title=task.title,
+            description=task.description,
+            priority=task.priority,
+            tags=task.tags,
+            is_recurring=task.is_recurring,
+            frequency=task.frequency,
+            due_date=next_date,
+            due_at=next_due_at,
+            series_anchor=anchor
+        )
+        TaskService._validate(new_task)
+        return toggled, new_task
+
+    @profiling.operation
     def create_task(self, title: str, description: str = "", priority: str = "medium", tags: List[str] = None,
-                    is_recurring: bool = False, frequency: str = "", due_date: str = None) -> Task:
+                    is_recurring: bool = False, frequency: str = "", due_date: str = None,
+                    due_at: Optional[int] = None) -> Task:
         """Create a new task with the given title, description, priority, tags, and optional recurring settings."""
         if tags is None:
             tags = []
+        due_date, due_at = self._normalize_due(due_date, due_at)
 
         # Validate inputs
         temp_task = Task(
@@ -35,181 +372,330 @@ class TaskService:
             tags=tags,
             is_recurring=is_recurring,
             frequency=frequency,
-            due_date=due_date
-        )
-        temp_task.validate()
-
-        task_id = self.next_id
-        self.next_id += 1
-
-        task = Task(
-            id=task_id,
-            title=title,
-            description=description,
-            priority=priority,
-            tags=tags,
-            is_recurring=is_recurring,
-            frequency=frequency,
-            due_date=due_date
+            due_date=due_date,
+            due_at=due_at
         )
-
-        self.tasks[task_id] = task
+        self._validate(temp_task)
+
+        with self.lock.write():
+            task_id = self.next_id
+            self.next_id += 1
+
+            task = Task(
+                id=task_id,
+                title=title,
+                description=description,
+                priority=priority,
+                tags=tags,
+                is_recurring=is_recurring,
+                frequency=frequency,
+                due_date=due_date,
+                due_at=due_at
+            )
+
+            self._put(task)
+            self.generation += 1
+            if self.task_subagent:
+                self.task_subagent.task_changed(task)
 
         # Save tasks to storage if task_subagent is available
         if self.task_subagent:
-            self.task_subagent.save_tasks_to_storage()
+            self._save()
 
             # Check if the new task is due within the next hour and send notification
             if due_date:
                 from services.time_engine import TimeSkill
                 time_skill = TimeSkill()
-                if time_skill.is_due_within_hours(due_date, 1):
-                    self.task_subagent.notification_skill.send_alert(
+                if time_skill.is_task_due_within(task, 60):
+                    self._alert(
                         title="New Task Reminder",
                         message=f"New task '{title}' is due within the next hour!"
                     )
+            task = self._created([task])[0]
 
+        self._notify('created', None, task)
         return task
 
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a task by its ID."""
-        return self.tasks.get(task_id)
+        with self.lock.read():
+            return self.tasks.get(task_id)
 
     def get_all_tasks(self) -> List[Task]:
-        """Get all tasks."""
-        return list(self.tasks.values())
+        """Get a snapshot of all tasks, in ascending ID order."""
+        with self.lock.read():
+            return list(self.tasks.values())
 
+    @profiling.operation
     def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None,
                     priority: Optional[str] = None, tags: Optional[List[str]] = None,
                     is_recurring: Optional[bool] = None, frequency: Optional[str] = None,
-                    due_date: Optional[str] = None) -> bool:
-        """Update a task's title, description, priority, tags, or recurring settings."""
-        task = self.tasks.get(task_id)
-        if not task:
-            return False
-
-        # Prepare updated values
-        new_title = title if title is not None else task.title
-        new_description = description if description is not None else task.description
-        new_priority = priority if priority is not None else task.priority
-        new_tags = tags if tags is not None else task.tags
-        new_is_recurring = is_recurring if is_recurring is not None else task.is_recurring
-        new_frequency = frequency if frequency is not None else task.frequency
-        new_due_date = due_date if due_date is not None else task.due_date
-
-        # Validate the updated task
-        updated_task = Task(
-            id=task.id,
-            title=new_title,
-            description=new_description,
-            completed=task.completed,
-            priority=new_priority,
-            tags=new_tags,
-            is_recurring=new_is_recurring,
-            frequency=new_frequency,
-            due_date=new_due_date
-        )
-        updated_task.validate()
-
-        # Apply the updates
-        if title is not None:
-            task.title = title
-        if description is not None:
-            task.description = description
-        if priority is not None:
-            task.priority = priority
-        if tags is not None:
-            task.tags = tags
-        if is_recurring is not None:
-            task.is_recurring = is_recurring
-        if frequency is not None:
-            task.frequency = frequency
-        if due_date is not None:
-            task.due_date = due_date
+                    due_date: Optional[str] = None, due_at: Optional[int] = None) -> bool:
+        """Update a task's title, description, priority, tags, recurring settings, or due date and time."""
+        with self.lock.write():
+            task = self.tasks.get(task_id)
+            if not task:
+                return False
+
+            # Build the updated task; the stored one is replaced, never modified
+            updated_task = self._updated_task(task, {
+                'title': title, 'description': description, 'priority': priority, 'tags': tags,
+                'is_recurring': is_recurring, 'frequency': frequency, 'due_date': due_date, 'due_at': due_at,
+            })
+            self._put(updated_task)
+            self.generation += 1
+            if self.task_subagent:
+                self.task_subagent.task_changed(updated_task)
 
         # Save tasks to storage if task_subagent is available
         if self.task_subagent:
-            self.task_subagent.save_tasks_to_storage()
+            self._save()
 
             # Check if the updated task is due within the next hour and send notification
-            if new_due_date:
+            if updated_task.due_date:
                 from services.time_engine import TimeSkill
                 time_skill = TimeSkill()
-                if time_skill.is_due_within_hours(new_due_date, 1):
-                    self.task_subagent.notification_skill.send_alert(
+                if time_skill.is_task_due_within(updated_task, 60):
+                    self._alert(
                         title="Updated Task Reminder",
-                        message=f"Task '{task.title}' is due within the next hour!"
+                        message=f"Task '{updated_task.title}' is due within the next hour!"
                     )
 
+        self._notify('updated', task, updated_task)
         return True
 
+    @profiling.operation
     def delete_task(self, task_id: int) -> bool:
         """Delete a task by its ID."""
-        if task_id in self.tasks:
-            del self.tasks[task_id]
-
-            # Save tasks to storage if task_subagent is available
+        with self.lock.write():
+            task = self.tasks.get(task_id)
+            if task is None:
+                return False
+            self._drop(task_id)
+            self.generation += 1
             if self.task_subagent:
-                self.task_subagent.save_tasks_to_storage()
+                self.task_subagent.task_removed(task_id)
 
-            return True
-        return False
+        # Save tasks to storage if task_subagent is available
+        if self.task_subagent:
+            self._save()
+
+        self._notify('deleted', task, None)
+        return True
 
+    @profiling.operation
     def toggle_task_status(self, task_id: int) -> bool:
         """Toggle the completion status of a task. If a recurring task is marked complete, create a new instance."""
-        task = self.tasks.get(task_id)
-        if task:
-            # If the task is recurring and we're marking it as complete
-            if task.is_recurring and not task.completed:
-                # Mark the current task as complete
-                task.completed = True
-
-                # Create a new instance of the task with the next occurrence date
+        with self.lock.write():
+            task = self.tasks.get(task_id)
+            if not task:
+                return False
+
+            # A recurring task being completed gets its next instance
+            toggled, new_task = self._toggled_task(task)
+            self._put(toggled)
+            if new_task:
+                new_task.id = self.next_id
+                self._put(new_task)
+                self.next_id += 1
+
+            self.generation += 1
+            if self.task_subagent:
+                self.task_subagent.task_changed(toggled)
+                if new_task:
+                    self.task_subagent.task_changed(new_task)
+
+        # Save tasks to storage if task_subagent is available
+        if self.task_subagent:
+            self._save()
+
+            # Check if the new recurring task is due within the next hour and send notification
+            if new_task:
                 from services.time_engine import TimeSkill
-                next_date = TimeSkill.calculate_next_date(task.due_date or task.created_at.split('T')[0], task.frequency)
-
-                if next_date:
-                    new_task = Task(
-                        id=self.next_id,
-                        title=task.title,
-                        description=task.description,
-                        priority=task.priority,
-                        tags=task.tags,
-                        is_recurring=task.is_recurring,
-                        frequency=task.frequency,
-                        due_date=next_date
+                time_skill = TimeSkill()
+                if time_skill.is_task_due_within(new_task, 60):
+                    self._alert(
+                        title="Recurring Task Reminder",
+                        message=f"Recurring task '{task.title}' is due within the next hour!"
                     )
-                    new_task.validate()
-
-                    self.tasks[self.next_id] = new_task
-                    self.next_id += 1
-
-                # Save tasks to storage if task_subagent is available
-                if self.task_subagent:
-                    self.task_subagent.save_tasks_to_storage()
-
-                    # Check if the new recurring task is due within the next hour and send notification
-                    if next_date:
-                        from services.time_engine import TimeSkill
-                        time_skill = TimeSkill()
-                        if time_skill.is_due_within_hours(next_date, 1):
-                            self.task_subagent.notification_skill.send_alert(
-                                title="Recurring Task Reminder",
-                                message=f"Recurring task '{task.title}' is due within the next hour!"
-                            )
-
-                return True
-            else:
-                # For non-recurring tasks or marking incomplete
-                task.completed = not task.completed
+                new_task = self._created([new_task])[0]
+
+        self._notify('toggled', task, toggled)
+        if new_task:
+            self._notify('created', None, new_task)
+        return True
+
+    def _missing(self, task_ids: Iterable[int]) -> None:
+        """Raise ValueError naming the IDs that are not in the store (caller holds the lock)."""
+        missing = [task_id for task_id in task_ids if task_id not in self.tasks]
+        if missing:
+            raise ValueError(f"Task(s) not found: {', '.join(map(str, missing))}")
+
+    def _persist_and_remind(self, tasks: List[Task], title: str) -> None:
+        """Save once after a bulk change and send one alert for the tasks due within the next hour."""
+        if not self.task_subagent:
+            return
+        self._save()
+
+        from services.time_engine import TimeSkill
+        time_skill = TimeSkill()
+        due_soon = [task for task in tasks if task.due_date and time_skill.is_task_due_within(task, 60)]
+        if len(due_soon) == 1:
+            message = f"Task '{due_soon[0].title}' is due within the next hour!"
+        elif due_soon:
+            message = f"{len(due_soon)} tasks are due within the next hour!"
+        else:
+            return
+        self._alert(title=title, message=message)
+
+    @profiling.operation
+    def create_many(self, items: Iterable[Dict[str, Any]]) -> List[Task]:
+        """
+        Create several tasks at once.
+
+        Every item is validated before anything is stored, IDs are assigned as one range, the
+        indexes are updated in bulk and the store is saved once.
+
+        Args:
+            items: Dictionaries with create_task's keyword arguments (see TASK_FIELDS)
+
+        Returns:
+            The created tasks, in ID order
+
+        Raises:
+            ValueError: If an item is invalid; no task is created then
+        """
+        new_tasks = []
+        for index, item in enumerate(items):
+            fields = dict(item)
+            fields.setdefault('description', "")
+            unknown = set(fields) - set(TASK_FIELDS)
+            if unknown:
+                raise ValueError(f"Item {index}: unknown task field(s): {', '.join(sorted(unknown))}")
+            try:
+                fields['due_date'], fields['due_at'] = self._normalize_due(fields.get('due_date'), fields.get('due_at'))
+                task = Task(id=0, **fields)
+                self._validate(task)
+            except (TypeError, ValueError, AttributeError) as e:
+                raise ValueError(f"Item {index}: {e}")
+            new_tasks.append(task)
+
+        with self.lock.write():
+            first_id = self.next_id
+            for offset, task in enumerate(new_tasks):
+                task.id = first_id + offset
+                self._put(task)
+            self.next_id = first_id + len(new_tasks)
+            self.generation += 1
+            if self.task_subagent:
+                self.task_subagent.tasks_changed(new_tasks)
+
+        self._persist_and_remind(new_tasks, "New Task Reminder")
+        new_tasks = self._created(new_tasks)
+        for task in new_tasks:
+            self._notify('created', None, task)
+        return new_tasks
+
+    @profiling.operation
+    def update_many(self, updates: Dict[int, Dict[str, Any]]) -> List[Task]:
+        """
+        Update several tasks at once, all or nothing.
+
+        Args:
+            updates: Task ID -> fields to change, as keyword arguments of update_task
+
+        Returns:
+            The updated tasks
+
+        Raises:
+            ValueError: If a task is missing or an update is invalid; no task is changed then
+        """
+        with self.lock.write():
+            self._missing(updates)
+            old_tasks = [self.tasks[task_id] for task_id in updates]
+            updated_tasks = []
+            for task_id, changes in updates.items():
+                try:
+                    updated_tasks.append(self._updated_task(self.tasks[task_id], changes))
+                except ValueError as e:
+                    raise ValueError(f"Task {task_id}: {e}")
+
+            for task in updated_tasks:
+                self._put(task)
+            self.generation += 1
+            if self.task_subagent:
+                self.task_subagent.tasks_changed(updated_tasks)
+
+        self._persist_and_remind(updated_tasks, "Updated Task Reminder")
+        for old, task in zip(old_tasks, updated_tasks):
+            self._notify('updated', old, task)
+        return updated_tasks
+
+    @profiling.operation
+    def delete_many(self, task_ids: Iterable[int]) -> List[int]:
+        """
+        Delete several tasks at once, all or nothing.
+
+        Returns:
+            The deleted IDs
+
+        Raises:
+            ValueError: If a task is missing; no task is deleted then
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        with self.lock.write():
+            self._missing(task_ids)
+            deleted_tasks = [self.tasks[task_id] for task_id in task_ids]
+            for task_id in task_ids:
+                self._drop(task_id)
+            self.generation += 1
+            if self.task_subagent:
+                self.task_subagent.tasks_removed(task_ids)
 
-                # Save tasks to storage if task_subagent is available
-                if self.task_subagent:
-                    self.task_subagent.save_tasks_to_storage()
+        if self.task_subagent:
+            self._save()
+        for task in deleted_tasks:
+            self._notify('deleted', task, None)
+        return task_ids
+
+    @profiling.operation
+    def toggle_many(self, task_ids: Iterable[int]) -> List[Task]:
+        """
+        Toggle several tasks at once, all or nothing; completed recurring tasks get their next instance.
+
+        Returns:
+            The toggled tasks followed by any new recurring instances
+
+        Raises:
+            ValueError: If a task is missing; no task is toggled then
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        with self.lock.write():
+            self._missing(task_ids)
+            old_tasks = [self.tasks[task_id] for task_id in task_ids]
+            results = [self._toggled_task(task) for task in old_tasks]
+
+            toggled_tasks = [toggled for toggled, _ in results]
+            new_tasks = [new_task for _, new_task in results if new_task]
+            for task in toggled_tasks:
+                self._put(task)
+            for task in new_tasks:
+                task.id = self.next_id
+                self._put(task)
+                self.next_id += 1
+            self.generation += 1
+            if self.task_subagent:
+                self.task_subagent.tasks_changed(toggled_tasks + new_tasks)
 
-                return True
-        return False
+        self._persist_and_remind(new_tasks, "Recurring Task Reminder")
+        new_tasks = self._created(new_tasks)
+        for old, task in zip(old_tasks, toggled_tasks):
+            self._notify('toggled', old, task)
+        for task in new_tasks:
+            self._notify('created', None, task)
+        return toggled_tasks + new_tasks
 
     def task_exists(self, task_id: int) -> bool:
         """Check if a task exists by its ID."""
-        return task_id in self.tasks
\ No newline at end of file
+        with self.lock.read():
+            return task_id in self.tasks
@@ -3,80 +3,358 @@ Task Subagent
 Handles task-specific operations using the search and sorting logic services.
 """
 
-from typing import List, Dict, Any
-from services.search_logic import search_data
+import os
+import re
+import threading
+from typing import List, Dict, Any, Tuple
+from services.search_logic import search_data, FuzzyIndex, PrefixIndex, RankedIndex
 from services.sorting_logic import sort_data
 from services.validator import validate_priority
-from services.time_engine import TimeSkill
+from services.time_engine import TimeSkill, RecurrenceHorizon
 from services.storage_engine import StorageSkill
+from services.due_index import DueIndex
 from services.notification_engine import NotificationSkill
+from services.events import TaskEvent
+from services import metrics, profiling
 from models.task import Task
 from services.task_service import TaskService
 
 
+_WORD = re.compile(r"\w+")
+
+# Field weights for find_tasks_ranked: a keyword in the title counts most
+RANKED_FIELD_WEIGHTS = {'title': 3.0, 'tags': 2.0, 'description': 1.0}
+
+
 class TaskSubagent:
     """Subagent for handling task operations."""
 
-    def __init__(self, task_service: TaskService):
-        """Initialize the task subagent with a task service."""
+    def __init__(self, task_service: TaskService, storage_skill: StorageSkill = None,
+                 notify_on_startup: bool = True):
+        """
+        Initialize the task subagent with a task service.
+
+        Args:
+            task_service: Service holding the tasks
+            storage_skill: Storage to load from and save to (default: data/tasks.json)
+            notify_on_startup: Whether to alert about tasks due within the next hour after loading
+        """
         self.task_service = task_service
         self.time_skill = TimeSkill()
-        self.storage_skill = StorageSkill()
-        self.notification_skill = NotificationSkill()
+        self.storage_skill = storage_skill if storage_skill is not None else StorageSkill()
+        # Reminders are logged next to the store they belong to, not in the working directory
+        self.notification_skill = NotificationSkill(
+            log_path=os.path.join(os.path.dirname(self.storage_skill.filepath), "notifications.jsonl"))
+        self.recurrence_horizon = RecurrenceHorizon()
+        self.due_index = DueIndex()
+        self.word_index = None  # FuzzyIndex of task words, built by the first did_you_mean
+        self.ranked_index = None  # RankedIndex of task fields, built by the first find_tasks_ranked
+        self.prefix_index = None  # PrefixIndex of titles and tags, built by the first complete
+        self._save_lock = threading.Lock()
+        self._saved_generation = -1
+        # Stored records not yet in memory, left by a merged save or a reload as (records memory
+        # reflects, records in storage, IDs the merge moved our new tasks to); see _apply_stored
+        self._pending_stored = None
+        self._pending_lock = threading.Lock()
+        self._stored_applied = 0  # Stored states applied so far; older snapshots are stale
+        self.parallel_search = None  # Process-pool search for very large stores
+        if os.environ.get('TODO_SEARCH_WORKERS'):
+            from services.parallel_search import ParallelSearcher
+            self.parallel_search = ParallelSearcher.from_environment()
 
         # Load tasks from storage on initialization
         self.load_tasks_from_storage()
 
         # Check for upcoming tasks and send notifications on startup
-        self.check_upcoming_tasks_on_startup()
+        if notify_on_startup:
+            self.check_upcoming_tasks_on_startup()
 
     def check_upcoming_tasks_on_startup(self):
         """Check for tasks due within the next hour and send notifications."""
-        all_tasks = self.task_service.get_all_tasks()
+        for task in self.get_tasks_due_within(60):
+            self.notification_skill.send_alert(
+                title="Upcoming Task Reminder",
+                message=f"Task '{task.title}' is due within the next hour!"
+            )
+
+    @profiling.operation
+    def get_tasks_due_within(self, minutes: int) -> List[Task]:
+        """
+        Get open tasks due within the next number of minutes using the due index.
 
-        for task in all_tasks:
-            if task.due_date and not task.completed:
-                # Check if the task is due within the next hour using TimeSkill
-                if self.time_skill.is_due_within_hours(task.due_date, 1):
-                    self.notification_skill.send_alert(
-                        title="Upcoming Task Reminder",
-                        message=f"Task '{task.title}' is due within the next hour!"
-                    )
+        Args:
+            minutes: Size of the reminder window in minutes
+
+        Returns:
+            List of tasks, exact due times first in due order, then date-only tasks
+        """
+        tasks = []
+        with self.task_service.lock.read():
+            for task_id in self.due_index.due_within(minutes):
+                task = self.task_service.tasks.get(task_id)
+                if task:
+                    tasks.append(task)
+        return tasks
 
+    @profiling.operation
     def load_tasks_from_storage(self):
         """Load tasks from storage on app startup."""
         data = self.storage_skill.load_data()
-        if data:
-            # Set the next_id based on the highest ID in the loaded data
-            max_id = 0
-            for task_data in data:
-                task = Task(**task_data)
-                self.task_service.tasks[task.id] = task
-                if task.id > max_id:
-                    max_id = task.id
-            self.task_service.next_id = max_id + 1
-
-    def save_tasks_to_storage(self):
-        """Save all tasks to storage."""
-        tasks_data = []
-        for task in self.task_service.get_all_tasks():
-            # Convert task to dictionary
-            task_dict = {
-                'id': task.id,
-                'title': task.title,
-                'description': task.description,
-                'completed': task.completed,
-                'created_at': task.created_at,
-                'priority': task.priority,
-                'tags': task.tags,
-                'is_recurring': task.is_recurring,
-                'frequency': task.frequency,
-                'due_date': task.due_date
-            }
-            tasks_data.append(task_dict)
+        with self.task_service.lock.write():
+            if data:
+                # next_id follows the highest ID in the loaded data, or the stored next_id if higher
+                tasks = {}
+                for task_data in data:
+                    task = Task(**task_data)
+                    tasks[task.id] = task
+                self.task_service.replace_tasks(tasks, max(max(tasks, default=0) + 1, self.storage_skill.next_id or 0))
+
+            # Pre-materialize recurring occurrences so calendar views don't expand series on the fly
+            all_tasks = self.task_service.get_all_tasks()
+            with metrics.timed('todo_index_rebuild_seconds'):
+                self.recurrence_horizon.refresh(all_tasks)
+                self.due_index.rebuild(all_tasks)
+            self.word_index = self.ranked_index = self.prefix_index = None
+
+    @profiling.operation
+    def reload_tasks_from_storage(self) -> bool:
+        """
+        Bring in changes other processes saved since our last load or save.
+
+        Only tasks that changed in storage are replaced, added or removed, so changes made here
+        and not saved yet are kept, and unchanged tasks keep their objects (and versions), so
+        caches stay warm. Subscribers to the task service's events are told about every
+        created, updated and deleted task.
+
+        Returns:
+            True if the stored data could be read, False otherwise
+        """
+        with self._save_lock:
+            base = self.storage_skill.base
+            if self.storage_skill.load_data() is None:
+                return False
+            with self._pending_lock:
+                pending = self._pending_stored
+                if pending is not None:
+                    # Memory has not caught up with the earlier stored state either
+                    base = pending[0]
+                self._pending_stored = (base, self.storage_skill.base, pending[2] if pending else {})
+        self._apply_stored()
+        return True
+
+    def _apply_stored(self) -> None:
+        """
+        Apply the stored records left by a merged save or a reload to memory.
+
+        A task is replaced, added or removed only where storage differs from the records memory
+        reflected and the task here still matches them; tasks changed or created here since
+        then stay as they are and go out with the next save. New local tasks whose IDs storage
+        now uses for other tasks are moved to free IDs, like tasks the merge renumbered.
+        """
+        if self._pending_stored is None:
+            return
+        service = self.task_service
+        with service.lock.write():
+            with self._pending_lock:
+                pending, self._pending_stored = self._pending_stored, None
+                if pending is None:
+                    return  # Another thread applied it
+                self._stored_applied += 1
+            base, stored, renumbered = pending
+
+            next_free = max([service.next_id, self.storage_skill.next_id or 0] +
+                            [task_id + 1 for task_id in stored if isinstance(task_id, int)])
+            moves = {}
+            for task_id in service.tasks:
+                if task_id in stored and task_id not in base:
+                    moves[task_id] = next_free  # Created here meanwhile under an ID now taken in storage
+                    next_free += 1
+            moves.update(renumbered)
+            if moves:
+                service.renumber_tasks(moves)
+                base = {renumbered.get(record_id, record_id):
+                        dict(record, id=renumbered[record_id]) if record_id in renumbered else record
+                        for record_id, record in base.items()}
+
+            tasks = dict(service.tasks)
+            changes = []
+            for task_id in stored.keys() | base.keys():
+                record, original = stored.get(task_id), base.get(task_id)
+                if record is original or record == original:
+                    continue  # Unchanged in storage; memory is current or newer
+                existing = tasks.get(task_id)
+                if (self.task_to_dict(existing) if existing is not None else None) != original:
+                    continue  # Changed here as well; the local change wins and is saved next
+                if record is None:
+                    del tasks[task_id]
+                    changes.append(TaskEvent('deleted', task_id, existing, None))
+                else:
+                    task = Task(**record)
+                    tasks[task_id] = task
+                    changes.append(TaskEvent('updated' if existing is not None else 'created', task_id, existing, task))
+
+            if changes:
+                service.replace_tasks(dict(sorted(tasks.items())), max(service.next_id, next_free))
+                for event in changes:
+                    if event.kind == 'deleted':
+                        self.task_removed(event.task_id)
+                    else:
+                        self.task_changed(event.new)
+
+        for event in changes:
+            service.events.publish(event)
+
+    @staticmethod
+    def task_to_dict(task: Task) -> Dict[str, Any]:
+        """Convert a task to the dictionary stored in the JSON file and used by the scripting CLI."""
+        record = {
+            'id': task.id,
+            'title': task.title,
+            'description': task.description,
+            'completed': task.completed,
+            'created_at': task.created_at,
+            'priority': task.priority,
+            'tags': task.tags,
+            'is_recurring': task.is_recurring,
+            'frequency': task.frequency,
+            'due_date': task.due_date,
+            'due_at': task.due_at
+        }
+        # Only later instances of a recurring series have an anchor; records without one keep
+        # the layout older versions wrote, so merges with them do not see spurious changes
+        if task.series_anchor:
+            record['series_anchor'] = task.series_anchor
+        return record
+
+    def task_changed(self, task: Task):
+        """Keep derived data in sync after a task was created or modified."""
+        with metrics.timed('todo_index_update_seconds'):
+            self.recurrence_horizon.update_task(task)
+            self.due_index.update_task(task)
+            self._index_text(task)
+
+    def task_removed(self, task_id: int):
+        """Keep derived data in sync after a task was deleted."""
+        with metrics.timed('todo_index_update_seconds'):
+            self.recurrence_horizon.remove_task(task_id)
+            self.due_index.remove_task(task_id)
+            self._unindex_text(task_id)
+
+    def tasks_changed(self, tasks: List[Task]):
+        """Keep derived data in sync after many tasks were created or modified at once."""
+        with metrics.timed('todo_index_update_seconds'):
+            self.recurrence_horizon.update_tasks(tasks)
+            self.due_index.update_tasks(tasks)
+            for task in tasks:
+                self._index_text(task)
+
+    def tasks_removed(self, task_ids: List[int]):
+        """Keep derived data in sync after many tasks were deleted at once."""
+        with metrics.timed('todo_index_update_seconds'):
+            for task_id in task_ids:
+                self.recurrence_horizon.remove_task(task_id)
+                self._unindex_text(task_id)
+            self.due_index.remove_tasks(task_ids)
+
+    def _index_text(self, task: Task):
+        """Update the text indexes that have been built (they are built on first use)."""
+        if self.word_index is not None:
+            self.word_index.set_document(task.id, self.task_words(task))
+        if self.ranked_index is not None:
+            self.ranked_index.set_document(task.id, self.task_terms(task))
+        if self.prefix_index is not None:
+            self.prefix_index.set_document(task.id, self.task_completions(task))
+
+    def _unindex_text(self, task_id: int):
+        if self.word_index is not None:
+            self.word_index.remove_document(task_id)
+        if self.ranked_index is not None:
+            self.ranked_index.remove_document(task_id)
+        if self.prefix_index is not None:
+            self.prefix_index.remove_document(task_id)
+
+    def _build_text_index(self, name: str, index, document):
+        """Fill a new text index with every task and install it as attribute name, unless another thread did."""
+        with self.task_service.lock.write(), metrics.timed('todo_index_rebuild_seconds'):
+            if getattr(self, name) is None:
+                for task in self.task_service.tasks.values():
+                    index.set_document(task.id, document(task))
+                setattr(self, name, index)
+
+    @profiling.operation
+    def get_recurring_occurrences(self, start_date: str, end_date: str) -> List[tuple]:
+        """
+        Get occurrences of recurring tasks within a date range.
 
-        self.storage_skill.save_data(tasks_data)
+        Ranges inside the pre-materialized horizon are answered from it; anything else is
+        expanded on demand.
 
+        Args:
+            start_date: Start of the range in ISO format (YYYY-MM-DD), inclusive
+            end_date: End of the range in ISO format (YYYY-MM-DD), inclusive
+
+        Returns:
+            List of (date, task ID) pairs ordered by date
+        """
+        lock = self.task_service.lock
+        with lock.write():
+            self.recurrence_horizon.roll()
+        horizon = self.recurrence_horizon
+        with lock.read():
+            if horizon.start and horizon.start.isoformat() <= start_date and end_date <= horizon.end.isoformat():
+                return horizon.occurrences_between(start_date, end_date)
+
+        materialized = self.time_skill.materialize_occurrences(self.task_service.get_all_tasks(), start_date, end_date)
+        occurrences = [(day, task_id) for task_id, days in materialized.items() for day in days]
+        occurrences.sort()
+        return occurrences
+
+    @profiling.operation
+    def save_tasks_to_storage(self) -> bool:
+        """
+        Save all tasks to storage.
+
+        Saves are serialized and a snapshot older than one already written is skipped, so when
+        several threads change the store at once the file always ends up with the newest state.
+        The snapshot is taken before waiting for other saves, so a save never holds up writers.
+
+        If another process saved in the meantime, storage merges both sets of changes and the
+        tasks it changed are applied to memory (see _apply_stored), including tasks renumbered
+        because both sides created the same ID. A snapshot taken before memory caught up with
+        such a merge is retaken, since storage's merge base has moved past it.
+
+        Returns:
+            True if the store is saved, False if writing failed
+        """
+        while True:
+            self._apply_stored()
+            with self.task_service.lock.read():
+                generation = self.task_service.generation
+                tasks = list(self.task_service.tasks.values())
+                next_id = self.task_service.next_id
+                applied = self._stored_applied
+
+            with self._save_lock:
+                if generation <= self._saved_generation:
+                    return True
+                with self._pending_lock:
+                    if self._pending_stored is not None or applied != self._stored_applied:
+                        continue
+                tasks_data = [self.task_to_dict(task) for task in tasks]
+                if not self.storage_skill.save_data(tasks_data, next_id):
+                    return False
+                self._saved_generation = generation
+                merged = self.storage_skill.last_merge
+                if merged:
+                    with self._pending_lock:
+                        self._pending_stored = ({record['id']: record for record in tasks_data},
+                                                self.storage_skill.base, merged['renumbered'])
+
+            self._apply_stored()
+            return True
+
+    @profiling.operation
+    @metrics.timed_call('todo_search_seconds')
     def find_tasks(self, keyword: str, fields_to_search: List[str] = None) -> List[Task]:
         """
         Find tasks that match the keyword in specified fields.
@@ -91,6 +369,12 @@ class TaskSubagent:
         if fields_to_search is None:
             fields_to_search = ['title', 'description', 'tags', 'due_date']
 
+        if self.parallel_search is not None and self.parallel_search.should_use(len(self.task_service.tasks)):
+            ids = self.parallel_search.search(self.task_service, keyword, fields_to_search)
+            with self.task_service.lock.read():
+                tasks = self.task_service.tasks
+                return [tasks[task_id] for task_id in ids if task_id in tasks]
+
         # Convert tasks to dictionaries for searching
         tasks_as_dicts = []
         for task in self.task_service.get_all_tasks():
@@ -103,8 +387,11 @@ class TaskSubagent:
                 'completed': task.completed,
                 'created_at': task.created_at,
                 'due_date': task.due_date,
+                'due_at': task.due_at,
                 'is_recurring': task.is_recurring,
-                'frequency': task.frequency
+                'frequency': task.frequency,
+                'series_anchor': task.series_anchor,
+                'version': task.version
             }
             tasks_as_dicts.append(task_dict)
 
@@ -123,13 +410,122 @@ class TaskSubagent:
                 completed=result['completed'],
                 created_at=result['created_at'],
                 due_date=result['due_date'],
+                due_at=result['due_at'],
                 is_recurring=result['is_recurring'],
-                frequency=result['frequency']
+                frequency=result['frequency'],
+                series_anchor=result['series_anchor'],
+                version=result['version']
             )
             found_tasks.append(task)
 
         return found_tasks
 
+    @staticmethod
+    def task_terms(task: Task) -> Dict[str, List[str]]:
+        """Return the lowercased words of a task's title, description and tags, by field."""
+        return {
+            'title': _WORD.findall((task.title or "").lower()),
+            'description': _WORD.findall((task.description or "").lower()),
+            'tags': _WORD.findall(" ".join(task.tags or []).lower()),
+        }
+
+    @staticmethod
+    def task_words(task: Task) -> List[str]:
+        """Return the words of a task's title, description and tags, as indexed for did_you_mean."""
+        terms = TaskSubagent.task_terms(task)
+        return terms['title'] + terms['description'] + terms['tags']
+
+    @staticmethod
+    def task_completions(task: Task) -> List[str]:
+        """Return the completion entries of a task: its title and tags."""
+        return [task.title or ""] + list(task.tags or [])
+
+    @profiling.operation
+    def complete(self, prefix: str, limit: int = 20) -> List[str]:
+        """
+        Complete a prefix to task titles and tags, for tab completion and search-as-you-type.
+
+        The prefix index is built on the first call and kept up to date with the other indexes.
+
+        Args:
+            prefix: Text typed so far (case-insensitive)
+            limit: Maximum number of completions
+
+        Returns:
+            Matching titles and tags in alphabetical order
+        """
+        if self.prefix_index is None:
+            self._build_text_index('prefix_index', PrefixIndex(), self.task_completions)
+        with self.task_service.lock.read():
+            return self.prefix_index.complete(prefix, limit)
+
+    @profiling.operation
+    @metrics.timed_call('todo_search_seconds')
+    def find_tasks_ranked(self, keyword: str, limit: int = 20) -> List[Tuple[Task, float]]:
+        """
+        Find the tasks most relevant to a keyword, best first.
+
+        Tasks are scored with BM25 over title, description and tags (weighted by
+        RANKED_FIELD_WEIGHTS) and match on whole words, unlike find_tasks' substring match. The
+        inverted index is built on the first call and kept up to date with the other indexes.
+
+        Args:
+            keyword: One or more words to search for
+            limit: Maximum number of tasks to return (None for every match)
+
+        Returns:
+            (task, score) pairs, highest score first
+        """
+        terms = _WORD.findall(keyword.lower())
+        if not terms:
+            return []
+        if self.ranked_index is None:
+            self._build_text_index('ranked_index', RankedIndex(RANKED_FIELD_WEIGHTS), self.task_terms)
+
+        with self.task_service.lock.read():
+            tasks = self.task_service.tasks
+            return [(tasks[task_id], score) for task_id, score in self.ranked_index.search(terms, limit)]
+
+    @profiling.operation
+    def did_you_mean(self, keyword: str, limit: int = 5, threshold: float = 0.75) -> List[str]:
+        """
+        Suggest corrections for a keyword that may be misspelled, from the words used in tasks.
+
+        The word index is built on the first call and kept up to date with the other indexes.
+        A single word gets up to limit similar words; a phrase gets one suggestion in which each
+        unknown word is replaced by its closest match.
+
+        Args:
+            keyword: Search keyword as typed
+            limit: Maximum number of suggestions
+            threshold: Minimum similarity (0-1) for a word to be suggested
+
+        Returns:
+            Suggested keywords, best first; empty if nothing is close enough
+        """
+        words = _WORD.findall(keyword.lower())
+        if not words:
+            return []
+        if self.word_index is None:
+            self._build_text_index('word_index', FuzzyIndex(), self.task_words)
+
+        with self.task_service.lock.read():
+            index = self.word_index
+            if len(words) == 1:
+                return [word for word, _ in index.lookup(words[0], threshold, limit)
+                        if word != words[0]]
+
+            corrected = []
+            for word in words:
+                if word in index:
+                    corrected.append(word)
+                    continue
+                matches = index.lookup(word, threshold, 1)
+                corrected.append(matches[0][0] if matches else word)
+        return [" ".join(corrected)] if corrected != words else []
+
+    @profiling.operation
+    @metrics.timed_call('todo_sort_seconds')
     def get_ordered_tasks(self, sort_by: str, reverse: bool = False) -> List[Task]:
         """
         Get tasks ordered by specified field.
@@ -153,8 +549,11 @@ class TaskSubagent:
                 'completed': task.completed,
                 'created_at': task.created_at,
                 'due_date': task.due_date,
+                'due_at': task.due_at,
                 'is_recurring': task.is_recurring,
-                'frequency': task.frequency
+                'frequency': task.frequency,
+                'series_anchor': task.series_anchor,
+                'version': task.version
             }
             tasks_as_dicts.append(task_dict)
 
@@ -173,8 +572,11 @@ class TaskSubagent:
                 completed=task_dict['completed'],
                 created_at=task_dict['created_at'],
                 due_date=task_dict['due_date'],
+                due_at=task_dict['due_at'],
                 is_recurring=task_dict['is_recurring'],
-                frequency=task_dict['frequency']
+                frequency=task_dict['frequency'],
+                series_anchor=task_dict['series_anchor'],
+                version=task_dict['version']
             )
             ordered_tasks.append(task)
 
@@ -192,16 +594,15 @@ class TaskSubagent:
         """
         return validate_priority(priority)
 
+    @profiling.operation
     def get_upcoming_deadlines(self) -> List[Task]:
         """
-        Get tasks with due dates within the next 24 hours.
+        Get open tasks with deadlines within the next 24 hours, using the due index.
+
+        Tasks with a due time are looked up by range over their exact due time; date-only
+        tasks are those due on the date 24 hours from now, as TimeSkill.is_reminder_due checks.
 
         Returns:
-            List of tasks with upcoming deadlines
+            List of tasks with upcoming deadlines, exact due times first in due order
         """
-        upcoming_tasks = []
-        for task in self.task_service.get_all_tasks():
-            if task.due_date and not task.completed:
-                if self.time_skill.is_reminder_due(task.due_date):
-                    upcoming_tasks.append(task)
-        return upcoming_tasks
\ No newline at end of file
+        return self.get_tasks_due_within(24 * 60)
\ No newline at end of file
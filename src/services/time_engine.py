@@ -3,8 +3,98 @@ Time Engine
 Handles time-related operations including recurring logic, reminders, and date formatting.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+import bisect
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def add_months(date_obj: date, months: int) -> date:
+    """
+    Add a number of months to a date, clamping the day to the end of the target month.
+
+    Args:
+        date_obj: Date to start from
+        months: Number of months to add
+
+    Returns:
+        The shifted date, e.g. 2024-01-31 + 1 month -> 2024-02-29
+    """
+    month_index = date_obj.month - 1 + months
+    year = date_obj.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(date_obj.day, calendar.monthrange(year, month)[1])
+    return date_obj.replace(year=year, month=month, day=day)
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """A recurrence rule such as 'every 1 month'. Occurrences are computed from an anchor date."""
+    frequency: str  # daily, weekly or monthly
+    interval: int = 1
+
+    def occurrence(self, anchor: date, index: int) -> date:
+        """
+        Return the index-th occurrence of the series starting at anchor (index 0 is the anchor).
+
+        Each occurrence is computed from the anchor rather than from the previous one, so a
+        series anchored on the 31st comes back to the 31st after shorter months.
+        """
+        if self.frequency == 'daily':
+            return anchor + timedelta(days=index * self.interval)
+        if self.frequency == 'weekly':
+            return anchor + timedelta(weeks=index * self.interval)
+        return add_months(anchor, index * self.interval)
+
+    def first_index_on_or_after(self, anchor: date, start: date) -> int:
+        """Return the index of the first occurrence that falls on or after start."""
+        if start <= anchor:
+            return 0
+        if self.frequency in ('daily', 'weekly'):
+            step = self.interval * (1 if self.frequency == 'daily' else 7)
+            return -(-(start - anchor).days // step)
+
+        index = max(0, ((start.year - anchor.year) * 12 + start.month - anchor.month) // self.interval - 1)
+        while self.occurrence(anchor, index) < start:
+            index += 1
+        return index
+
+    def between(self, anchor: date, start: date, end: date) -> List[date]:
+        """Return all occurrences in the inclusive range [start, end]."""
+        occurrences = []
+        index = self.first_index_on_or_after(anchor, start)
+        current = self.occurrence(anchor, index)
+        while current <= end:
+            occurrences.append(current)
+            index += 1
+            current = self.occurrence(anchor, index)
+        return occurrences
+
+
+@lru_cache(maxsize=32)
+def get_recurrence_rule(frequency: str, interval: int = 1) -> Optional[RecurrenceRule]:
+    """
+    Return the cached rule for a frequency.
+
+    Args:
+        frequency: Frequency of recurrence ('daily', 'weekly', 'monthly'), case-insensitive
+        interval: Number of periods between occurrences (default: 1)
+
+    Returns:
+        The shared RecurrenceRule, or None if the frequency is not supported
+    """
+    frequency = (frequency or '').lower()
+    if frequency not in ('daily', 'weekly', 'monthly') or interval < 1:
+        return None
+    return RecurrenceRule(frequency, interval)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string; recurring tasks share a handful of anchors, so results are cached."""
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
 
 
 class TimeSkill:
@@ -22,25 +112,140 @@ class TimeSkill:
         Returns:
             Next date in ISO format (YYYY-MM-DD) or None if invalid frequency
         """
+        rule = get_recurrence_rule(frequency)
+        if rule is None:
+            return None
         try:
-            date_obj = datetime.strptime(current_date, '%Y-%m-%d')
-
-            if frequency.lower() == 'daily':
-                next_date = date_obj + timedelta(days=1)
-            elif frequency.lower() == 'weekly':
-                next_date = date_obj + timedelta(weeks=1)
-            elif frequency.lower() == 'monthly':
-                # Calculate next month - handle month overflow
-                if date_obj.month == 12:
-                    next_date = date_obj.replace(year=date_obj.year + 1, month=1)
-                else:
-                    next_date = date_obj.replace(month=date_obj.month + 1)
-            else:
-                return None
+            # Monthly dates are clamped to the end of the month (2024-01-31 -> 2024-02-29)
+            return rule.occurrence(_parse_date(current_date), 1).isoformat()
+        except (TypeError, ValueError):
+            return None
 
-            return next_date.strftime('%Y-%m-%d')
-        except ValueError:
+    @staticmethod
+    def series_anchor(task) -> Optional[str]:
+        """
+        Return the date a task's recurring series is computed from.
+
+        That is the series' first due date for instances created by completing an earlier one,
+        otherwise the task's own due date, or its creation date when it has none.
+        """
+        if task.series_anchor:
+            return task.series_anchor
+        if task.due_date:
+            return task.due_date[:10]
+        return task.created_at.split('T')[0] if task.created_at else None
+
+    @staticmethod
+    def next_in_series(anchor_date: str, current_date: str, frequency: str) -> Optional[str]:
+        """
+        Calculate the first occurrence of a series after the current one.
+
+        Occurrences are computed from the anchor, like occurrences_between and the recurrence
+        horizon do, so a monthly series anchored on the 31st returns to the 31st after February.
+
+        Args:
+            anchor_date: First occurrence of the series in ISO format (YYYY-MM-DD)
+            current_date: Date of the current occurrence in ISO format
+            frequency: Frequency of recurrence ('daily', 'weekly', 'monthly')
+
+        Returns:
+            Next date in ISO format (YYYY-MM-DD) or None if the input is invalid
+        """
+        rule = get_recurrence_rule(frequency)
+        if rule is None:
+            return None
+        try:
+            anchor = _parse_date(anchor_date)
+            after = _parse_date(current_date) + timedelta(days=1)
+        except (TypeError, ValueError):
             return None
+        return rule.occurrence(anchor, rule.first_index_on_or_after(anchor, after)).isoformat()
+
+    @staticmethod
+    def next_occurrences(current_date: str, frequency: str, count: int) -> List[str]:
+        """
+        Calculate the next count occurrences after the current date.
+
+        Args:
+            current_date: Current date in ISO format (YYYY-MM-DD)
+            frequency: Frequency of recurrence ('daily', 'weekly', 'monthly')
+            count: Number of occurrences to return
+
+        Returns:
+            List of dates in ISO format (YYYY-MM-DD), empty if the input is invalid
+        """
+        rule = get_recurrence_rule(frequency)
+        if rule is None:
+            return []
+        try:
+            anchor = _parse_date(current_date)
+        except (TypeError, ValueError):
+            return []
+        return [rule.occurrence(anchor, index).isoformat() for index in range(1, count + 1)]
+
+    @staticmethod
+    def occurrences_between(anchor_date: str, frequency: str, start_date: str, end_date: str) -> List[str]:
+        """
+        Calculate all occurrences of a series that fall within a date range.
+
+        Args:
+            anchor_date: First occurrence of the series in ISO format (YYYY-MM-DD)
+            frequency: Frequency of recurrence ('daily', 'weekly', 'monthly')
+            start_date: Start of the range in ISO format, inclusive
+            end_date: End of the range in ISO format, inclusive
+
+        Returns:
+            List of dates in ISO format (YYYY-MM-DD), empty if the input is invalid
+        """
+        rule = get_recurrence_rule(frequency)
+        if rule is None:
+            return []
+        try:
+            anchor = _parse_date(anchor_date)
+            start = _parse_date(start_date)
+            end = _parse_date(end_date)
+        except (TypeError, ValueError):
+            return []
+        return [occurrence.isoformat() for occurrence in rule.between(anchor, start, end)]
+
+    @staticmethod
+    def materialize_occurrences(tasks: Iterable, start_date: str, end_date: str) -> Dict[int, List[str]]:
+        """
+        Calculate the occurrences of many recurring tasks within a date range at once.
+
+        A task's series is computed from series_anchor() (the same anchor toggle_task_status
+        uses) and starts at the task's due date. Completed and non-recurring tasks are skipped.
+
+        Args:
+            tasks: Iterable of Task objects
+            start_date: Start of the range in ISO format, inclusive
+            end_date: End of the range in ISO format, inclusive
+
+        Returns:
+            Dictionary mapping task ID to its list of occurrence dates (YYYY-MM-DD)
+        """
+        try:
+            start = _parse_date(start_date)
+            end = _parse_date(end_date)
+        except (TypeError, ValueError):
+            return {}
+
+        occurrences = {}
+        for task in tasks:
+            if not task.is_recurring or task.completed:
+                continue
+            rule = get_recurrence_rule(task.frequency)
+            if rule is None:
+                continue
+            try:
+                anchor = _parse_date(TimeSkill.series_anchor(task))
+                first = _parse_date(task.due_date[:10]) if task.due_date else anchor
+            except (AttributeError, TypeError, ValueError):
+                continue
+            dates = rule.between(anchor, max(start, first), end)
+            if dates:
+                occurrences[task.id] = [occurrence.isoformat() for occurrence in dates]
+        return occurrences
 
     @staticmethod
     def is_reminder_due(due_date: str) -> bool:
@@ -71,13 +276,20 @@ class TimeSkill:
         """
         Check if a due date is within the specified number of hours.
 
+        Date-only values count as due for the whole day; values with a time of day
+        are checked exactly.
+
         Args:
-            due_date: Due date in ISO format (YYYY-MM-DD)
+            due_date: Due date in ISO format (YYYY-MM-DD or YYYY-MM-DD HH:MM[±HH:MM])
             hours: Number of hours to check (default: 1)
 
         Returns:
             True if the due date is within the specified hours, False otherwise
         """
+        due_at = TimeSkill.parse_due_timestamp(due_date)
+        if due_at is not None:
+            return TimeSkill.is_due_within_minutes(due_at, hours * 60)
+
         try:
             due_date_obj = datetime.strptime(due_date, '%Y-%m-%d')
             now = datetime.now()
@@ -91,6 +303,70 @@ class TimeSkill:
         except ValueError:
             return False
 
+    @staticmethod
+    def parse_due_timestamp(value: str) -> Optional[int]:
+        """
+        Parse a due date with a time of day into epoch seconds.
+
+        Args:
+            value: ISO date and time such as '2024-05-01 14:30', '2024-05-01T14:30:00+02:00'
+                   or '2024-05-01T12:30Z'; values without an offset are in local time
+
+        Returns:
+            Epoch seconds, or None if the value is date-only or not a valid date and time
+        """
+        if not value or len(value) <= 10:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+        except (TypeError, ValueError):
+            return None
+        # Naive datetimes are interpreted in the local timezone
+        return int(parsed.timestamp())
+
+    @staticmethod
+    def format_due_timestamp(due_at: int) -> str:
+        """Format epoch seconds as a local 'YYYY-MM-DD HH:MM' string."""
+        return datetime.fromtimestamp(due_at).strftime('%Y-%m-%d %H:%M')
+
+    @staticmethod
+    def due_date_from_timestamp(due_at: int) -> str:
+        """Return the local calendar date (YYYY-MM-DD) of epoch seconds."""
+        return datetime.fromtimestamp(due_at).strftime('%Y-%m-%d')
+
+    @staticmethod
+    def is_due_within_minutes(due_at: int, minutes: int, now: Optional[float] = None) -> bool:
+        """
+        Check if an exact due time falls between now and the given number of minutes from now.
+
+        Args:
+            due_at: Due time as epoch seconds
+            minutes: Size of the window in minutes
+            now: Current time as epoch seconds (default: the current time)
+
+        Returns:
+            True if now <= due_at <= now + minutes, False otherwise
+        """
+        if now is None:
+            now = datetime.now().timestamp()
+        return now <= due_at <= now + minutes * 60
+
+    @staticmethod
+    def is_task_due_within(task, minutes: int) -> bool:
+        """Check if a task is due within the given number of minutes, exactly when it has a due time."""
+        if task.due_at is not None:
+            return TimeSkill.is_due_within_minutes(task.due_at, minutes)
+        if task.due_date:
+            return TimeSkill.is_due_within_hours(task.due_date, minutes / 60)
+        return False
+
+    @staticmethod
+    def format_due(task) -> Optional[str]:
+        """Return the task's due date, including the time of day when it has one."""
+        if task.due_at is not None:
+            return TimeSkill.format_due_timestamp(task.due_at)
+        return task.due_date
+
     @staticmethod
     def format_date(date_str: str) -> Optional[str]:
         """
@@ -124,4 +400,127 @@ class TimeSkill:
                         continue
                 return None
             except:
-                return None
\ No newline at end of file
+                return None
+
+
+class RecurrenceHorizon:
+    """
+    Pre-materialized occurrences of recurring tasks over a rolling window of days.
+
+    Calendar-style views look occurrences up by date instead of expanding every series on
+    each render. Call refresh() after loading tasks, update_task()/remove_task() after
+    mutations, and roll() once a day to move the window forward.
+    """
+
+    def __init__(self, horizon_days: int = 90):
+        """
+        Initialize an empty horizon.
+
+        Args:
+            horizon_days: Number of days, starting today, to materialize (default: 90)
+        """
+        self.horizon_days = horizon_days
+        self.start: Optional[date] = None
+        self.end: Optional[date] = None
+        self._tasks: Dict[int, object] = {}
+        self._by_task: Dict[int, List[date]] = {}
+        self._by_date: Dict[date, List[int]] = {}
+        self._dates: List[date] = []  # Sorted keys of _by_date for range lookups
+
+    def refresh(self, tasks: Iterable, today: Optional[date] = None) -> None:
+        """Rebuild the horizon for all tasks, starting at today."""
+        self.start = today or date.today()
+        self.end = self.start + timedelta(days=self.horizon_days - 1)
+        self._tasks = {}
+        self._by_task = {}
+        self._by_date = {}
+        for task in tasks:
+            self._add(task, self.start, self.end)
+        self._dates = sorted(self._by_date)
+
+    def roll(self, today: Optional[date] = None) -> None:
+        """Move the window to start at today, materializing only the newly covered days."""
+        today = today or date.today()
+        if self.start is None or today <= self.start:
+            return
+        new_end = today + timedelta(days=self.horizon_days - 1)
+        if today > self.end:
+            self.refresh(list(self._tasks.values()), today)
+            return
+
+        # Drop days that fell out of the window
+        for day in self._dates[:bisect.bisect_left(self._dates, today)]:
+            for task_id in self._by_date.pop(day):
+                self._by_task[task_id].remove(day)
+        for task_id in [task_id for task_id, days in self._by_task.items() if not days]:
+            del self._by_task[task_id]
+
+        # Extend every series over the days that entered the window
+        tail_start = self.end + timedelta(days=1)
+        self.start, self.end = today, new_end
+        for task in self._tasks.values():
+            self._materialize(task, tail_start, new_end)
+        self._dates = sorted(self._by_date)
+
+    def update_task(self, task) -> None:
+        """Recompute the occurrences of a single task after it was created or changed."""
+        self.remove_task(task.id)
+        if self.start is not None:
+            self._add(task, self.start, self.end)
+            self._dates = sorted(self._by_date)
+
+    def update_tasks(self, tasks) -> None:
+        """Recompute the occurrences of many tasks, sorting the date list once."""
+        tasks = list(tasks)
+        for task in tasks:
+            self.remove_task(task.id)
+        if self.start is not None:
+            for task in tasks:
+                self._add(task, self.start, self.end)
+            self._dates = sorted(self._by_date)
+
+    def remove_task(self, task_id: int) -> None:
+        """Forget a task's occurrences."""
+        self._tasks.pop(task_id, None)
+        for day in self._by_task.pop(task_id, []):
+            task_ids = self._by_date[day]
+            task_ids.remove(task_id)
+            if not task_ids:
+                del self._by_date[day]
+                self._dates.remove(day)
+
+    def occurrences_on(self, day: str) -> List[int]:
+        """Return the IDs of tasks that occur on the given date (YYYY-MM-DD)."""
+        return list(self._by_date.get(_parse_date(day), []))
+
+    def occurrences_between(self, start_date: str, end_date: str) -> List[Tuple[str, int]]:
+        """Return (date, task ID) pairs within the inclusive range, ordered by date."""
+        start = _parse_date(start_date)
+        end = _parse_date(end_date)
+        result = []
+        low = bisect.bisect_left(self._dates, start)
+        high = bisect.bisect_right(self._dates, end)
+        for day in self._dates[low:high]:
+            day_str = day.isoformat()
+            result.extend((day_str, task_id) for task_id in self._by_date[day])
+        return result
+
+    def occurrences_for_task(self, task_id: int) -> List[str]:
+        """Return the materialized dates of one task."""
+        return [day.isoformat() for day in self._by_task.get(task_id, [])]
+
+    def _add(self, task, start: date, end: date) -> None:
+        if not task.is_recurring or task.completed or get_recurrence_rule(task.frequency) is None:
+            return
+        self._tasks[task.id] = task
+        self._materialize(task, start, end)
+
+    def _materialize(self, task, start: date, end: date) -> None:
+        try:
+            anchor = _parse_date(TimeSkill.series_anchor(task))
+            first = _parse_date(task.due_date[:10]) if task.due_date else anchor
+        except (AttributeError, TypeError, ValueError):
+            return
+        for day in get_recurrence_rule(task.frequency).between(anchor, max(start, first), end):
+            self._by_task.setdefault(task.id, []).append(day)
+            self._by_date.setdefault(day, []).append(task.id)
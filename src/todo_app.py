@@ -3,16 +3,25 @@
 Todo Console Application
 A simple in-memory todo application with a professional UI using Rich library.
 This is a legacy entry point. Use main.py for the new architecture.
+
+When called with arguments (e.g. 'todo-app list --format ndjson') it runs the
+non-interactive scripting CLI instead of the interactive menu.
 """
 
-from manager import ApplicationManager
+import sys
 
 
 def main():
     """Main entry point for the application."""
+    if len(sys.argv) > 1:
+        # Scripting path: imported lazily so it never loads Rich or the interactive UI
+        from cli.scripting import main as run_script
+        sys.exit(run_script(sys.argv[1:]))
+
+    from manager import ApplicationManager
     app_manager = ApplicationManager()
     app_manager.start()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
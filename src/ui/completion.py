@@ -0,0 +1,61 @@
+"""
+Completion
+Tab completion for the interactive prompts, using readline when it is available.
+
+Rich prompts read input with input(), so a readline completer set while a prompt is open
+completes what the user typed; pressing Tab twice lists the candidates. Without readline
+(e.g. Windows without pyreadline) prompts work as before, just without completion.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+try:
+    import readline
+except ImportError:
+    readline = None
+
+
+_tab_bound = False
+
+
+def _bind_tab() -> None:
+    """Bind Tab to completion once; macOS ships libedit, which has its own syntax."""
+    global _tab_bound
+    if _tab_bound:
+        return
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    _tab_bound = True
+
+
+@contextmanager
+def completing(complete: Optional[Callable[[str], List[str]]]):
+    """
+    Complete the whole input line with complete(line) while the block runs.
+
+    Args:
+        complete: Returns the completions of the text typed so far; None disables completion
+    """
+    if readline is None or complete is None:
+        yield
+        return
+
+    _bind_tab()
+    previous_completer, previous_delims = readline.get_completer(), readline.get_completer_delims()
+    matches: List[str] = []
+
+    def completer(text: str, state: int) -> Optional[str]:
+        if state == 0:
+            matches[:] = complete(readline.get_line_buffer())
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(completer)
+    readline.set_completer_delims("")  # Titles contain spaces; complete the line as a whole
+    try:
+        yield
+    finally:
+        readline.set_completer(previous_completer)
+        readline.set_completer_delims(previous_delims)
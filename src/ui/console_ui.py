@@ -3,20 +3,30 @@ Console UI
 Handles the Rich-based console user interface for the todo application.
 """
 
-from typing import List
+from typing import Callable, List
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
-from rich import print
 from models.task import Task
+from services.time_engine import TimeSkill
+from ui.pagination import TaskPager, DEFAULT_PAGE_SIZE
+from ui.completion import completing
 
 
 class ConsoleUI:
     """Class for handling console user interface using Rich."""
     
-    def __init__(self):
+    def __init__(self, complete: Callable[[str], List[str]] = None):
+        """
+        Initialize the console UI.
+
+        Args:
+            complete: Completes typed text to task titles and tags (e.g. TaskSubagent.complete);
+                used for Tab completion of the title prompt
+        """
         self.console = Console()
+        self.complete = complete
     
     def display_welcome(self):
         """Display the welcome message."""
@@ -35,10 +45,12 @@ class ConsoleUI:
         self.console.print("6. Help")
         self.console.print("7. Search/Filter Tasks")
         self.console.print("8. Upcoming Deadlines")
-        self.console.print("9. Exit")
+        self.console.print("9. Live Dashboard")
+        self.console.print("10. Exit")
     
-    def display_tasks(self, tasks: List[Task]):
-        """Display all tasks in a formatted way using Rich."""
+    def display_tasks(self, tasks: List[Task], page: int = 1, page_size: int = DEFAULT_PAGE_SIZE,
+                      ordered: bool = False, preserve_order: bool = False):
+        """Display one page of tasks in a formatted way using Rich."""
         if not tasks:
             self.console.print("\n[bold yellow]No tasks found. Add some tasks to get started![/]\n")
             return
@@ -50,22 +62,29 @@ class ConsoleUI:
         table.add_column("Description", width=30)
         table.add_column("Priority", width=10)
         table.add_column("Tags", width=15)
-        table.add_column("Due Date", width=12)
+        table.add_column("Due Date", width=16)
+
+        # Only the visible page is formatted
+        pager = TaskPager(tasks, page_size, ordered, preserve_order)
+        pager.jump(page)
+        if pager.page_count > 1:
+            table.caption = f"Page {pager.page} of {pager.page_count} ({pager.total} tasks)"
+
+        from datetime import datetime
+        today = datetime.now().date()
 
-        for task in sorted(tasks, key=lambda t: t.id):
+        for task in pager.current_items():
             status = f"{task.status_symbol} [{'green' if task.completed else 'red'}]{task.status_text}[/{'green' if task.completed else 'red'}]"
             title = task.title
             description = task.description
             priority = self._format_priority(task.priority)
             tags = ", ".join(task.tags) if task.tags else "None"
-            due_date = task.due_date if task.due_date else "None"
+            due_date = TimeSkill.format_due(task) or "None"
 
             # Check if task is overdue or due today
             if task.due_date and not task.completed:
                 try:
-                    from datetime import datetime
                     due_date_obj = datetime.strptime(task.due_date, '%Y-%m-%d')
-                    today = datetime.now().date()
                     if due_date_obj.date() < today:
                         # Overdue task - highlight in bold yellow
                         title = f"[bold yellow]{title}[/bold yellow]"
@@ -112,11 +131,12 @@ class ConsoleUI:
     
     def get_user_choice(self) -> str:
         """Get the user's menu choice."""
-        return Prompt.ask("\n[bold cyan]Enter your choice (1-9)[/]", choices=["1", "2", "3", "4", "5", "6", "7", "8", "9"])
+        return Prompt.ask("\n[bold cyan]Enter your choice (1-10)[/]", choices=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"])
     
     def get_task_details(self) -> tuple[str, str, str, List[str], bool, str, str]:
         """Get task details from user input."""
-        title = Prompt.ask("[bold cyan]Enter task title[/] (max 100 chars)")
+        with completing(self.complete):
+            title = Prompt.ask("[bold cyan]Enter task title[/] (max 100 chars)")
         description = Prompt.ask("[bold cyan]Enter task description[/] (max 500 chars, optional)", default="")
         priority = Prompt.ask("[bold cyan]Enter priority[/] (high/medium/low, default: medium)", default="medium")
         tags_input = Prompt.ask("[bold cyan]Enter tags[/] (comma-separated, e.g., work,home, optional)", default="")
@@ -134,7 +154,7 @@ class ConsoleUI:
         if is_recurring:
             frequency = Prompt.ask("[bold cyan]Enter frequency[/] (daily/weekly/monthly)", choices=["daily", "weekly", "monthly"])
 
-        due_date = Prompt.ask("[bold cyan]Enter due date[/] (YYYY-MM-DD, optional)", default="")
+        due_date = Prompt.ask("[bold cyan]Enter due date[/] (YYYY-MM-DD or YYYY-MM-DD HH:MM, optional)", default="")
         if due_date == "":
             due_date = None
 
@@ -171,7 +191,7 @@ class ConsoleUI:
             if new_frequency == "---KEEP_CURRENT---":
                 new_frequency = current_frequency
 
-        due_date_input = Prompt.ask(f"[bold cyan]Enter due date[/] (YYYY-MM-DD, default: {current_due_date or 'None'})", default="---KEEP_CURRENT---")
+        due_date_input = Prompt.ask(f"[bold cyan]Enter due date[/] (YYYY-MM-DD or YYYY-MM-DD HH:MM, default: {current_due_date or 'None'})", default="---KEEP_CURRENT---")
         new_due_date = current_due_date
         if due_date_input != "---KEEP_CURRENT---":
             new_due_date = due_date_input if due_date_input else None
@@ -213,9 +233,10 @@ class ConsoleUI:
   4. Delete Task      - Delete a task by its ID
   5. Toggle Status    - Toggle task completion status by ID
   6. Help             - Show this help message
-  7. Search/Filter    - Search tasks or sort by priority/date
+  7. Search/Filter    - Search tasks, rank them by relevance or sort by priority/date
   8. Upcoming Deadlines - View tasks with due dates within the next 24 hours
-  9. Exit             - Exit the application
+  9. Live Dashboard   - Watch task counts and recent changes update live (Ctrl+C to return)
+  10. Exit            - Exit the application
 
 [i]All tasks are stored in memory during this session.[/]
         """
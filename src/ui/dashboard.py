@@ -0,0 +1,174 @@
+"""
+Dashboard
+Live-updating task dashboard built on rich.live that redraws only when the store changes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
+
+from rich.console import Group
+from rich.live import Live
+from rich.table import Table
+
+from services.task_service import TaskService
+from services.task_subagent import TaskSubagent
+from ui.display_subagent import DisplaySubagent
+
+
+class TaskDashboard:
+    """
+    Live view of summary counters and the most recently changed tasks.
+
+    The dashboard subscribes to TaskService events instead of rescanning the store: counters are
+    adjusted per changed task and rows come from the DisplaySubagent row cache, so only changed
+    rows are formatted. Frames are drawn only when something changed, at most max_fps per second.
+    """
+
+    def __init__(self, task_service: TaskService, task_subagent: TaskSubagent,
+                 display_subagent: DisplaySubagent, max_fps: float = 4, visible_rows: int = 20,
+                 storage_poll_interval: float = 1.0):
+        """
+        Initialize the dashboard.
+
+        Args:
+            task_service: Service whose changes are shown
+            task_subagent: Subagent used to pick up saves made by other processes
+            display_subagent: Display subagent providing the console and cached rows
+            max_fps: Maximum number of redraws per second (default: 4)
+            visible_rows: Number of recently changed tasks to show (default: 20)
+            storage_poll_interval: Seconds between checks of the storage file (default: 1)
+        """
+        self.task_service = task_service
+        self.task_subagent = task_subagent
+        self.display_subagent = display_subagent
+        self.max_fps = max_fps
+        self.visible_rows = visible_rows
+        self.storage_poll_interval = storage_poll_interval
+
+        self._lock = threading.Lock()
+        self._subscription = None
+        self._dirty: Set[int] = set()
+        self._needs_redraw = True
+        self._recent: "OrderedDict[int, None]" = OrderedDict()  # Most recently changed last
+        self._state: Dict[int, Tuple[bool, bool]] = {}  # Task ID -> (completed, overdue)
+        self._counts = {'total': 0, 'completed': 0, 'pending': 0, 'overdue': 0}
+        self._today = datetime.now().date().isoformat()
+        self.frames = 0
+
+    def _classify(self, task) -> Tuple[bool, bool]:
+        """Return (completed, overdue) for a task as of today."""
+        overdue = (not task.completed and bool(task.due_date) and len(task.due_date) == 10
+                   and task.due_date < self._today)
+        return task.completed, overdue
+
+    def _apply(self, task_id: int) -> None:
+        """Move one task's contribution to the counters from its old state to its new one."""
+        old = self._state.pop(task_id, None)
+        if old is not None:
+            self._counts['total'] -= 1
+            self._counts['completed' if old[0] else 'pending'] -= 1
+            self._counts['overdue'] -= old[1]
+
+        task = self.task_service.get_task(task_id)
+        if task is None:
+            self._recent.pop(task_id, None)
+            return
+        new = self._classify(task)
+        self._state[task_id] = new
+        self._counts['total'] += 1
+        self._counts['completed' if new[0] else 'pending'] += 1
+        self._counts['overdue'] += new[1]
+
+        self._recent[task_id] = None
+        self._recent.move_to_end(task_id)
+        while len(self._recent) > self.visible_rows:
+            self._recent.popitem(last=False)
+
+    def _on_event(self, event) -> None:
+        """TaskService event subscriber: remember which task changed until the next frame."""
+        with self._lock:
+            self._dirty.add(event.task_id)
+
+    def _rebuild(self) -> None:
+        """Recompute everything, used on start and when the date changes."""
+        self._state.clear()
+        self._recent.clear()
+        self._counts = {'total': 0, 'completed': 0, 'pending': 0, 'overdue': 0}
+        for task in self.task_service.get_all_tasks():
+            self._apply(task.id)
+
+    def _render(self) -> Group:
+        """Build the renderable from the counters and cached rows."""
+        summary = Table.grid(padding=(0, 3))
+        summary.add_row(
+            f"[bold]Total:[/] {self._counts['total']}",
+            f"[bold green]Completed:[/] {self._counts['completed']}",
+            f"[bold red]Pending:[/] {self._counts['pending']}",
+            f"[bold yellow]Overdue:[/] {self._counts['overdue']}",
+            f"[dim]Updated {datetime.now().strftime('%H:%M:%S')} - press Ctrl+C to return[/]",
+        )
+
+        table = self.display_subagent.new_task_table("Recently Changed Tasks")
+        for task_id in reversed(self._recent):
+            task = self.task_service.get_task(task_id)
+            if task is not None:
+                table.add_row(*self.display_subagent.format_row(task, self._today))
+        return Group(summary, table)
+
+    def tick(self) -> Optional[Group]:
+        """
+        Process pending changes and return a new frame, or None if nothing changed.
+
+        Only the tasks reported since the previous tick are looked at.
+        """
+        today = datetime.now().date().isoformat()
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+
+        if today != self._today:
+            self._today = today
+            self._rebuild()
+        elif dirty:
+            for task_id in sorted(dirty):
+                self._apply(task_id)
+        elif not self._needs_redraw:
+            return None
+
+        self._needs_redraw = False
+        self.frames += 1
+        return self._render()
+
+    def run(self) -> None:
+        """Show the dashboard until the user presses Ctrl+C."""
+        self._rebuild()
+        self._needs_redraw = False
+        self._subscription = self.task_service.events.subscribe(self._on_event)
+        frame_interval = 1.0 / self.max_fps
+        last_mtime = self.task_subagent.storage_skill.last_modified()
+        last_poll = time.monotonic()
+
+        try:
+            with Live(self._render(), console=self.display_subagent.console, auto_refresh=False) as live:
+                while True:
+                    frame_start = time.monotonic()
+
+                    # Pick up saves from other processes, e.g. the reminder service
+                    if frame_start - last_poll >= self.storage_poll_interval:
+                        last_poll = frame_start
+                        mtime = self.task_subagent.storage_skill.last_modified()
+                        if mtime != last_mtime:
+                            last_mtime = mtime
+                            self.task_subagent.reload_tasks_from_storage()
+
+                    frame = self.tick()
+                    if frame is not None:
+                        live.update(frame, refresh=True)
+
+                    time.sleep(max(0.0, frame_interval - (time.monotonic() - frame_start)))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.task_service.events.unsubscribe(self._subscription)
@@ -3,81 +3,208 @@ Display Subagent
 Handles the Rich-based console user interface for the todo application with priority and tags support.
 """
 
+from collections import OrderedDict
 from datetime import datetime
-from typing import List
+from typing import Callable, List, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
-from rich import print
 from models.task import Task
+from services.time_engine import TimeSkill
+from ui.pagination import TaskPager, DEFAULT_PAGE_SIZE
+from ui.completion import completing
+
+
+def _is_iso_date(value: str) -> bool:
+    """Return True if value looks like a YYYY-MM-DD date."""
+    return len(value) == 10 and value[4] == '-' and value[7] == '-' and value[:4].isdigit()
+
+
+class RowCache:
+    """
+    Least-recently-used cache of formatted table rows.
+
+    Rows are keyed by task ID and remember the task version and the date they were formatted
+    for, so a changed task or a new day (overdue highlighting) makes the entry stale.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._rows: "OrderedDict[int, Tuple[int, str, Tuple[str, ...]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, task: Task, today: str) -> Optional[Tuple[str, ...]]:
+        """Return the cached row for the task if it is still current."""
+        entry = self._rows.get(task.id)
+        if entry is None or entry[0] != task.version or entry[1] != today:
+            self.misses += 1
+            return None
+        self._rows.move_to_end(task.id)
+        self.hits += 1
+        return entry[2]
+
+    def put(self, task: Task, today: str, row: Tuple[str, ...]) -> None:
+        """Store a formatted row, evicting the least recently used one when full."""
+        self._rows[task.id] = (task.version, today, row)
+        self._rows.move_to_end(task.id)
+        if len(self._rows) > self.max_size:
+            self._rows.popitem(last=False)
+
+    def invalidate(self, task_id: Optional[int] = None) -> None:
+        """Drop the row of one task, or every row when no ID is given."""
+        if task_id is None:
+            self._rows.clear()
+        else:
+            self._rows.pop(task_id, None)
 
 
 class DisplaySubagent:
     """Subagent for handling display operations using Rich."""
 
-    def __init__(self):
+    def __init__(self, complete: Callable[[str], List[str]] = None):
+        """
+        Initialize the display subagent.
+
+        Args:
+            complete: Completes typed text to task titles and tags (e.g. TaskSubagent.complete);
+                used for Tab completion of the search prompt
+        """
         self.console = Console()
+        self.row_cache = RowCache()
+        self.complete = complete
+
+    def display_tasks(self, tasks: List[Task], page: int = 1, page_size: int = DEFAULT_PAGE_SIZE,
+                      ordered: bool = False, preserve_order: bool = False):
+        """
+        Display one page of tasks in a formatted way using Rich with priority and tags columns.
+
+        Only the rows on the requested page are formatted, so the cost does not grow with the
+        number of tasks.
+
+        Args:
+            tasks: Tasks to display
+            page: Page number to show (default: 1)
+            page_size: Number of tasks per page
+            ordered: True if tasks are already in ID order, which skips sorting
+            preserve_order: True to show tasks in the order given instead of by ID
+        """
+        if not tasks:
+            self.console.print("\n[bold yellow]No tasks found. Add some tasks to get started![/]\n")
+            return
+
+        pager = TaskPager(tasks, page_size, ordered, preserve_order)
+        pager.jump(page)
+        self._render_page(pager)
+
+    def browse_tasks(self, tasks: List[Task], page_size: int = DEFAULT_PAGE_SIZE, ordered: bool = False,
+                     preserve_order: bool = False):
+        """
+        Display tasks page by page with next/previous/jump navigation.
 
-    def display_tasks(self, tasks: List[Task]):
-        """Display all tasks in a formatted way using Rich with priority and tags columns."""
+        Args:
+            tasks: Tasks to browse
+            page_size: Number of tasks per page
+            ordered: True if tasks are already in ID order, which skips sorting
+            preserve_order: True to show tasks in the order given instead of by ID
+        """
         if not tasks:
             self.console.print("\n[bold yellow]No tasks found. Add some tasks to get started![/]\n")
             return
 
-        table = Table(title="Your Todo List", show_header=True, header_style="bold magenta")
+        pager = TaskPager(tasks, page_size, ordered, preserve_order)
+        while True:
+            self._render_page(pager)
+            if pager.page_count == 1:
+                return
+
+            action = Prompt.ask("[bold cyan](n)ext, (p)revious, page number, or (q)uit[/]", default="q").strip().lower()
+            if action in ('n', 'next'):
+                pager.next()
+            elif action in ('p', 'prev', 'previous'):
+                pager.prev()
+            elif action.isdigit():
+                pager.jump(int(action))
+            elif action in ('q', 'quit', ''):
+                return
+            else:
+                self.console.print("[bold red]✗ Invalid option. Please try again.[/]")
+
+    def _render_page(self, pager: TaskPager):
+        """Build and print the table for the pager's current page."""
+        table = self.new_task_table("Your Todo List")
+        if pager.page_count > 1:
+            table.caption = f"Page {pager.page} of {pager.page_count} ({pager.total} tasks)"
+
+        # ISO dates compare correctly as strings, so no per-row date parsing is needed
+        today = datetime.now().date().isoformat()
+
+        for task in pager.current_items():
+            table.add_row(*self.format_row(task, today))
+
+        self.console.print(table)
+
+    def new_task_table(self, title: str) -> Table:
+        """Create an empty task table with the standard columns."""
+        table = Table(title=title, show_header=True, header_style="bold magenta")
         table.add_column("ID", style="dim", width=5)
         table.add_column("Status", width=10)
         table.add_column("Title", width=25)
         table.add_column("Description", width=30)
         table.add_column("Priority", width=10)
         table.add_column("Tags", width=15)
-        table.add_column("Due Date", width=12)
+        table.add_column("Due Date", width=16)
+        return table
 
-        for task in sorted(tasks, key=lambda t: t.id):
-            status = f"{task.status_symbol} [{'green' if task.completed else 'red'}]{task.status_text}[/{'green' if task.completed else 'red'}]"
-            title = task.title
-            description = task.description
-            priority = self._format_priority(task.priority)
-            tags = ", ".join(task.tags) if task.tags else "None"
-            due_date = task.due_date if task.due_date else "None"
-
-            # Check if task is overdue or due today
-            if task.due_date and not task.completed:
-                try:
-                    due_date_obj = datetime.strptime(task.due_date, '%Y-%m-%d')
-                    today = datetime.now().date()
-                    if due_date_obj.date() < today:
-                        # Overdue task - highlight in bold yellow
-                        title = f"[bold yellow]{title}[/bold yellow]"
-                        due_date = f"[bold yellow]{due_date}[/bold yellow]"
-                    elif due_date_obj.date() == today:
-                        # Due today - highlight in bold yellow
-                        title = f"[bold yellow]{title}[/bold yellow]"
-                        due_date = f"[bold yellow]{due_date}[/bold yellow]"
-                except ValueError:
-                    # Invalid date format
-                    pass
+    def format_row(self, task: Task, today: str) -> Tuple[str, ...]:
+        """Return the formatted table cells of a task, reusing the cached row when it is current."""
+        row = self.row_cache.get(task, today)
+        if row is None:
+            row = self._format_row(task, today)
+            self.row_cache.put(task, today, row)
+        return row
 
-            # Truncate description if too long
-            if len(description) > 30:
-                description = description[:27] + "..."
+    def invalidate_rows(self, task_id: Optional[int] = None):
+        """Forget the cached row of one task, or all rows when no ID is given."""
+        self.row_cache.invalidate(task_id)
 
-            # Truncate tags if too long
-            if len(tags) > 15:
-                tags = tags[:12] + "..."
+    def _format_row(self, task: Task, today: str) -> Tuple[str, ...]:
+        """Format the table cells of one task."""
+        status = f"{task.status_symbol} [{'green' if task.completed else 'red'}]{task.status_text}[/{'green' if task.completed else 'red'}]"
+        title = task.title
+        description = task.description
+        priority = self._format_priority(task.priority)
+        tags = ", ".join(task.tags) if task.tags else "None"
+        due_date = TimeSkill.format_due(task) or "None"
 
-            table.add_row(
-                str(task.id),
-                status,
-                title,
-                description,
-                priority,
-                tags,
-                due_date
-            )
+        # Check if task is overdue or due today
+        if task.due_date and not task.completed and _is_iso_date(task.due_date):
+            if task.due_date <= today:
+                # Overdue or due today - highlight in bold yellow
+                title = f"[bold yellow]{title}[/bold yellow]"
+                due_date = f"[bold yellow]{due_date}[/bold yellow]"
 
-        self.console.print(table)
+        # Truncate description if too long
+        if len(description) > 30:
+            description = description[:27] + "..."
+
+        # Truncate tags if too long
+        if len(tags) > 15:
+            tags = tags[:12] + "..."
+
+        return (
+            str(task.id),
+            status,
+            title,
+            description,
+            priority,
+            tags,
+            due_date
+        )
 
     def display_upcoming_deadlines(self, tasks: List[Task]):
         """Display tasks with upcoming deadlines."""
@@ -89,12 +216,12 @@ class DisplaySubagent:
         table.add_column("ID", style="dim", width=5)
         table.add_column("Title", width=30)
         table.add_column("Description", width=35)
-        table.add_column("Due Date", width=12)
+        table.add_column("Due Date", width=16)
 
         for task in sorted(tasks, key=lambda t: t.id):
             title = task.title
             description = task.description
-            due_date = task.due_date if task.due_date else "None"
+            due_date = TimeSkill.format_due(task) or "None"
 
             # Truncate description if too long
             if len(description) > 35:
@@ -127,15 +254,17 @@ class DisplaySubagent:
         self.console.print("1. Search Tasks")
         self.console.print("2. Sort by Priority")
         self.console.print("3. Sort by Date")
-        self.console.print("4. Back to Main Menu")
+        self.console.print("4. Search by Relevance")
+        self.console.print("5. Back to Main Menu")
 
     def get_search_filter_choice(self) -> str:
         """Get the user's search/filter choice."""
-        return Prompt.ask("\n[bold cyan]Enter your choice (1-4)[/]", choices=["1", "2", "3", "4"])
+        return Prompt.ask("\n[bold cyan]Enter your choice (1-5)[/]", choices=["1", "2", "3", "4", "5"])
 
     def get_search_keyword(self) -> str:
-        """Get the search keyword from user input."""
-        return Prompt.ask("[bold cyan]Enter search keyword[/]")
+        """Get the search keyword from user input; Tab completes titles and tags."""
+        with completing(self.complete):
+            return Prompt.ask("[bold cyan]Enter search keyword[/]")
 
     def get_sort_order(self) -> bool:
         """Get the sort order from user input (True for descending, False for ascending)."""
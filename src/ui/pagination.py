@@ -0,0 +1,69 @@
+"""
+Pagination
+Splits task lists into pages so the UI only formats the rows that are visible.
+"""
+
+from typing import List, Sequence
+from models.task import Task
+
+
+DEFAULT_PAGE_SIZE = 20
+
+
+class TaskPager:
+    """Page-by-page view over a list of tasks in ID order, or in the order given."""
+
+    def __init__(self, tasks: Sequence[Task], page_size: int = DEFAULT_PAGE_SIZE, ordered: bool = False,
+                 preserve_order: bool = False):
+        """
+        Initialize the pager.
+
+        Args:
+            tasks: Tasks to page through
+            page_size: Number of tasks per page (default: 20)
+            ordered: True if tasks are already in ID order, as returned by TaskService.get_all_tasks()
+            preserve_order: True to page through tasks in the order given (e.g. by relevance)
+                instead of by ID
+        """
+        self.tasks = tasks
+        self.page_size = max(1, page_size)
+        self.page = 1
+        self._ordered = ordered or preserve_order
+
+    def _ensure_ordered(self) -> None:
+        """Sort by ID once, and only if the list is not already in ID order."""
+        if self._ordered:
+            return
+        tasks = self.tasks
+        if any(tasks[index].id > tasks[index + 1].id for index in range(len(tasks) - 1)):
+            self.tasks = sorted(tasks, key=lambda t: t.id)
+        self._ordered = True
+
+    @property
+    def total(self) -> int:
+        """Return the number of tasks."""
+        return len(self.tasks)
+
+    @property
+    def page_count(self) -> int:
+        """Return the number of pages (at least one)."""
+        return max(1, -(-len(self.tasks) // self.page_size))
+
+    def jump(self, page: int) -> int:
+        """Go to a page, clamped to the valid range, and return it."""
+        self.page = min(max(1, page), self.page_count)
+        return self.page
+
+    def next(self) -> int:
+        """Go to the next page if there is one and return the current page."""
+        return self.jump(self.page + 1)
+
+    def prev(self) -> int:
+        """Go to the previous page if there is one and return the current page."""
+        return self.jump(self.page - 1)
+
+    def current_items(self) -> List[Task]:
+        """Return the tasks on the current page."""
+        self._ensure_ordered()
+        start = (self.page - 1) * self.page_size
+        return list(self.tasks[start:start + self.page_size])